@@ -0,0 +1 @@
+# API benchmark suite (run with `python -m benchmarks.run`)
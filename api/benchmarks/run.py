@@ -0,0 +1,231 @@
+"""
+In-process API benchmarks for the auth and user endpoints.
+
+Creates a throwaway test database (the configured PostgreSQL, prefixed ``test_``), seeds
+it at each dataset size, drives every endpoint through DRF's ``APIClient`` and reports
+throughput and p50/p95/p99 latency. Results are compared with ``benchmarks/baseline.json``
+and the run fails when an endpoint regresses beyond ``--threshold``.
+
+Usage::
+
+    python -m benchmarks.run --sizes 1000 10000 100000
+    python -m benchmarks.run --update-baseline
+    python -m benchmarks.run --sizes 10000 1000000 10000000 --only users_search users_filter
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# Every scenario comes from one client; token buckets would turn the run into 429s
+os.environ.setdefault("THROTTLING_ENABLED", "False")
+django.setup()
+
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+from src.shared.pagination import KeysetPagination  # noqa: E402
+from src.users.models import Profile, User  # noqa: E402
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+PASSWORD = "Bench-Pass-2024!"  # noqa: S105
+ALT_PASSWORD = "Bench-Pass-2025!"  # noqa: S105
+OWNER_EMAIL = "bench-owner@example.com"
+ALT_OWNER_EMAIL = "bench-owner-alt@example.com"
+
+Request = Callable[[int], Any]
+
+
+# ============================== Dataset ==============================
+def seed(size: int) -> None:
+    """Bring the users table to exactly ``size`` rows (plus profiles), hashing only once."""
+    existing = User.objects.count()
+    if existing > size:
+        User.objects.filter(id__in=User.objects.order_by("-id").values("id")[: existing - size]).delete()
+        return
+
+    password_hash = make_password(PASSWORD)
+    for start in range(existing, size, 10_000):
+        batch = range(start, min(start + 10_000, size))
+        users = User.objects.bulk_create(
+            [User(email=f"bench{index}@example.com", password=password_hash) for index in batch],
+        )
+        Profile.objects.bulk_create([Profile(user=user, first_name="Bench", last_name=str(user.id)) for user in users])
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+# ============================== Scenarios ==============================
+def _toggle() -> Callable[[], bool]:
+    """Alternate True/False across calls, so mutating scenarios always undo themselves."""
+    state = {"calls": 0}
+
+    def flip() -> bool:
+        state["calls"] += 1
+        return state["calls"] % 2 == 1
+
+    return flip
+
+
+def build_scenarios(client: APIClient, user: User) -> dict[str, Request]:
+    tokens = client.post(reverse("token_obtain_pair"), {"email": user.email, "password": PASSWORD}).json()
+    authed = APIClient()
+    authed.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+    # Cursor pointing at the oldest rows: a deep page must cost the same as the first one
+    oldest = User.objects.order_by("created_at", "id").first()
+    assert oldest is not None  # noqa: S101
+    deep_cursor = KeysetPagination().encode_cursor({"created_at": oldest.created_at, "id": oldest.id})
+
+    # With JWT rotation each refresh hands out a new refresh token and burns the old one
+    refresh = {"token": tokens["refresh"]}
+
+    def token_refresh(_: int) -> Any:  # noqa: ANN401
+        response = client.post(reverse("token_refresh"), {"refresh": refresh["token"]})
+        refresh["token"] = response.json().get("refresh", refresh["token"])
+        return response
+
+    # Credential changes revoke the user's tokens when rotation is on; these scenarios
+    # measure the write path, JWT authentication is covered by the read scenarios
+    writer = APIClient()
+    writer.force_authenticate(user)
+    password_flip, email_flip = _toggle(), _toggle()
+
+    def change_password(_: int) -> Any:  # noqa: ANN401
+        old, new = (PASSWORD, ALT_PASSWORD) if password_flip() else (ALT_PASSWORD, PASSWORD)
+        return writer.post(
+            reverse("users-change-password", args=[user.id]),
+            {"old_password": old, "new_password": new, "new_password_retype": new},
+        )
+
+    def change_email(_: int) -> Any:  # noqa: ANN401
+        old, new = (OWNER_EMAIL, ALT_OWNER_EMAIL) if email_flip() else (ALT_OWNER_EMAIL, OWNER_EMAIL)
+        return writer.post(reverse("users-change-email", args=[user.id]), {"old_email": old, "new_email": new})
+
+    return {
+        "token_obtain": lambda _: client.post(
+            reverse("token_obtain_pair"),
+            {"email": user.email, "password": PASSWORD},
+        ),
+        "token_refresh": token_refresh,
+        "users_list": lambda _: authed.get(reverse("users-list")),
+        "users_list_deep": lambda _: authed.get(reverse("users-list"), {"cursor": deep_cursor}),
+        "users_search": lambda _: authed.get(reverse("users-list"), {"search": "bench42"}),
+        "users_filter": lambda _: authed.get(
+            reverse("users-list"), {"is_staff": "false", "created_after": "2000-01-01"}
+        ),
+        "users_retrieve": lambda _: authed.get(reverse("users-detail", args=[user.id])),
+        "users_create": lambda iteration: client.post(
+            reverse("users-list"),
+            {"email": f"bench-new-{time.time_ns()}-{iteration}@example.com", "password": PASSWORD},
+        ),
+        "change_password": change_password,
+        "change_email": change_email,
+    }
+
+
+def measure(request: Request, iterations: int, warmup: int) -> dict[str, float]:
+    for iteration in range(warmup):
+        request(iteration)
+
+    latencies: list[float] = []
+    failures = 0
+    started = time.perf_counter()
+    for iteration in range(iterations):
+        begin = time.perf_counter()
+        response = request(iteration)
+        latencies.append((time.perf_counter() - begin) * 1000)
+        failures += response.status_code >= 400
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "rps": round(iterations / elapsed, 1),
+        "p50_ms": round(quantiles[49], 3),
+        "p95_ms": round(quantiles[94], 3),
+        "p99_ms": round(quantiles[98], 3),
+        "errors": failures,
+    }
+
+
+# ============================== Baseline ==============================
+def compare(results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], threshold: float) -> list[str]:
+    regressions: list[str] = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            if current[metric] > previous[metric] * (1 + threshold):
+                regressions.append(f"{key} {metric}: {previous[metric]:.2f} -> {current[metric]:.2f}")
+        if current["rps"] < previous["rps"] * (1 - threshold):
+            regressions.append(f"{key} rps: {previous['rps']:.1f} -> {current['rps']:.1f}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--only", nargs="*", help="Run only these scenarios.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown ratio (0.2 = 20%%).")
+    parser.add_argument("--keepdb", action="store_true", help="Reuse the test database between runs.")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, keepdb=args.keepdb)
+
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        for size in sorted(args.sizes):
+            seed(size)
+            owner, _ = User.objects.get_or_create(email=OWNER_EMAIL, defaults={"password": make_password(PASSWORD)})
+            Profile.objects.get_or_create(user=owner)
+            scenarios = build_scenarios(APIClient(), owner)
+            for name, request in scenarios.items():
+                if args.only and name not in args.only:
+                    continue
+                key = f"{name}@{size}"
+                results[key] = measure(request, args.iterations, args.warmup)
+                print(f"{key:<32} {json.dumps(results[key])}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+
+    # A rejected request (401, 429, ...) is not the latency being measured
+    failed = [key for key, result in results.items() if result["errors"]]
+    for key in failed:
+        print(f"❌ {key}: {results[key]['errors']} of {args.iterations} requests failed")
+    if failed:
+        return 1
+
+    if args.update_baseline:
+        BASELINE_PATH.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"✅ Baseline written to {BASELINE_PATH}")
+        return 0
+
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"❌ Regression: {regression}")
+    if not baseline:
+        print("⚠️  No baseline stored yet; run with --update-baseline to create one.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,9 +8,17 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
 import os
+import time
 
 from django.core.asgi import get_asgi_application
 
+from src.shared.warmup import warmup
+
+boot_started = time.monotonic()
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# Under gunicorn --preload this runs once in the master, before the workers fork
+warmup(boot_started)
@@ -1,8 +1,15 @@
 import os
+import time
+from typing import Any
 
 from celery import Celery
+from celery.signals import task_prerun, worker_init, worker_process_init, worker_process_shutdown
 from django.conf import settings
 
+from src.shared.warmup import warmup
+
+boot_started = time.monotonic()
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 app = Celery("config")
@@ -10,3 +17,23 @@ app = Celery("config")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
 app.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
+
+
+@worker_init.connect
+def warm_up_worker(**kwargs: Any) -> None:  # noqa: ANN401
+    # Runs in the parent before the prefork pool starts; tasks never serve the schema
+    warmup(boot_started, steps=("urls", "serializers", "password_validators"), first_signal=task_prerun)
+
+
+def close_database_pools(**kwargs: Any) -> None:  # noqa: ANN401
+    from src.shared.postgresql_pool.base import close_pools
+
+    close_pools()
+
+
+@worker_process_init.connect
+def register_pool_shutdown(**kwargs: Any) -> None:  # noqa: ANN401
+    # Prefork children leave through os._exit, which skips the pool's atexit handler.
+    # Connected here so it runs after the shutdown receivers that still flush to the database.
+    if settings.DB_POOL_ENABLED:
+        worker_process_shutdown.connect(close_database_pools, weak=False)
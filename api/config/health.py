@@ -0,0 +1,118 @@
+"""
+Dependency checks behind the readiness endpoint.
+
+Checks run concurrently on a small, long-lived thread pool, each with its own timeout,
+and the composite result is cached in-process for ``HEALTHCHECK_CACHE_SECONDS``. Only
+one probe per worker evaluates the checks at a time; concurrent probes reuse its result,
+so a probe storm never turns into database or broker connection churn. Each check closes
+the database connections its pool thread opened: held between evaluations they would pin
+connections (and, with ``DB_POOL_ENABLED``, pool slots) that request threads need.
+"""
+
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+
+CheckResult = dict[str, Any]
+
+
+def check_database() -> None:
+    with connections["default"].cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+
+def check_cache() -> None:
+    cache = caches["default"]
+    key = f"healthcheck:{uuid.uuid4().hex}"
+    cache.set(key, "ok", timeout=5)
+    cache.delete(key)
+
+
+def check_broker() -> None:
+    from config.celery import app
+
+    with app.connection_for_write() as connection:
+        connection.ensure_connection(max_retries=1, timeout=settings.HEALTHCHECK_TIMEOUT)
+
+
+def check_workers() -> None:
+    from config.celery import app
+
+    if not app.control.ping(timeout=settings.HEALTHCHECK_TIMEOUT):
+        error = "No Celery worker replied to ping."
+        raise RuntimeError(error)
+
+
+CHECKS: dict[str, Callable[[], None]] = {
+    "database": check_database,
+    "cache": check_cache,
+    "broker": check_broker,
+    "workers": check_workers,
+}
+
+
+class ReadinessProbe:
+    def __init__(self, checks: dict[str, Callable[[], None]], timeout: float, ttl: float) -> None:
+        self.checks = checks
+        self.timeout = timeout
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max(len(checks), 1), thread_name_prefix="healthcheck")
+        self._lock = threading.Lock()
+        self._result: CheckResult | None = None
+        self._expires_at = 0.0
+
+    def _timed(self, check: Callable[[], None]) -> CheckResult:
+        started = time.perf_counter()
+        try:
+            check()
+        except Exception as exc:  # noqa: BLE001
+            status, error = "unavailable", f"{type(exc).__name__}: {exc}"
+        else:
+            status, error = "ok", None
+        finally:
+            # Database checks and the DatabaseCache both connect from this pool thread
+            connections.close_all()
+        result: CheckResult = {"status": status, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+        if error:
+            result["error"] = error
+        return result
+
+    def _evaluate(self) -> CheckResult:
+        deadline = time.monotonic() + self.timeout
+        futures = {name: self._executor.submit(self._timed, check) for name, check in self.checks.items()}
+
+        checks: dict[str, CheckResult] = {}
+        for name, future in futures.items():
+            try:
+                checks[name] = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                checks[name] = {"status": "timeout", "latency_ms": round(self.timeout * 1000, 2)}
+
+        is_healthy = all(check["status"] == "ok" for check in checks.values())
+        return {"status": "ok" if is_healthy else "error", "checks": checks}
+
+    def get(self) -> CheckResult:
+        """Return the cached composite result, re-evaluating at most once per TTL."""
+        if time.monotonic() < self._expires_at and self._result is not None:
+            return self._result
+
+        with self._lock:
+            if time.monotonic() >= self._expires_at or self._result is None:
+                self._result = self._evaluate()
+                self._expires_at = time.monotonic() + self.ttl
+            return self._result
+
+
+readiness = ReadinessProbe(
+    checks={name: CHECKS[name] for name in settings.HEALTHCHECK_CHECKS},
+    timeout=settings.HEALTHCHECK_TIMEOUT,
+    ttl=settings.HEALTHCHECK_CACHE_SECONDS,
+)
@@ -12,8 +12,11 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 import os
 import sys
+from datetime import timedelta
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -49,8 +52,11 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # apps
+    "src.audit",
     "src.identity",
+    "src.profiling",
     "src.users",
     # third-party
     "rest_framework",
@@ -59,8 +65,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "src.shared.middleware.MetricsMiddleware",
+    "src.profiling.middleware.ProfilingMiddleware",
+    "src.shared.middleware.ReplicaStickinessMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "src.shared.middleware.StaticFilesMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     # CSRF middleware is not needed for token-based APIs (e.g., JWT via React)
@@ -71,7 +80,11 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
-ROOT_URLCONF = "config.urls"
+# Deployment mode: "wsgi" (gunicorn sync workers) or "asgi" (native async views for the
+# user list/retrieve and token endpoints, served by an ASGI server such as uvicorn)
+API_SERVER_MODE = os.getenv("API_SERVER_MODE", "wsgi")
+
+ROOT_URLCONF = "config.urls_async" if API_SERVER_MODE == "asgi" else "config.urls"
 
 # Enable Silk for profiling and Django Extensions for dev utilities.
 if DEBUG == "False":
@@ -113,63 +126,167 @@ DATABASES = {
     },
 }
 
-# WARNING: NOT RECOMMENDED FOR PRODUCTION
-# Django cache config using database (PoC only - use Redis in production)
+# Connection reuse. With DB_POOL_ENABLED every process borrows connections from its own
+# psycopg pool (needs psycopg[pool], see src.shared.postgresql_pool) and returns them at the
+# end of each request or task; otherwise connections persist for DB_CONN_MAX_AGE seconds.
+# Either way a connection is checked before it is reused.
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "False") == "True"
+if DB_POOL_ENABLED:
+    DATABASES["default"] |= {
+        "ENGINE": "src.shared.postgresql_pool",
+        "CONN_MAX_AGE": 0,
+        "POOL": {
+            "MIN_SIZE": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+            "MAX_SIZE": int(os.getenv("DB_POOL_MAX_SIZE", "4")),
+            "TIMEOUT": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+            "MAX_IDLE": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+            "MAX_LIFETIME": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+            "CHECK": True,
+        },
+    }
+else:
+    DATABASES["default"] |= {
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+    }
+
+# Read replicas: comma-separated hosts sharing the primary's database and credentials.
+# Safe API and admin reads go to a healthy replica unless the user or client wrote in the
+# last REPLICA_STICKY_SECONDS (see src.shared.db_router). Requires CACHE_REDIS_URL.
+POSTGRES_REPLICA_HOSTS = [host.strip() for host in os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",") if host.strip()]
+# Replicas always use the plain backend: a pool would wait up to DB_POOL_TIMEOUT on a down
+# replica where connect_timeout gives up after 2s.
+for _index, _host in enumerate(POSTGRES_REPLICA_HOSTS, start=1):
+    DATABASES[f"replica_{_index}"] = {
+        **{key: value for key, value in DATABASES["default"].items() if key != "POOL"},
+        "ENGINE": "django.db.backends.postgresql",
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
+        "HOST": _host,
+        "OPTIONS": {**DATABASES["default"]["OPTIONS"], "connect_timeout": 2},
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["src.shared.db_router.ReplicaRouter"] if POSTGRES_REPLICA_HOSTS else []
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_CHECK_INTERVAL = float(os.getenv("REPLICA_CHECK_INTERVAL", "5"))
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+
+# Two-tier cache: a bounded per-process LRU (L1) in front of a shared cache (L2).
+# Writes publish invalidations so every gunicorn/Celery worker drops its stale L1 copy.
+# Set CACHE_REDIS_URL in production; without it L2 falls back to the PoC DatabaseCache.
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
-        "LOCATION": "django_cache_table",
-    }
+        "BACKEND": "src.shared.cache_backend.TieredCache",
+        "LOCATION": "cache-invalidation",
+        "OPTIONS": {
+            "L2": "shared",
+            "L1_MAX_ENTRIES": int(os.getenv("CACHE_L1_MAX_ENTRIES", "10000")),
+            "L1_TIMEOUT": int(os.getenv("CACHE_L1_TIMEOUT", "5")),
+            "INVALIDATION_BUS": "redis" if CACHE_REDIS_URL else "null",
+            "INVALIDATION_URL": CACHE_REDIS_URL,
+        },
+    },
+    "shared": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+        }
+        if CACHE_REDIS_URL
+        else {
+            # WARNING: NOT RECOMMENDED FOR PRODUCTION (PoC only - use Redis in production)
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache_table",
+        }
+    ),
 }
 
+# The stickiness lookup runs on every safe request; on the DatabaseCache it would be a
+# primary round trip each time, defeating the replicas
+if POSTGRES_REPLICA_HOSTS and not CACHE_REDIS_URL:
+    error = "POSTGRES_REPLICA_HOSTS requires CACHE_REDIS_URL for the shared cache."
+    raise ImproperlyConfigured(error)
+
 # ================================ CELERY CONFIGURATION ================================
 # Celery broker configuration
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
 
-# WARNING: DATABASE RESULT BACKEND - NOT RECOMMENDED FOR PRODUCTION
-# This configuration uses PostgreSQL to store Celery task results.
-#
-# PROBLEMS WITH DATABASE BACKEND:
-# - Performance bottleneck under high load
-# - Database locks and contention issues
-# - Not suitable for high-frequency tasks
-# - Requires manual cleanup of old results
-# - Increases database size and backup time
+# The audit trail of task executions lives in src.audit.TaskAuditLog, populated from Celery
+# signals by a buffered per-process writer that upserts in batches and is pruned by age
+# (see src.audit.tasks.prune_task_audit_logs). Fire-and-forget tasks declare
+# @shared_task(ignore_result=True) themselves; set CELERY_TASK_IGNORE_RESULT=True to make
+# that the default for every task.
 #
-# PRODUCTION RECOMMENDATIONS:
-# 1. Use Redis: CELERY_RESULT_BACKEND = "redis://redis:6379/1"
-# 2. Create custom Django models for audit trail:
-example = """
-class TaskAuditLog(models.Model):
-    task_id = models.CharField(max_length=255, unique=True)
-    task_name = models.CharField(max_length=255)
-    status = models.CharField(max_length=50)
-    result = models.JSONField()
-    created_at = models.DateTimeField(auto_now_add=True)
-    completed_at = models.DateTimeField(null=True)
-"""
-# 3. Use Celery signals to populate audit models
-# 4. Set CELERY_TASK_IGNORE_RESULT = True for fire-and-forget tasks
-#
-# This setup is ONLY for PoC/Development purposes!
+# WARNING: DATABASE RESULT BACKEND - NOT RECOMMENDED FOR PRODUCTION
+# Point CELERY_RESULT_BACKEND at Redis (database 1 of the redis service) in production.
+CELERY_TASK_IGNORE_RESULT = os.getenv("CELERY_TASK_IGNORE_RESULT", "False") == "True"
 CELERY_RESULT_BACKEND = "django-db"
 CELERY_CACHE_BACKEND = "django-cache"
 
 # Database result backend settings
 CELERY_RESULT_EXPIRES = int(os.getenv("CELERY_RESULT_EXPIRES", "86400"))  # 24 hours for PoC
 
+# Task audit trail settings
+TASK_AUDIT_BATCH_SIZE = int(os.getenv("TASK_AUDIT_BATCH_SIZE", "200"))
+TASK_AUDIT_FLUSH_INTERVAL = float(os.getenv("TASK_AUDIT_FLUSH_INTERVAL", "2"))
+TASK_AUDIT_RETENTION_DAYS = int(os.getenv("TASK_AUDIT_RETENTION_DAYS", "14"))
+
+# Periodic tasks, enqueued by the celery_beat service (docker/entrypoints/entrypoint.celery-beat.*.sh)
+CELERY_BEAT_SCHEDULE = {
+    "prune-task-audit-logs": {
+        "task": "src.audit.tasks.prune_task_audit_logs",
+        "schedule": timedelta(hours=1),
+    },
+}
+
 # Celery task configuration
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "America/Sao_Paulo"
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
-CELERY_RESULT_EXTENDED = True
+CELERY_RESULT_EXTENDED = False
 
 # RabbitMQ specific settings
 CELERY_BROKER_TRANSPORT_OPTIONS = {"visibility_timeout": 3600, "fanout_prefix": True, "fanout_patterns": True}
 
 
+# Request metrics (see src.shared.metrics); METRICS_DIR must be shared by all workers of a host
+METRICS_DIR = os.getenv("METRICS_DIR", "/tmp/api-metrics")  # noqa: S108
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+# Bearer token for /api/metrics/; the endpoint answers 404 until one is set
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+# On-demand request profiling (see src.profiling). Sample rates are "url-name=rate" pairs,
+# e.g. "token_obtain_pair=0.01,users-change-password=0.05"
+PROFILING_SAMPLE_RATES = {
+    name.strip(): float(rate)
+    for name, _, rate in (pair.partition("=") for pair in os.getenv("PROFILING_SAMPLE_RATES", "").split(",") if pair)
+}
+PROFILING_INTERVAL = float(os.getenv("PROFILING_INTERVAL", "0.005"))
+PROFILING_TOKEN_MAX_AGE = int(os.getenv("PROFILING_TOKEN_MAX_AGE", "3600"))
+PROFILING_DIR = os.getenv("PROFILING_DIR", os.path.join(BASE_DIR, "profiles"))
+PROFILING_MAX_CAPTURES = int(os.getenv("PROFILING_MAX_CAPTURES", "200"))
+PROFILING_RETENTION_HOURS = int(os.getenv("PROFILING_RETENTION_HOURS", "72"))
+
+# Health checks (see config.health); add "workers" to ping Celery workers as well
+HEALTHCHECK_CHECKS = [name.strip() for name in os.getenv("HEALTHCHECK_CHECKS", "database,cache,broker").split(",")]
+HEALTHCHECK_TIMEOUT = float(os.getenv("HEALTHCHECK_TIMEOUT", "2"))
+HEALTHCHECK_CACHE_SECONDS = float(os.getenv("HEALTHCHECK_CACHE_SECONDS", "5"))
+
+# Boot-time warmup before workers fork (see src.shared.warmup); the prod entrypoint runs
+# gunicorn with --preload so it happens once in the master
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "True") == "True"
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {"src.shared.warmup": {"handlers": ["console"], "level": "INFO"}},
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -209,6 +326,13 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 MEDIA_URL = "/mediafiles/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "mediafiles")
 
+# Avatar processing (see src.users.tasks.process_avatar)
+AVATAR_VARIANT_SIZES = tuple(int(size) for size in os.getenv("AVATAR_VARIANT_SIZES", "64,256,512").split(","))
+AVATAR_QUALITY = int(os.getenv("AVATAR_QUALITY", "82"))
+AVATAR_MAX_UPLOAD_BYTES = int(os.getenv("AVATAR_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+AVATAR_MAX_PIXELS = int(os.getenv("AVATAR_MAX_PIXELS", str(40_000_000)))
+AVATAR_ALLOWED_CONTENT_TYPES = ("image/jpeg", "image/png", "image/webp")
+
 # WhiteNoise compression and cache support
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
@@ -242,19 +366,64 @@ REST_FRAMEWORK = {
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "src.identity.authentication.CachedJWTAuthentication",
     ],
+    # Token buckets for the password-hashing endpoints (see src.shared.throttling)
+    "DEFAULT_THROTTLE_RATES": {
+        "token_ip": os.getenv("THROTTLE_TOKEN_IP_RATE", "30/min"),
+        "token_email": os.getenv("THROTTLE_TOKEN_EMAIL_RATE", "5/min"),
+        "signup_ip": os.getenv("THROTTLE_SIGNUP_IP_RATE", "10/hour"),
+        "signup_email": os.getenv("THROTTLE_SIGNUP_EMAIL_RATE", "3/hour"),
+    },
+    # Reverse proxies in front of the API; 0 keys on REMOTE_ADDR and ignores X-Forwarded-For
+    "NUM_PROXIES": int(os.getenv("THROTTLE_NUM_PROXIES", "0")),
 }
+THROTTLING_ENABLED = os.getenv("THROTTLING_ENABLED", "True") == "True"
 
-# Simple JWT settings
-from datetime import timedelta
+# Keyset pagination (see src.shared.pagination.KeysetPagination)
+PAGINATION_PAGE_SIZE = int(os.getenv("PAGINATION_PAGE_SIZE", "50"))
+PAGINATION_MAX_PAGE_SIZE = int(os.getenv("PAGINATION_MAX_PAGE_SIZE", "500"))
+
+# Admin changelists count from planner estimates above this many rows (see src.shared.paginator)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "100000"))
+
+# Bulk user creation (see UserManager.bulk_create_users)
+USERS_BULK_CREATE_MAX_ROWS = int(os.getenv("USERS_BULK_CREATE_MAX_ROWS", "5000"))
+USERS_BULK_HASH_WORKERS = int(os.getenv("USERS_BULK_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+# Bulk user import via COPY (see the import_users management command)
+USERS_IMPORT_CHUNK_SIZE = int(os.getenv("USERS_IMPORT_CHUNK_SIZE", "5000"))
+
+# Streaming user export (see src.users.utils.export)
+USERS_EXPORT_CHUNK_SIZE = int(os.getenv("USERS_EXPORT_CHUNK_SIZE", "2000"))
 
+# Bounded thread pool for password checks in async views (see src.identity.async_views)
+ASYNC_PASSWORD_HASH_WORKERS = int(os.getenv("ASYNC_PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+# Cached user resolution for JWT authentication (see src.identity.authentication)
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "300"))
+
+# Refresh-token rotation with a cache-backed revoked-JTI store (see src.identity.revocation).
+# Password and email changes then revoke every outstanding token of the user.
+JWT_ROTATION_ENABLED = os.getenv("JWT_ROTATION_ENABLED", "False") == "True"
+JWT_REVOKED_BLOOM_CAPACITY = int(os.getenv("JWT_REVOKED_BLOOM_CAPACITY", "1000000"))
+JWT_REVOKED_BLOOM_ERROR_RATE = float(os.getenv("JWT_REVOKED_BLOOM_ERROR_RATE", "0.001"))
+
+# last_login writes: "sync" (one UPDATE per login), "deferred" (buffered per process) or
+# "celery" (buffered, written by a task). See src.identity.last_login.
+LAST_LOGIN_MODE = os.getenv("LAST_LOGIN_MODE", "deferred")
+LAST_LOGIN_FLUSH_INTERVAL = float(os.getenv("LAST_LOGIN_FLUSH_INTERVAL", "10"))
+LAST_LOGIN_BATCH_SIZE = int(os.getenv("LAST_LOGIN_BATCH_SIZE", "1000"))
+
+# Simple JWT settings
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
-    "ROTATE_REFRESH_TOKENS": False,
+    "ROTATE_REFRESH_TOKENS": JWT_ROTATION_ENABLED,
+    # Rotated-out tokens are revoked in the cache, not in simplejwt's blacklist tables
     "BLACKLIST_AFTER_ROTATION": False,
-    "UPDATE_LAST_LOGIN": True,
+    # CustomTokenObtainPairSerializer sends user_logged_in, whose receiver records last_login
+    "UPDATE_LAST_LOGIN": False,
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
     "VERIFYING_KEY": None,
@@ -19,12 +19,11 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import (
-    SpectacularAPIView,
     SpectacularRedocView,
     SpectacularSwaggerView,
 )
 
-from config.views import healthcheck
+from config.views import CachedSpectacularAPIView, healthcheck, liveness, metrics
 
 # Constants for base URL paths
 DJANGO_URL = "django"
@@ -34,7 +33,7 @@ API_URL = "api"
 open_api_patterns = [
     path(
         "",
-        SpectacularAPIView.as_view(),
+        CachedSpectacularAPIView.as_view(),
         name="openapi-schema",
     ),  # OpenAPI JSON schema endpoint
     path(
@@ -50,12 +49,18 @@ open_api_patterns = [
 ]
 
 urlpatterns = [
+    # Request profiling captures (staff only, rendered inside the admin)
+    path(f"{DJANGO_URL}/admin/profiling/", include("src.profiling.urls")),
     # Django Admin interface (internal administrative access)
     path(f"{DJANGO_URL}/admin/", admin.site.urls),
     # API routes including OpenAPI schema and docs
     path(f"{API_URL}/schema/", include(open_api_patterns), name="api-schema"),
-    # Health check endpoint for uptime monitoring
+    # Health check endpoints: liveness (no I/O) and readiness (cached dependency checks)
     path(f"{API_URL}/health/", healthcheck, name="healthcheck"),
+    path(f"{API_URL}/health/live/", liveness, name="liveness"),
+    path(f"{API_URL}/health/ready/", healthcheck, name="readiness"),
+    # Prometheus-style request metrics, merged across workers
+    path(f"{API_URL}/metrics/", metrics, name="metrics"),
     # JWT Token endpoints
     path(f"{API_URL}/", include("src.identity.urls"), name="identity"),
     # Main API endpoints for user-related operations
@@ -0,0 +1,22 @@
+"""
+URL configuration for the ASGI deployment mode (``API_SERVER_MODE=asgi``).
+
+Routes the hot read and token endpoints to native async views and falls back to the
+regular ``config.urls`` for everything else. Patterns listed here win because Django
+resolves URLs in order.
+"""
+
+from django.urls import include, path
+
+from config.urls import API_URL
+from src.identity.async_views import token_obtain_pair
+from src.users.views.async_user_view import user_list, user_retrieve
+
+# The installed django-stubs only type path() for sync views, hence the ignores.
+# ``<int:pk>`` keeps the router's list-level actions (users/bulk/, users/export/) on DRF.
+urlpatterns = [
+    path(f"{API_URL}/token/", token_obtain_pair, name="token_obtain_pair"),  # type: ignore[call-overload]
+    path(f"{API_URL}/users/", user_list, name="users-list"),  # type: ignore[call-overload]
+    path(f"{API_URL}/users/<int:pk>/", user_retrieve, name="users-detail"),  # type: ignore[call-overload]
+    path("", include("config.urls")),
+]
@@ -1,25 +1,67 @@
-from django.db import connections
-from django.db.utils import OperationalError
-from django.http import HttpRequest, JsonResponse
+import hmac
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from config.health import readiness
+from src.shared.metrics import registry, render_pool_metrics, render_prometheus
+from src.shared.warmup import openapi_schema
+
+
+def liveness(request: HttpRequest) -> JsonResponse:
+    """
+    Reports that the process is up and serving requests. Performs no I/O.
+    """
+    return JsonResponse({"status": "ok"})
 
 
 def healthcheck(request: HttpRequest) -> JsonResponse:
     """
-    Returns the health status of the API server and its primary database connection.
+    Returns the readiness of the API server: database, cache and broker (plus any
+    checks listed in HEALTHCHECK_CHECKS), each with its latency. The composite result is
+    cached for HEALTHCHECK_CACHE_SECONDS, so probes cost almost nothing under load.
     """
-    checks: dict[str, str] = {}
+    result = readiness.get()
+    http_status = 200 if result["status"] == "ok" else 503
 
-    # Check if the default database is reachable
-    try:
-        connections["default"].cursor()
-        checks["database"] = "ok"
-    except OperationalError:
-        checks["database"] = "unavailable"
+    response = JsonResponse(result, status=http_status)
+    response["Cache-Control"] = "no-store"
+    return response
 
-    is_healthy = all(status == "ok" for status in checks.values())
-    http_status = 200 if is_healthy else 503
 
-    return JsonResponse(
-        {"status": "ok" if is_healthy else "error", "checks": checks},
-        status=http_status,
-    )
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Prometheus scrape endpoint merging the aggregates of every worker on this host.
+    Connection pool gauges, when pooling is on, are those of the answering worker.
+    Requires ``Authorization: Bearer <METRICS_TOKEN>``; without a configured token the
+    endpoint does not exist, so latencies and query counts are never public by default.
+    """
+    if not settings.METRICS_TOKEN:
+        return HttpResponse(status=404)
+    expected = f"Bearer {settings.METRICS_TOKEN}"
+    if not hmac.compare_digest(request.headers.get("Authorization", ""), expected):
+        return HttpResponse(status=401)
+
+    body = render_prometheus(registry.collect())
+    if settings.DB_POOL_ENABLED:
+        from src.shared.postgresql_pool.base import pool_stats
+
+        body += render_pool_metrics(pool_stats())
+    return HttpResponse(body, content_type="text/plain; version=0.0.4")
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    OpenAPI schema served from the copy generated at warmup. Requests selecting a
+    language or version (``?lang=``, ``?version=``) are still generated on the fly.
+    """
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request: Request, *args: object, **kwargs: object) -> Response:
+        if request.query_params.get("lang") or request.query_params.get("version") or self.api_version:
+            return super().get(request, *args, **kwargs)
+        return Response(data=openapi_schema())
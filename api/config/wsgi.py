@@ -8,9 +8,17 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 """
 
 import os
+import time
 
 from django.core.wsgi import get_wsgi_application
 
+from src.shared.warmup import warmup
+
+boot_started = time.monotonic()
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# Under gunicorn --preload this runs once in the master, before the workers fork
+warmup(boot_started)
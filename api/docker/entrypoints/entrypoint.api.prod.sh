@@ -6,12 +6,27 @@ set -e pipefail
 echo "📦 Applying database migrations..."
 python manage.py migrate --noinput
 
-# Start the Django server with Gunicorn
-echo "🚀 Starting Django server on ${API_HOST}:${API_PORT} with ${GUNICORN_WORKERS} workers..."
-python -m gunicorn config.wsgi:application \
+# ================================ Deployment mode =====================================
+# API_SERVER_MODE=wsgi (default): sync workers serving config.wsgi
+# API_SERVER_MODE=asgi: uvicorn workers serving config.asgi with native async views
+#                       (requires the 'uvicorn' package in the image)
+if [ "${API_SERVER_MODE}" = "asgi" ]; then
+  APP_MODULE="config.asgi:application"
+  WORKER_CLASS="uvicorn.workers.UvicornWorker"
+else
+  APP_MODULE="config.wsgi:application"
+  WORKER_CLASS="sync"
+fi
+
+# Start the Django server with Gunicorn. --preload loads the app (and runs the warmup in
+# config.wsgi / config.asgi) once in the master, so forked workers start warm
+echo "🚀 Starting Django server (${API_SERVER_MODE:-wsgi}) on ${API_HOST}:${API_PORT} with ${GUNICORN_WORKERS} workers..."
+python -m gunicorn "${APP_MODULE}" \
+  --worker-class "${WORKER_CLASS}" \
   --bind "${API_HOST}:${API_PORT}" \
   --workers "${GUNICORN_WORKERS}" \
+  --preload \
   --timeout 120 \
   --log-level "${LOG_LEVEL}" \
   --access-logfile '-' \
-  --error-logfile '-'
\ No newline at end of file
+  --error-logfile '-'
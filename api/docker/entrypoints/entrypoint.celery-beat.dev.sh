@@ -0,0 +1,8 @@
+#!/bin/bash
+# Celery Beat Entrypoint: enqueues the periodic tasks in CELERY_BEAT_SCHEDULE
+# (e.g. pruning the task audit log). Run exactly one beat per deployment.
+set -e pipefail
+
+echo "⏰ Starting Celery beat..."
+# Keep the schedule state file out of the mounted source tree
+exec python -m celery -A config beat --loglevel="${LOGLEVEL}" --schedule=/tmp/celerybeat-schedule
@@ -0,0 +1,8 @@
+#!/bin/bash
+# Celery Beat Entrypoint: enqueues the periodic tasks in CELERY_BEAT_SCHEDULE
+# (e.g. pruning the task audit log). Run exactly one beat per deployment.
+set -e pipefail
+
+echo "⏰ Starting Celery beat..."
+# The schedule state file lives outside the app directory, which may be read-only
+exec python -m celery -A config beat --loglevel="${LOGLEVEL}" --schedule=/tmp/celerybeat-schedule
@@ -0,0 +1,19 @@
+from django.contrib import admin
+from django.http import HttpRequest
+
+from src.audit.models import TaskAuditLog
+
+
+@admin.register(TaskAuditLog)
+class TaskAuditLogAdmin(admin.ModelAdmin):
+    list_display = ("task_id", "task_name", "status", "created_at", "completed_at")
+    list_filter = ("status",)
+    search_fields = ("task_id",)
+    ordering = ("-created_at",)
+    show_full_result_count = False
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: TaskAuditLog | None = None) -> bool:
+        return False
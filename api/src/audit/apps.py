@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class AuditConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "src.audit"
+
+    def ready(self) -> None:
+        """Connect the Celery signal handlers when the app is ready."""
+        import src.audit.utils.signals  # noqa
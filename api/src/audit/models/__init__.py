@@ -0,0 +1,4 @@
+# Import all models to make them available when importing from src.audit.models
+from .task_audit_model import TaskAuditLog
+
+__all__ = ["TaskAuditLog"]
@@ -0,0 +1,29 @@
+from django.contrib.postgres.indexes import BrinIndex
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class TaskAuditLog(models.Model):
+    """
+    Lightweight audit trail of Celery task executions.
+
+    Rows are written in batches by ``src.audit.utils.writer`` and pruned by age, so the
+    table stays small enough for fire-and-forget tasks to skip the result backend.
+    """
+
+    task_id = models.CharField(max_length=255, unique=True, verbose_name=_("Task ID"))
+    task_name = models.CharField(max_length=255, verbose_name=_("Task name"))
+    status = models.CharField(max_length=50, verbose_name=_("Status"))
+    result = models.JSONField(blank=True, null=True, verbose_name=_("Result"))
+    created_at = models.DateTimeField(default=timezone.now)
+    completed_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [  # noqa: RUF012
+            # Rows arrive in time order, so a BRIN index keeps age-based pruning cheap
+            BrinIndex(fields=["created_at"], name="audit_task_created_brin"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.task_name} [{self.task_id}] {self.status}"
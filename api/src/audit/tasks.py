@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+
+from src.audit.models import TaskAuditLog
+
+
+@shared_task(ignore_result=True)
+def prune_task_audit_logs(batch_size: int = 5000) -> int:
+    """
+    Delete audit rows older than ``TASK_AUDIT_RETENTION_DAYS`` in small batches, so the
+    cleanup never holds long locks. The BRIN index on ``created_at`` keeps each batch
+    cheap to locate.
+    """
+    cutoff = timezone.now() - timedelta(days=settings.TASK_AUDIT_RETENTION_DAYS)
+    deleted = 0
+    while True:
+        ids = list(TaskAuditLog.objects.filter(created_at__lt=cutoff).values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += TaskAuditLog.objects.filter(id__in=ids).delete()[0]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from celery.signals import task_postrun, task_prerun, worker_process_shutdown, worker_shutdown
+from django.utils import timezone
+
+from src.audit.utils.writer import serialize_result, writer
+
+if TYPE_CHECKING:
+    from celery import Task
+
+# Tasks that must not audit themselves
+IGNORED_TASKS = {"src.audit.tasks.prune_task_audit_logs"}
+
+
+@task_prerun.connect
+def audit_task_started(sender: Task | None = None, task_id: str | None = None, **kwargs: Any) -> None:  # noqa: ANN401
+    """
+    Buffer a STARTED event for the task.
+
+    Args:
+        sender: The task being executed
+        task_id: Unique id of the task execution
+        **kwargs: Additional keyword arguments
+    """
+    if sender is None or task_id is None or sender.name in IGNORED_TASKS:
+        return
+    writer.record(task_id, task_name=sender.name, status="STARTED", created_at=timezone.now())
+
+
+@task_postrun.connect
+def audit_task_finished(
+    sender: Task | None = None,
+    task_id: str | None = None,
+    retval: Any = None,  # noqa: ANN401
+    state: str | None = None,
+    **kwargs: Any,  # noqa: ANN401
+) -> None:
+    """
+    Buffer the final state and a bounded copy of the result.
+
+    Args:
+        sender: The task that was executed
+        task_id: Unique id of the task execution
+        retval: Return value, or the exception when the task failed
+        state: Final task state (SUCCESS, FAILURE, RETRY, ...)
+        **kwargs: Additional keyword arguments
+    """
+    if sender is None or task_id is None or sender.name in IGNORED_TASKS:
+        return
+    writer.record(
+        task_id,
+        task_name=sender.name,
+        status=state or "UNKNOWN",
+        result=serialize_result(retval),
+        completed_at=timezone.now(),
+    )
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def flush_task_audit(**kwargs: Any) -> None:  # noqa: ANN401
+    """Flush whatever is still buffered before the worker process exits."""
+    writer.flush()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# Fields refreshed when a task_id already has a row (e.g. STARTED -> SUCCESS)
+UPDATE_FIELDS = ["task_name", "status", "result", "completed_at"]
+
+# Upper bound for serialized results kept in the audit trail
+MAX_RESULT_LENGTH = 2048
+
+
+def serialize_result(value: Any) -> Any:  # noqa: ANN401
+    """
+    Return a JSON-safe, size-bounded representation of a task result.
+    """
+    if value is None:
+        return None
+    try:
+        encoded = json.dumps(value)
+    except (TypeError, ValueError):
+        return {"repr": repr(value)[:MAX_RESULT_LENGTH]}
+    if len(encoded) > MAX_RESULT_LENGTH:
+        return {"repr": encoded[:MAX_RESULT_LENGTH], "truncated": True}
+    return value
+
+
+class TaskAuditWriter:
+    """
+    Per-process buffer that coalesces audit events by ``task_id`` and upserts them in
+    batches, either when ``batch_size`` is reached or every ``flush_interval`` seconds.
+
+    The background flusher is started lazily per PID, so it is safe across Celery
+    prefork children.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pid: int | None = None
+
+    def record(self, task_id: str, **fields: Any) -> None:  # noqa: ANN401
+        self._ensure_flusher()
+        with self._lock:
+            self._pending.setdefault(task_id, {"task_id": task_id}).update(fields)
+            is_full = len(self._pending) >= self.batch_size
+        if is_full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Write every buffered event with ``INSERT ... ON CONFLICT DO UPDATE``, at most
+        ``batch_size`` rows per statement. On a database error the rows stay buffered for
+        the next attempt.
+        """
+        from src.audit.models import TaskAuditLog
+
+        with self._lock:
+            rows, self._pending = self._pending, {}
+        if not rows:
+            return 0
+
+        try:
+            TaskAuditLog.objects.bulk_create(
+                [TaskAuditLog(**row) for row in rows.values()],
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=["task_id"],
+                update_fields=UPDATE_FIELDS,
+            )
+        except DatabaseError:
+            logger.exception("Failed to flush %d task audit rows.", len(rows))
+            self._requeue(rows)
+            return 0
+        return len(rows)
+
+    def _requeue(self, rows: dict[str, dict[str, Any]]) -> None:
+        # Events recorded since the swap are newer, so they win over the failed batch
+        with self._lock:
+            for task_id, row in rows.items():
+                self._pending[task_id] = row | self._pending.get(task_id, {})
+
+    def _ensure_flusher(self) -> None:
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # Events buffered by the parent belong to the parent, not to this child
+            self._pending = {}
+            self._wakeup = threading.Event()
+            self._pid = os.getpid()
+            threading.Thread(target=self._run, name="task-audit-flusher", daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+            # The flusher thread owns its own connection; do not keep it idle between batches
+            connections.close_all()
+
+
+writer = TaskAuditWriter(
+    batch_size=settings.TASK_AUDIT_BATCH_SIZE,
+    flush_interval=settings.TASK_AUDIT_FLUSH_INTERVAL,
+)
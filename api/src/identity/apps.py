@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class IdentityConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.identity"
+
+    def ready(self) -> None:
+        if settings.LAST_LOGIN_MODE == "sync":
+            return
+
+        from django.contrib.auth.signals import user_logged_in
+
+        from src.identity.last_login import record_last_login
+
+        # Replace the per-login UPDATE connected by django.contrib.auth with the buffered writer
+        user_logged_in.disconnect(dispatch_uid="update_last_login")
+        user_logged_in.connect(record_last_login, dispatch_uid="record_last_login")
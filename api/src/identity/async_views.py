@@ -0,0 +1,98 @@
+"""
+Native async token endpoint, served under ASGI (see ``config.urls_async``).
+
+Password hashing is CPU-bound, so it runs in a bounded thread pool: PBKDF2 releases the
+GIL, and the pool size caps how many hashes a single ASGI worker runs at once while the
+event loop keeps serving other in-flight requests.
+"""
+
+import asyncio
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, cast
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model, user_logged_in
+from django.contrib.auth.hashers import check_password, make_password
+from django.db.models import Value
+from django.db.models.functions import Lower
+from django.http import HttpRequest, JsonResponse, QueryDict
+from django.utils.translation import gettext as _
+
+from src.identity.serializers import CustomTokenObtainPairSerializer
+from src.shared.throttling import throttle_wait
+
+if TYPE_CHECKING:
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+User = get_user_model()
+
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.ASYNC_PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-check",
+)
+
+
+async def _run_hasher(func: object, *args: object) -> object:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, func, *args)  # type: ignore[arg-type]
+
+
+# Content types the DRF view parses as form data; anything else is read as JSON
+_FORM_CONTENT_TYPES = frozenset({"application/x-www-form-urlencoded", "multipart/form-data"})
+
+
+def _credentials(request: HttpRequest) -> tuple[str, str] | None:
+    """``email`` and ``password`` from a JSON or form body, or ``None`` unless both are strings."""
+    if request.content_type in _FORM_CONTENT_TYPES:
+        data = request.POST
+    else:
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+    if not isinstance(data, dict | QueryDict):
+        return None
+    email, password = data.get("email"), data.get("password")
+    if not isinstance(email, str) or not isinstance(password, str) or not email or not password:
+        return None
+    return email, password
+
+
+async def token_obtain_pair(request: HttpRequest) -> JsonResponse:
+    """Async equivalent of ``CustomTokenObtainPairView``."""
+    # Django 4.2 view decorators are sync-only, so the method check is done inline
+    # Messages reuse the DRF and simplejwt msgids, so their catalogs translate them
+    if request.method != "POST":
+        return JsonResponse({"detail": _('Method "{method}" not allowed.').format(method=request.method)}, status=405)
+
+    credentials = _credentials(request)
+    if credentials is None:
+        return JsonResponse({"detail": _("email and password are required.")}, status=400)
+    email, password = credentials
+
+    wait = await sync_to_async(throttle_wait)(request, "token", email)
+    if wait:
+        response = JsonResponse({"detail": _("Request was throttled.")}, status=429)
+        response["Retry-After"] = str(math.ceil(wait))
+        return response
+
+    user = await User.objects.alias(email_lower=Lower("email")).filter(email_lower=Lower(Value(email))).afirst()
+    if user is None:
+        # Hash anyway so response time does not reveal whether the email exists
+        await _run_hasher(make_password, password)
+        is_valid = False
+    else:
+        is_valid = bool(await _run_hasher(check_password, password, user.password)) and user.is_active
+
+    if not is_valid:
+        return JsonResponse(
+            {"detail": _("No active account found with the given credentials"), "code": "no_active_account"},
+            status=401,
+        )
+
+    refresh = cast("RefreshToken", CustomTokenObtainPairSerializer.get_token(user))
+    await sync_to_async(user_logged_in.send)(sender=user.__class__, request=request, user=user)
+    return JsonResponse({"refresh": str(refresh), "access": str(refresh.access_token)})
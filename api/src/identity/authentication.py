@@ -0,0 +1,121 @@
+from typing import TYPE_CHECKING, Any, cast
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.cache import cache
+from django.db import router
+from django.http import HttpRequest
+from django.utils.translation import gettext as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from src.identity import revocation
+from src.shared.db_router import primary_reads
+
+if TYPE_CHECKING:
+    from rest_framework.request import Request
+
+User = get_user_model()
+
+# Cache key prefix for users resolved from access tokens
+USER_CACHE_PREFIX = "auth:user"
+
+# Columns cached for authentication and permission checks. The password hash is never
+# cached; code that needs another column (e.g. check_password) loads it on access.
+USER_CACHE_FIELDS: tuple[str, ...] = ("id", "email", "is_active", "is_staff", "is_superuser")
+
+# Model.from_db maps a partial row onto fields in model order, so values are cached in it too
+_CACHED_ATTNAMES: list[str] = [
+    field.attname
+    for field in User._meta.fields  # Noqa
+    if field.concrete and field.attname in USER_CACHE_FIELDS
+]
+
+USER_ID_CLAIM: str = settings.SIMPLE_JWT["USER_ID_CLAIM"]
+
+
+def _cache_key(user_id: Any) -> str:  # noqa: ANN401
+    return f"{USER_CACHE_PREFIX}:{user_id}"
+
+
+def get_cached_user(user_id: Any) -> AbstractBaseUser | None:  # noqa: ANN401
+    """
+    Return the user from the cache, or ``None`` on a miss. The default cache is tiered, so
+    most hits are served from the process-local L1 without a round trip.
+    """
+    values = cache.get(_cache_key(user_id))
+    if values is None:
+        return None
+    # A fresh instance per request, so mutations such as set_password never leak
+    # into the cached copy shared by other requests.
+    return User.from_db(router.db_for_read(User), _CACHED_ATTNAMES, values)
+
+
+def cache_user(user: AbstractBaseUser) -> None:
+    values = tuple(getattr(user, name) for name in _CACHED_ATTNAMES)
+    cache.set(_cache_key(user.pk), values, timeout=settings.AUTH_USER_CACHE_TTL)
+
+
+def invalidate_user(user_id: Any) -> None:  # noqa: ANN401
+    """
+    Drop a user from the cache. The delete is published on the cache invalidation bus, so
+    every worker drops its L1 copy too. Must be called whenever a field that affects
+    authentication (password, email, is_active, is_staff, is_superuser) changes.
+    """
+    cache.delete(_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves ``user_id`` through a two-tier cache
+    (per-process L1 + shared L2) instead of a ``SELECT`` per request.
+    """
+
+    def get_user(self, validated_token: Token) -> AbstractBaseUser:
+        try:
+            user_id = validated_token[USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from exc
+
+        if settings.JWT_ROTATION_ENABLED and revocation.is_token_revoked(validated_token):
+            raise InvalidToken(_("Token is blacklisted"))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            # The row is cached for minutes, so it must not come from a lagging replica
+            with primary_reads():
+                user = super().get_user(validated_token)
+            cache_user(user)
+            return user
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        self._check_revoked(validated_token, user)
+        return user
+
+    def _check_revoked(self, validated_token: Token, user: AbstractBaseUser) -> None:
+        if not getattr(api_settings, "CHECK_REVOKE_TOKEN", False):
+            return
+
+        from rest_framework_simplejwt.utils import get_md5_hash_password
+
+        claim = str(api_settings.REVOKE_TOKEN_CLAIM)
+        if validated_token.get(claim) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+
+async def aauthenticate(request: HttpRequest) -> AbstractBaseUser | None:
+    """
+    Authenticate a plain Django request inside a native async view.
+
+    Token decoding is CPU-only; the cached user lookup may hit the cache or the database,
+    so it runs through ``sync_to_async`` on the shared thread. Returns ``None`` when no
+    credentials were sent and raises ``AuthenticationFailed`` when they are invalid.
+    """
+    # Only the headers are read, which plain and DRF requests share
+    result = await sync_to_async(CachedJWTAuthentication().authenticate)(cast("Request", request))
+    return result[0] if result else None
@@ -0,0 +1,149 @@
+"""
+Coalesced ``last_login`` writes.
+
+Django's ``update_last_login`` receiver runs one ``UPDATE users_user`` per login, inside
+the request. With ``LAST_LOGIN_MODE`` set to ``deferred`` or ``celery`` logins are buffered
+per process instead (latest timestamp per user) and written as one
+``UPDATE ... FROM (VALUES ...)`` ordered by id, so concurrent flushers never deadlock and
+a login spike no longer queues on row locks. ``last_login`` is at most
+``LAST_LOGIN_FLUSH_INTERVAL`` seconds stale (plus queue latency in ``celery`` mode).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any, cast
+
+from django.conf import settings
+from django.db import connection, connections
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from celery import Task
+    from django.db.models import Field
+
+logger = logging.getLogger(__name__)
+
+
+def write_last_logins(rows: dict[Any, datetime]) -> int:
+    """
+    Apply ``{user_id: last_login}`` in a single statement. Never moves a timestamp
+    backwards, so late or replayed batches are harmless. Returns the rows updated.
+    """
+    if not rows:
+        return 0
+
+    from src.users.models import User
+
+    table = connection.ops.quote_name(User._meta.db_table)  # Noqa
+    pk_type = cast("Field", User._meta.pk).db_type(connection)  # Noqa
+    values = ", ".join([f"(%s::{pk_type}, %s::timestamptz)"] * len(rows))
+    params: list[Any] = []
+    for user_id in sorted(rows):
+        params.extend((user_id, rows[user_id]))
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} AS u SET last_login = v.last_login "  # noqa: S608
+            f"FROM (VALUES {values}) AS v(id, last_login) "
+            "WHERE u.id = v.id AND (u.last_login IS NULL OR u.last_login < v.last_login)",
+            params,
+        )
+        return cursor.rowcount
+
+
+class LastLoginBuffer:
+    """
+    Per-process buffer of the latest login per user, flushed when ``batch_size`` users
+    are pending or every ``flush_interval`` seconds. In ``celery`` mode a flush enqueues
+    the batch instead of writing it, so web workers never touch the users table.
+
+    The background flusher is started lazily per PID, so it is safe across gunicorn and
+    Celery prefork children.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, use_celery: bool) -> None:  # noqa: FBT001
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.use_celery = use_celery
+        self._pending: dict[Any, datetime] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pid: int | None = None
+
+    def record(self, user_id: Any, when: datetime) -> None:  # noqa: ANN401
+        self._ensure_flusher()
+        with self._lock:
+            previous = self._pending.get(user_id)
+            if previous is None or previous < when:
+                self._pending[user_id] = when
+            is_full = len(self._pending) >= self.batch_size
+        if is_full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        with self._lock:
+            rows, self._pending = self._pending, {}
+        if not rows:
+            return 0
+
+        try:
+            if self.use_celery:
+                from src.identity.tasks import flush_last_logins
+
+                cast("Task", flush_last_logins).delay([[user_id, when.isoformat()] for user_id, when in rows.items()])
+                return len(rows)
+            return write_last_logins(rows)
+        except Exception:
+            logger.exception("Failed to flush last_login for %d users.", len(rows))
+            self._requeue(rows)
+            return 0
+
+    def _requeue(self, rows: dict[Any, datetime]) -> None:
+        # Keep the timestamps for the next attempt unless newer logins superseded them
+        with self._lock:
+            for user_id, when in rows.items():
+                if self._pending.get(user_id, when) <= when:
+                    self._pending[user_id] = when
+
+    def _ensure_flusher(self) -> None:
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # Logins buffered by the parent belong to the parent, not to this child
+            self._pending = {}
+            self._wakeup = threading.Event()
+            self._pid = os.getpid()
+            threading.Thread(target=self._run, name="last-login-flusher", daemon=True).start()
+            atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+            # The flusher thread owns its own connection; do not keep it idle between batches
+            connections.close_all()
+
+
+buffer = LastLoginBuffer(
+    batch_size=settings.LAST_LOGIN_BATCH_SIZE,
+    flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL,
+    use_celery=settings.LAST_LOGIN_MODE == "celery",
+)
+
+
+def record_last_login(sender: Any, user: Any, **kwargs: Any) -> None:  # noqa: ANN401
+    """
+    ``user_logged_in`` receiver replacing ``django.contrib.auth.models.update_last_login``.
+    """
+    user.last_login = timezone.now()
+    buffer.record(user.pk, user.last_login)
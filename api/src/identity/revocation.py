@@ -0,0 +1,150 @@
+"""
+Refresh-token rotation without simplejwt's database blacklist.
+
+Rotated-out JTIs live in the shared cache as keys that expire with the token, so the
+revoked set never outgrows the live tokens. That set is the source of truth: every
+refresh makes one round trip, the atomic ``cache.add`` that consumes the old JTI, and
+it is also the reuse check, so two concurrent refreshes of one token can never both
+succeed, whichever workers serve them.
+
+Each process keeps a rotating Bloom filter of the JTIs it consumed itself. It only sees
+this process's revocations, so a miss proves nothing; it lets the worker that rotated a
+token reject a replay before the round trip, and lets access-token checks (whose JTIs
+are never revoked) skip the shared cache. Per-user "not before" timestamps are read
+from the tiered cache, whose L1 the invalidation bus keeps in step across workers.
+Revoking every token of a user is a single ``cache.set``.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+# Cache key prefixes for revoked JTIs and per-user revocation timestamps
+REVOKED_JTI_PREFIX = "jwt:revoked"
+NOT_BEFORE_PREFIX = "jwt:nbf"
+
+_REFRESH_LIFETIME = int(settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds())
+JTI_CLAIM = str(api_settings.JTI_CLAIM)
+USER_ID_CLAIM = str(api_settings.USER_ID_CLAIM)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings (double hashing on a single BLAKE2b digest).
+    ``False`` from ``__contains__`` means the item was never added to this filter;
+    ``True`` may be a false positive.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        # Optimal m = -n ln(p) / ln(2)^2 bits and k = m/n ln(2) hashes
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RotatingBloomFilter:
+    """
+    Two generations of ``BloomFilter``, swapped every ``period`` seconds. An item stays a
+    member for at least ``period`` seconds, which is all that is needed once ``period``
+    is the refresh-token lifetime: older JTIs belong to expired tokens anyway.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, period: float) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.period = period
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotate_at = time.monotonic() + period
+        self._lock = threading.Lock()
+
+    def _maybe_rotate(self) -> None:
+        if time.monotonic() < self._rotate_at:
+            return
+        with self._lock:
+            if time.monotonic() >= self._rotate_at:
+                self._previous, self._current = self._current, BloomFilter(self.capacity, self.error_rate)
+                self._rotate_at = time.monotonic() + self.period
+
+    def add(self, item: str) -> None:
+        self._maybe_rotate()
+        with self._lock:
+            self._current.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        self._maybe_rotate()
+        return item in self._current or item in self._previous
+
+
+_revoked_jtis = RotatingBloomFilter(
+    capacity=settings.JWT_REVOKED_BLOOM_CAPACITY,
+    error_rate=settings.JWT_REVOKED_BLOOM_ERROR_RATE,
+    period=_REFRESH_LIFETIME,
+)
+
+
+def _seconds_left(token: Token) -> int:
+    return max(int(float(token["exp"]) - time.time()), 1)
+
+
+def is_jti_revoked(jti: str) -> bool:
+    """
+    Whether this process's filter and then the shared cache hold ``jti``. A JTI consumed
+    by another worker is not in the filter, so refreshes must still go through
+    ``consume_jti``, which is authoritative.
+    """
+    if jti not in _revoked_jtis:
+        return False
+    return cache.get(f"{REVOKED_JTI_PREFIX}:{jti}") is not None
+
+
+def consume_jti(token: Token) -> bool:
+    """
+    Atomically mark the token's JTI as revoked. Returns ``False`` when it already was,
+    i.e. the token is being replayed after rotation.
+    """
+    jti = token[JTI_CLAIM]
+    _revoked_jtis.add(jti)
+    return cache.add(f"{REVOKED_JTI_PREFIX}:{jti}", 1, timeout=_seconds_left(token))
+
+
+def get_not_before(user_id: Any) -> int:  # noqa: ANN401
+    return cache.get(f"{NOT_BEFORE_PREFIX}:{user_id}", 0)
+
+
+def revoke_user_tokens(user_id: Any) -> None:  # noqa: ANN401
+    """
+    Revoke every token issued to the user so far, in O(1): tokens whose ``iat`` is not
+    after the stored timestamp are rejected. ``iat`` has one-second resolution, so tokens
+    minted within the revoking second are rejected too. The cache write publishes an
+    invalidation, so other workers drop their L1 copy right away.
+    """
+    cache.set(f"{NOT_BEFORE_PREFIX}:{user_id}", int(time.time()), timeout=_REFRESH_LIFETIME)
+
+
+def is_token_revoked(token: Token) -> bool:
+    """Whether the token predates its user's revocation, or its JTI was rotated out here."""
+    not_before = get_not_before(token[USER_ID_CLAIM])
+    if not_before and token.get("iat", 0) <= not_before:
+        return True
+    jti = token.get(JTI_CLAIM)
+    return bool(jti) and is_jti_revoked(jti)
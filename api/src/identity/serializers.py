@@ -2,9 +2,13 @@ from typing import Any, TypeVar
 
 from django.contrib.auth import get_user_model, user_logged_in
 from django.http import HttpRequest
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.utils.translation import gettext as _
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from rest_framework_simplejwt.tokens import Token
 
+from src.identity import revocation
+
 User = get_user_model()
 
 UserT = TypeVar("UserT", bound=User)  # type: ignore[name-defined]
@@ -30,3 +34,29 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def add_custom_claims(cls, user: UserT, token: Token) -> None:
         token["email"] = user.email
+
+
+class RotatingTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh with rotation backed by ``src.identity.revocation`` instead of simplejwt's
+    ``token_blacklist`` tables. Replaying a rotated-out refresh token is treated as theft
+    and revokes every token of its user.
+    """
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        refresh = self.token_class(attrs["refresh"])
+
+        if revocation.is_token_revoked(refresh):
+            raise InvalidToken(_("Token is blacklisted"))
+
+        if not revocation.consume_jti(refresh):
+            revocation.revoke_user_tokens(refresh[revocation.USER_ID_CLAIM])
+            raise InvalidToken(_("Token is blacklisted"))
+
+        data = {"access": str(refresh.access_token)}
+
+        refresh.set_jti()
+        refresh.set_exp()
+        refresh.set_iat()
+        data["refresh"] = str(refresh)
+        return data
@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from celery import shared_task
+
+from src.identity.last_login import write_last_logins
+
+
+@shared_task(ignore_result=True, acks_late=True)
+def flush_last_logins(rows: list[list[str]]) -> int:
+    """
+    Write a batch of ``[user_id, iso timestamp]`` pairs buffered by a web worker.
+    """
+    return write_last_logins({user_id: datetime.fromisoformat(when) for user_id, when in rows})
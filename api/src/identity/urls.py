@@ -1,7 +1,8 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
 
-from src.identity.views import CustomTokenObtainPairView
+from src.identity.views import CustomTokenObtainPairView, RotatingTokenRefreshView
 
 # Constants URL paths
 TOKEN_URL = "token"
@@ -10,5 +11,9 @@ TOKEN_URL = "token"
 urlpatterns = [
     # JWT Token endpoints
     path(f"{TOKEN_URL}/", CustomTokenObtainPairView.as_view(), name="token_obtain_pair"),
-    path(f"{TOKEN_URL}/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path(
+        f"{TOKEN_URL}/refresh/",
+        (RotatingTokenRefreshView if settings.JWT_ROTATION_ENABLED else TokenRefreshView).as_view(),
+        name="token_refresh",
+    ),
 ]
@@ -3,9 +3,10 @@ from typing import Any
 from django.conf import settings
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from src.identity import serializers
+from src.shared.throttling import EmailTokenBucketThrottle, IPTokenBucketThrottle
 
 
 class JWTSetCookieMixin:
@@ -52,3 +53,9 @@ class JWTSetCookieMixin:
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = serializers.CustomTokenObtainPairSerializer
+    throttle_classes = (IPTokenBucketThrottle, EmailTokenBucketThrottle)
+    throttle_scope = "token"
+
+
+class RotatingTokenRefreshView(TokenRefreshView):
+    serializer_class = serializers.RotatingTokenRefreshSerializer
@@ -0,0 +1,14 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from src.profiling.middleware import PROFILE_HEADER, make_profile_token
+
+
+class Command(BaseCommand):
+    help = "Print a signed header value that profiles a single API request."
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        self.stdout.write(f"{PROFILE_HEADER}: {make_profile_token()}")
+        self.stderr.write(f"Valid for {settings.PROFILING_TOKEN_MAX_AGE}s.")
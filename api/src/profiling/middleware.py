@@ -0,0 +1,104 @@
+import logging
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core import signing
+from django.http import HttpRequest, HttpResponse
+
+from src.profiling.sampler import StackSampler
+from src.profiling.storage import save_capture
+
+logger = logging.getLogger(__name__)
+
+# Request header carrying a token from `manage.py profiling_token`
+PROFILE_HEADER = "X-Profile-Request"
+SIGNING_SALT = "src.profiling"
+
+
+def make_profile_token() -> str:
+    return signing.TimestampSigner(salt=SIGNING_SALT).sign("profile")
+
+
+def _has_valid_token(request: HttpRequest) -> bool:
+    token = request.headers.get(PROFILE_HEADER)
+    if not token:
+        return False
+    try:
+        signing.TimestampSigner(salt=SIGNING_SALT).unsign(token, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return False
+    return True
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a single request with a statistical sampler when it carries a valid signed
+    ``X-Profile-Request`` header, or when its URL name is drawn by
+    ``PROFILING_SAMPLE_RATES``. Unprofiled requests pay one dict lookup.
+
+    Sync and async capable. Under ASGI only native async views are profiled: the sampler
+    follows the event loop thread, so a capture also contains whatever other requests the
+    loop ran meanwhile. Sync views run on a ``sync_to_async`` thread that is not known
+    before they start, so they are skipped with a warning.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        self.sample_rates: dict[str, float] = settings.PROFILING_SAMPLE_RATES
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+            # Django would otherwise run the sync hook through sync_to_async on every request
+            self.process_view = self.aprocess_view  # type: ignore[method-assign]
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self._finish(request, self.get_response(request))
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        return self._finish(request, await self.get_response(request))
+
+    @staticmethod
+    def _finish(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        sampler: StackSampler | None = getattr(request, "_profiling_sampler", None)
+        if sampler is not None:
+            started: float = request._profiling_started  # type: ignore[attr-defined] # noqa: SLF001
+            stacks = sampler.stop()
+            duration_ms = (time.perf_counter() - started) * 1000
+            match = request.resolver_match
+            path = save_capture(match.view_name if match else "unresolved", duration_ms, sampler.collapse(stacks))
+            response["X-Profile-Capture"] = path.name
+        return response
+
+    def process_view(self, request: HttpRequest, view_func: Callable, view_args: Any, view_kwargs: Any) -> None:  # noqa: ANN401
+        self._maybe_start(request)
+
+    async def aprocess_view(self, request: HttpRequest, view_func: Callable, view_args: Any, view_kwargs: Any) -> None:  # noqa: ANN401
+        if iscoroutinefunction(view_func):
+            self._maybe_start(request)
+        elif self._is_profiled(request):
+            logger.warning("Not profiling %s: sync views are not profiled under ASGI.", request.path)
+
+    def _is_profiled(self, request: HttpRequest) -> bool:
+        match = request.resolver_match
+        rate = self.sample_rates.get(match.view_name) if match else None
+        sampled = rate is not None and random.random() < rate  # noqa: S311
+        return sampled or _has_valid_token(request)
+
+    def _maybe_start(self, request: HttpRequest) -> None:
+        if not self._is_profiled(request):
+            return
+
+        request._profiling_started = time.perf_counter()  # type: ignore[attr-defined] # noqa: SLF001
+        request._profiling_sampler = StackSampler(  # type: ignore[attr-defined] # noqa: SLF001
+            threading.get_ident(),
+            settings.PROFILING_INTERVAL,
+        ).start()
@@ -0,0 +1,65 @@
+import re
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from django.conf import settings
+
+CAPTURE_SUFFIX = ".collapsed"
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass(frozen=True)
+class Capture:
+    name: str
+    size: int
+    created_at: datetime
+
+
+def capture_dir() -> Path:
+    return Path(settings.PROFILING_DIR)
+
+
+def save_capture(url_name: str, duration_ms: float, collapsed: str) -> Path:
+    """
+    Write a capture and enforce the retention limits (max count and max age).
+    """
+    directory = capture_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%S%f")
+    path = directory / f"{stamp}-{_UNSAFE.sub('_', url_name)}-{duration_ms:.0f}ms{CAPTURE_SUFFIX}"
+    path.write_text(collapsed)
+    prune()
+    return path
+
+
+def prune() -> None:
+    cutoff = time.time() - settings.PROFILING_RETENTION_HOURS * 3600
+    captures = sorted(capture_dir().glob(f"*{CAPTURE_SUFFIX}"), key=lambda path: path.name, reverse=True)
+    for index, path in enumerate(captures):
+        if index >= settings.PROFILING_MAX_CAPTURES or path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+
+
+def list_captures() -> list[Capture]:
+    directory = capture_dir()
+    if not directory.exists():
+        return []
+    return [
+        Capture(
+            name=path.name,
+            size=stat.st_size,
+            created_at=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+        )
+        for path in sorted(directory.glob(f"*{CAPTURE_SUFFIX}"), key=lambda path: path.name, reverse=True)
+        if (stat := path.stat())
+    ]
+
+
+def capture_path(name: str) -> Path | None:
+    """Resolve a capture by file name, refusing anything outside the capture directory."""
+    if _UNSAFE.sub("_", name) != name or not name.endswith(CAPTURE_SUFFIX):
+        return None
+    path = capture_dir() / name
+    return path if path.is_file() else None
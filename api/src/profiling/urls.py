@@ -0,0 +1,10 @@
+from django.contrib import admin
+from django.urls import path
+
+from src.profiling.views import capture_download, capture_list
+
+# Staff-only pages, wrapped by the admin site's login and permission checks
+urlpatterns = [
+    path("", admin.site.admin_view(capture_list), name="profiling-captures"),
+    path("<str:name>/", admin.site.admin_view(capture_download), name="profiling-capture-download"),
+]
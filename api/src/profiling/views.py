@@ -0,0 +1,21 @@
+from django.contrib import admin
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse
+from django.template.response import TemplateResponse
+
+from src.profiling.storage import capture_path, list_captures
+
+
+def capture_list(request: HttpRequest) -> HttpResponse:
+    context = {
+        **admin.site.each_context(request),
+        "title": "Request profiles",
+        "captures": list_captures(),
+    }
+    return TemplateResponse(request, "profiling/captures.html", context)
+
+
+def capture_download(request: HttpRequest, name: str) -> FileResponse:
+    path = capture_path(name)
+    if path is None:
+        raise Http404
+    return FileResponse(path.open("rb"), as_attachment=True, filename=name, content_type="text/plain")
@@ -0,0 +1,359 @@
+"""
+Two-tier Django cache backend.
+
+L1 is a bounded, per-process TTL LRU (``src.shared.lru.TTLCache``); L2 is any other
+configured cache alias (Redis in production, ``LocMemCache`` in tests, the legacy
+``DatabaseCache`` as a PoC fallback). Writes go through to L2 and publish the touched
+keys on an invalidation bus so every other worker drops its L1 copy.
+
+Django builds one backend instance per thread, so the L1, the counters and the bus live
+in a module-level registry keyed by ``LOCATION`` and PID and are shared by every thread
+of a process: one L1 and one bus subscription per worker, however many threads it runs.
+
+Example::
+
+    CACHES = {
+        "default": {
+            "BACKEND": "src.shared.cache_backend.TieredCache",
+            "OPTIONS": {"L2": "shared", "L1_MAX_ENTRIES": 10000, "L1_TIMEOUT": 5},
+        },
+        "shared": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://redis:6379/0"},
+    }
+"""
+
+import json
+import logging
+import os
+import pickle
+import threading
+import uuid
+import weakref
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import redis
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+from src.shared.lru import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Wildcard published on clear()
+ALL_KEYS = "*"
+
+
+# ============================== Invalidation buses ==============================
+class NullInvalidationBus:
+    """No cross-process messages; L1 staleness is bounded by ``L1_TIMEOUT`` only."""
+
+    def start(self, on_message: Callable[[list[str]], None]) -> None:
+        pass
+
+    def publish(self, keys: list[str]) -> None:
+        pass
+
+
+class LocalInvalidationBus:
+    """
+    In-process bus that fans messages out to every subscriber but the publisher.
+    Stand-in for tests where several ``TieredCache`` locations emulate workers.
+    Subscribers are held weakly, so a discarded cache drops out of the fan-out.
+    """
+
+    _subscribers: dict[str, list[weakref.WeakMethod]] = {}  # noqa: RUF012
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self._ref: weakref.WeakMethod | None = None
+
+    def start(self, on_message: Callable[[list[str]], None]) -> None:
+        if self._ref is None:
+            self._ref = weakref.WeakMethod(on_message)  # type: ignore[arg-type]
+            self._subscribers.setdefault(self.channel, []).append(self._ref)
+
+    def publish(self, keys: list[str]) -> None:
+        refs = self._subscribers.get(self.channel, [])
+        # Prune subscribers whose cache was garbage collected
+        refs[:] = [ref for ref in refs if ref() is not None]
+        for ref in refs:
+            callback = ref()
+            if ref is not self._ref and callback is not None:
+                callback(keys)
+
+
+class RedisInvalidationBus:
+    """
+    Redis pub/sub bus. The subscriber thread is (re)started lazily in each process,
+    so it survives gunicorn and Celery prefork forks.
+    """
+
+    def __init__(self, url: str, channel: str) -> None:
+        self.url = url
+        self.channel = channel
+        self._pid: int | None = None
+        self._origin = ""
+        self._client: Any = None
+        self._lock = threading.Lock()
+
+    def start(self, on_message: Callable[[list[str]], None]) -> None:
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            self._client = redis.Redis.from_url(self.url)
+            self._origin = f"{os.getpid()}-{uuid.uuid4().hex}"
+
+            def handle(message: dict[str, Any]) -> None:
+                payload = json.loads(message["data"])
+                if payload["origin"] != self._origin:
+                    on_message(payload["keys"])
+
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: handle})
+            pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            self._pid = os.getpid()
+
+    def publish(self, keys: list[str]) -> None:
+        try:
+            self._client.publish(self.channel, json.dumps({"origin": self._origin, "keys": keys}))
+        except redis.RedisError:
+            logger.warning("Cache invalidation publish failed; peers rely on L1 expiry.", exc_info=True)
+
+
+# ============================== Shared state ==============================
+def _build_bus(options: dict[str, Any], channel: str) -> Any:  # noqa: ANN401
+    bus = options.get("INVALIDATION_BUS", "null")
+    if bus == "redis":
+        return RedisInvalidationBus(options["INVALIDATION_URL"], channel)
+    if bus == "local":
+        return LocalInvalidationBus(channel)
+    return NullInvalidationBus()
+
+
+class _ProcessState:
+    """The L1, counters and invalidation bus of one cache location in one process."""
+
+    def __init__(self, options: dict[str, Any], channel: str) -> None:
+        self.l1_timeout: float = float(options.get("L1_TIMEOUT", 5))
+        self.l1 = TTLCache(maxsize=int(options.get("L1_MAX_ENTRIES", 10000)), ttl=self.l1_timeout)
+        self.bus = _build_bus(options, channel)
+        self.stats_lock = threading.Lock()
+        self.stats = {"l1_hits": 0, "l2_hits": 0, "misses": 0, "sets": 0, "invalidations": 0}
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self.stats_lock:
+            self.stats[name] += amount
+
+    def on_invalidation(self, keys: list[str]) -> None:
+        self.count("invalidations")
+        if ALL_KEYS in keys:
+            self.l1.clear()
+            return
+        for key in keys:
+            self.l1.delete(key)
+
+
+# Held weakly: a state lives as long as some thread's TieredCache still uses it
+_states: weakref.WeakValueDictionary[tuple[str, int], _ProcessState] = weakref.WeakValueDictionary()
+_states_lock = threading.Lock()
+
+
+def _process_state(location: str, options: dict[str, Any]) -> _ProcessState:
+    key = (location, os.getpid())
+    with _states_lock:
+        state = _states.get(key)
+        if state is None:
+            state = _states[key] = _ProcessState(options, channel=options.get("INVALIDATION_CHANNEL", location))
+        return state
+
+
+# ============================== Cache backend ==============================
+class TieredCache(BaseCache):
+    """
+    Bounded in-process L1 in front of a shared L2 cache alias, with hit/miss counters.
+    """
+
+    def __init__(self, location: str, params: dict[str, Any]) -> None:
+        super().__init__(params)
+        self._options: dict[str, Any] = params.get("OPTIONS", {})
+        self._location = location or "cache-invalidation"
+        self._l2_alias: str = self._options.get("L2", "shared")
+        self._state_pid = os.getpid()
+        self._state = _process_state(self._location, self._options)
+
+    # ============================== Internals ==============================
+    @property
+    def l2(self) -> BaseCache:
+        return caches[self._l2_alias]
+
+    def _shared(self) -> _ProcessState:
+        """This process's state, subscribed to the bus; re-resolved in a forked child."""
+        if self._state_pid != os.getpid():
+            self._state = _process_state(self._location, self._options)
+            self._state_pid = os.getpid()
+        state = self._state
+        state.bus.start(state.on_invalidation)
+        return state
+
+    def _l1_ttl(self, timeout: float | None) -> float | None:
+        l1_timeout = self._state.l1_timeout
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            return l1_timeout
+        if timeout <= 0:
+            return None
+        return min(float(timeout), l1_timeout)
+
+    def _store_l1(self, state: _ProcessState, key: str, value: Any, timeout: float | None) -> None:  # noqa: ANN401
+        ttl = self._l1_ttl(timeout)
+        if ttl is None:
+            state.l1.delete(key)
+        else:
+            # Pickled like LocMemCache, so callers mutating a result never corrupt L1
+            state.l1.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ttl=ttl)
+
+    @staticmethod
+    def _invalidate(state: _ProcessState, keys: list[str]) -> None:
+        for key in keys:
+            state.l1.delete(key)
+        state.bus.publish(keys)
+
+    # ============================== BaseCache API ==============================
+    def get(self, key: str, default: Any = None, version: int | None = None) -> Any:  # noqa: ANN401
+        state = self._shared()
+        l1_key = self.make_and_validate_key(key, version=version)
+
+        cached = state.l1.get(l1_key, _MISSING)
+        if cached is not _MISSING:
+            state.count("l1_hits")
+            return pickle.loads(cached)  # noqa: S301
+
+        value = self.l2.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            state.count("misses")
+            return default
+
+        state.count("l2_hits")
+        self._store_l1(state, l1_key, value, DEFAULT_TIMEOUT)
+        return value
+
+    def get_many(self, keys: Iterable[str], version: int | None = None) -> dict[str, Any]:
+        state = self._shared()
+        found: dict[str, Any] = {}
+        missing: list[str] = []
+
+        for key in keys:
+            cached = state.l1.get(self.make_and_validate_key(key, version=version), _MISSING)
+            if cached is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = pickle.loads(cached)  # noqa: S301
+        state.count("l1_hits", len(found))
+
+        if missing:
+            fetched = self.l2.get_many(missing, version=version)
+            state.count("l2_hits", len(fetched))
+            state.count("misses", len(missing) - len(fetched))
+            for key, value in fetched.items():
+                self._store_l1(state, self.make_and_validate_key(key, version=version), value, DEFAULT_TIMEOUT)
+            found.update(fetched)
+        return found
+
+    def set(
+        self,
+        key: str,
+        value: Any,  # noqa: ANN401
+        timeout: float | None = DEFAULT_TIMEOUT,
+        version: int | None = None,
+    ) -> None:
+        state = self._shared()
+        l1_key = self.make_and_validate_key(key, version=version)
+        self.l2.set(key, value, timeout=timeout, version=version)
+        state.count("sets")
+        state.bus.publish([l1_key])
+        self._store_l1(state, l1_key, value, timeout)
+
+    def set_many(
+        self,
+        data: dict[str, Any],
+        timeout: float | None = DEFAULT_TIMEOUT,
+        version: int | None = None,
+    ) -> list[str]:
+        state = self._shared()
+        failed = self.l2.set_many(data, timeout=timeout, version=version)
+        l1_keys = [self.make_and_validate_key(key, version=version) for key in data]
+        state.count("sets", len(data))
+        state.bus.publish(l1_keys)
+        for key, value in data.items():
+            if key not in failed:
+                self._store_l1(state, self.make_and_validate_key(key, version=version), value, timeout)
+        return failed
+
+    def add(
+        self,
+        key: str,
+        value: Any,  # noqa: ANN401
+        timeout: float | None = DEFAULT_TIMEOUT,
+        version: int | None = None,
+    ) -> bool:
+        state = self._shared()
+        added = self.l2.add(key, value, timeout=timeout, version=version)
+        if added:
+            l1_key = self.make_and_validate_key(key, version=version)
+            state.count("sets")
+            state.bus.publish([l1_key])
+            self._store_l1(state, l1_key, value, timeout)
+        return added
+
+    def touch(self, key: str, timeout: float | None = DEFAULT_TIMEOUT, version: int | None = None) -> bool:
+        return self.l2.touch(key, timeout=timeout, version=version)
+
+    def incr(self, key: str, delta: int = 1, version: int | None = None) -> int:
+        # Counters are only atomic in L2, so they are never served from L1
+        state = self._shared()
+        value = self.l2.incr(key, delta=delta, version=version)
+        self._invalidate(state, [self.make_and_validate_key(key, version=version)])
+        return value
+
+    def decr(self, key: str, delta: int = 1, version: int | None = None) -> int:
+        return self.incr(key, delta=-delta, version=version)
+
+    def has_key(self, key: str, version: int | None = None) -> bool:
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def delete(self, key: str, version: int | None = None) -> bool:
+        state = self._shared()
+        deleted = self.l2.delete(key, version=version)
+        self._invalidate(state, [self.make_and_validate_key(key, version=version)])
+        return deleted
+
+    def delete_many(self, keys: Iterable[str], version: int | None = None) -> None:
+        state = self._shared()
+        keys = list(keys)
+        self.l2.delete_many(keys, version=version)
+        self._invalidate(state, [self.make_and_validate_key(key, version=version) for key in keys])
+
+    def clear(self) -> None:
+        state = self._shared()
+        self.l2.clear()
+        state.l1.clear()
+        state.bus.publish([ALL_KEYS])
+
+    def close(self, **kwargs: Any) -> None:  # noqa: ANN401
+        self.l2.close(**kwargs)
+
+    # ============================== Observability ==============================
+    def stats(self) -> dict[str, int]:
+        """Per-process hit/miss counters plus the current L1 size."""
+        state = self._shared()
+        with state.stats_lock:
+            snapshot = dict(state.stats)
+        snapshot["l1_entries"] = len(state.l1)
+        return snapshot
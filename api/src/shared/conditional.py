@@ -0,0 +1,57 @@
+"""
+Conditional request helpers (ETag / Last-Modified validators) for API views.
+
+Validators are derived from ``updated_at`` columns, so they are computed from a row or a
+cheap aggregate before anything is serialized. Reads answer ``If-None-Match`` and
+``If-Modified-Since`` with 304; writes honour ``If-Match`` with 412 (weak comparison, as
+every ETag here is weak).
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any
+
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_etags
+from rest_framework.request import Request
+
+
+def weak_etag(*parts: Any) -> str:  # noqa: ANN401
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def set_validators(response: HttpResponseBase, etag: str, last_modified: datetime | None) -> HttpResponseBase:
+    response["ETag"] = etag
+    # Clients may keep the body but must revalidate it on every use
+    response["Cache-Control"] = "private, no-cache"
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def not_modified(request: HttpRequest, etag: str, last_modified: datetime | None) -> HttpResponse | None:
+    """
+    Return the 304 (or 412) response a GET must send instead of a body, or ``None``.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        return None
+    return set_validators(response, etag, last_modified)  # type: ignore[return-value]
+
+
+def if_match_fails(request: HttpRequest | Request, etag: str) -> bool:
+    """
+    Whether the request carries an ``If-Match`` that does not match ``etag``.
+    """
+    header = request.headers.get("If-Match")
+    if not header:
+        return False
+
+    etags = parse_etags(header)
+    if etags == ["*"]:
+        return False
+    opaque = etag.removeprefix("W/")
+    return all(candidate.removeprefix("W/") != opaque for candidate in etags)
@@ -0,0 +1,179 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+Replicas only serve reads that ``ReplicaStickinessMiddleware`` marked as safe: GET/HEAD/
+OPTIONS requests from clients that have not written recently. Everything else (writes,
+reads inside a transaction, Celery tasks, management commands, sessions and the database
+cache) stays on ``default``. After a write the user (by id) and the client (by IP) stick
+to the primary for ``REPLICA_STICKY_SECONDS``, tracked in the shared cache so every
+worker honours it.
+
+Each process checks replica health and replication lag every ``REPLICA_CHECK_INTERVAL``
+seconds on a background thread, so a slow or unreachable replica never holds up a request;
+unreachable replicas and replicas lagging more than ``REPLICA_MAX_LAG_SECONDS`` are skipped
+until the next check. Until the first check, and whenever the results go stale, reads stay
+on the primary. The stickiness lookup runs on every safe request, so replicas need the Redis
+L2 cache (``CACHE_REDIS_URL``): on the database cache it would cost a primary round trip.
+"""
+
+import base64
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.db.models import Model
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+# Cache key prefix for read-your-writes stickiness
+STICKY_PREFIX = "db:sticky"
+
+# Apps whose reads must always see the primary
+PRIMARY_ONLY_APPS = frozenset({"sessions", "django_cache", "django_celery_results"})
+
+# Set by ReplicaStickinessMiddleware for the duration of a replica-safe request
+replica_reads_allowed: ContextVar[bool] = ContextVar("replica_reads_allowed", default=False)
+
+_LAG_SQL = (
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Force reads in the block onto the primary, e.g. before caching what they return."""
+    token = replica_reads_allowed.set(False)
+    try:
+        yield
+    finally:
+        replica_reads_allowed.reset(token)
+
+
+class ReplicaMonitor:
+    # Missed checks after which the last results no longer count and reads use the primary
+    STALE_AFTER_CHECKS = 3
+
+    def __init__(self, aliases: list[str], max_lag: float, interval: float) -> None:
+        self.aliases = aliases
+        self.max_lag = max_lag
+        self.interval = interval
+        self._healthy: list[str] = []
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+
+    def _lag(self, alias: str) -> float:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(_LAG_SQL)
+            return float(cursor.fetchone()[0])
+
+    def _refresh(self) -> None:
+        healthy: list[str] = []
+        for alias in self.aliases:
+            try:
+                lag = self._lag(alias)
+            except DatabaseError:
+                logger.warning("Replica %s is unreachable; reading from the primary.", alias, exc_info=True)
+                connections[alias].close()
+                continue
+            if lag > self.max_lag:
+                logger.warning("Replica %s lags %.1fs; reading from the primary.", alias, lag)
+                continue
+            healthy.append(alias)
+        self._healthy = healthy
+        self._checked_at = time.monotonic()
+
+    def _run(self) -> None:
+        while True:
+            self._refresh()
+            time.sleep(self.interval)
+
+    def _ensure_started(self) -> None:
+        """Start the probe thread once per process; a forked worker does not inherit it."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._healthy, self._checked_at = [], float("-inf")
+                threading.Thread(target=self._run, name="replica-monitor", daemon=True).start()
+                self._pid = os.getpid()
+
+    def choose(self) -> str | None:
+        """A healthy replica alias, or ``None`` to read from the primary. Never blocks on a probe."""
+        self._ensure_started()
+        if time.monotonic() - self._checked_at > self.interval * self.STALE_AFTER_CHECKS:
+            return None
+        healthy = self._healthy
+        return random.choice(healthy) if healthy else None  # noqa: S311
+
+
+monitor = ReplicaMonitor(
+    aliases=[alias for alias in settings.DATABASES if alias != "default"],
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    interval=settings.REPLICA_CHECK_INTERVAL,
+)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model: type[Model], **hints: Any) -> str | None:  # noqa: ANN401
+        if not replica_reads_allowed.get() or model._meta.app_label in PRIMARY_ONLY_APPS:  # Noqa
+            return None
+        # Reads inside a write transaction must see its own uncommitted rows
+        if connections["default"].in_atomic_block:
+            return None
+        return monitor.choose()
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str:  # noqa: ANN401
+        return "default"
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool:  # noqa: ANN401
+        # Replicas mirror the primary, so objects from any alias may be related
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:  # noqa: ANN401
+        return db == "default"
+
+
+# ============================== Stickiness ==============================
+def _token_user_id(request: Any) -> Any:  # noqa: ANN401
+    """
+    ``user_id`` claim of the bearer token, without verifying it: it only decides which
+    database serves the reads, authentication still verifies the token.
+    """
+    header = request.headers.get("Authorization", "")
+    _, _, token = header.partition(" ")
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    return claims.get(settings.SIMPLE_JWT["USER_ID_CLAIM"]) if isinstance(claims, dict) else None
+
+
+def sticky_keys(request: Any, user_id: Any = None) -> list[str]:  # noqa: ANN401
+    keys = [f"{STICKY_PREFIX}:ip:{BaseThrottle().get_ident(request)}"]
+    if user_id is not None:
+        keys.append(f"{STICKY_PREFIX}:user:{user_id}")
+    return keys
+
+
+def is_sticky(request: Any) -> bool:  # noqa: ANN401
+    return bool(cache.get_many(sticky_keys(request, _token_user_id(request))))
+
+
+def stick_to_primary(request: Any) -> None:  # noqa: ANN401
+    user = getattr(request, "user", None)
+    user_id = user.pk if user is not None and user.is_authenticated else _token_user_id(request)
+    cache.set_many(dict.fromkeys(sticky_keys(request, user_id), 1), timeout=settings.REPLICA_STICKY_SECONDS)
@@ -46,6 +46,14 @@ class ConflictError(CustomAPIException):
     default_code = "resource_conflict"
 
 
+class PreconditionFailedError(CustomAPIException):
+    """Conditional request (If-Match) did not match the current resource."""
+
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = _("The resource has been modified since it was last fetched.")
+    default_code = "precondition_failed"
+
+
 class UnauthorizedError(CustomAPIException):
     """Unauthorized access exception."""
 
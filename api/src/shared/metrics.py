@@ -0,0 +1,183 @@
+"""
+Low-overhead, per-process request metrics with cross-worker merging.
+
+Each thread records into its own shard (no locks on the request path). Every
+``METRICS_FLUSH_INTERVAL`` seconds a worker merges its shards and atomically rewrites
+``<METRICS_DIR>/<pid>.json``; the scrape endpoint merges every worker's file, much like
+prometheus_client's multiprocess mode, so any gunicorn worker can answer a scrape.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from django.conf import settings
+
+# Latency histogram upper bounds, in seconds
+LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Per-series slots: histogram buckets (+Inf last), then the scalar aggregates below
+COUNT, LATENCY_SUM, SQL_COUNT, SQL_SUM, RESPONSE_BYTES = range(len(LATENCY_BUCKETS) + 1, len(LATENCY_BUCKETS) + 6)
+SERIES_LENGTH = RESPONSE_BYTES + 1
+
+SeriesKey = tuple[str, str, str]
+
+
+class MetricsRegistry:
+    def __init__(self, directory: str, flush_interval: float) -> None:
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._shards: list[dict[SeriesKey, list[float]]] = []
+        self._shards_lock = threading.Lock()  # only taken when a new thread registers
+        self._pid = os.getpid()
+        self._next_flush = time.monotonic() + flush_interval
+
+    def _shard(self) -> dict[SeriesKey, list[float]]:
+        if self._pid != os.getpid():
+            # Forked child: drop the parent's shards so nothing is double counted
+            with self._shards_lock:
+                self._pid = os.getpid()
+                self._shards = []
+                self._local = threading.local()
+
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def observe(
+        self,
+        key: SeriesKey,
+        latency: float,
+        sql_count: int,
+        sql_seconds: float,
+        response_bytes: int,
+    ) -> None:
+        series = self._shard().get(key)
+        if series is None:
+            series = self._shard()[key] = [0.0] * SERIES_LENGTH
+
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                series[index] += 1
+                break
+        else:
+            series[len(LATENCY_BUCKETS)] += 1
+        series[COUNT] += 1
+        series[LATENCY_SUM] += latency
+        series[SQL_COUNT] += sql_count
+        series[SQL_SUM] += sql_seconds
+        series[RESPONSE_BYTES] += response_bytes
+
+        if time.monotonic() >= self._next_flush:
+            self._next_flush = time.monotonic() + self.flush_interval
+            self.flush()
+
+    def snapshot(self) -> dict[SeriesKey, list[float]]:
+        """Merge this process's thread shards."""
+        return merge(list(shard.items()) for shard in list(self._shards))
+
+    def flush(self) -> None:
+        """Atomically publish this process's aggregates for other workers' scrapes."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = {"|".join(key): series for key, series in self.snapshot().items()}
+        target = self.directory / f"{os.getpid()}.json"
+        tmp = target.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload))
+        tmp.replace(target)
+
+    def collect(self) -> dict[SeriesKey, list[float]]:
+        """Merge every worker's published aggregates plus this process's live ones."""
+        self.flush()
+        sources: list[Iterable[tuple[SeriesKey, list[float]]]] = []
+        for path in self.directory.glob("*.json"):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            sources.append((tuple(key.split("|")), series) for key, series in data.items())  # type: ignore[misc]
+        return merge(sources)
+
+
+def merge(sources: Iterable[Iterable[tuple[SeriesKey, list[float]]]]) -> dict[SeriesKey, list[float]]:
+    merged: dict[SeriesKey, list[float]] = {}
+    for source in sources:
+        for key, series in source:
+            total = merged.setdefault(key, [0.0] * SERIES_LENGTH)
+            for index, value in enumerate(series):
+                total[index] += value
+    return merged
+
+
+def _labels(key: SeriesKey, **extra: str) -> str:
+    view, method, status = key
+    pairs = {"view": view, "method": method, "status": status, **extra}
+    return ",".join(f'{name}="{value}"' for name, value in pairs.items())
+
+
+def render_prometheus(data: dict[SeriesKey, list[float]]) -> str:
+    """Render aggregates in the Prometheus text exposition format."""
+    lines: list[str] = [
+        "# HELP http_request_duration_seconds Request latency by view.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for key, series in sorted(data.items()):
+        cumulative = 0.0
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            cumulative += series[index]
+            lines.append(f"http_request_duration_seconds_bucket{{{_labels(key, le=str(bound))}}} {cumulative:g}")
+        cumulative += series[len(LATENCY_BUCKETS)]
+        lines.append(f"http_request_duration_seconds_bucket{{{_labels(key, le='+Inf')}}} {cumulative:g}")
+        lines.append(f"http_request_duration_seconds_count{{{_labels(key)}}} {series[COUNT]:g}")
+        lines.append(f"http_request_duration_seconds_sum{{{_labels(key)}}} {series[LATENCY_SUM]:.6f}")
+
+    scalars: list[tuple[str, str, int, str]] = [
+        ("http_request_sql_queries_total", "SQL queries executed by view.", SQL_COUNT, "g"),
+        ("http_request_sql_duration_seconds_total", "Time spent in SQL by view.", SQL_SUM, ".6f"),
+        ("http_response_size_bytes_total", "Response body bytes by view.", RESPONSE_BYTES, "g"),
+    ]
+    for name, help_text, slot, fmt in scalars:
+        lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} counter"))
+        lines.extend(f"{name}{{{_labels(key)}}} {format(series[slot], fmt)}" for key, series in sorted(data.items()))
+    return "\n".join(lines) + "\n"
+
+
+# (stat, metric, type, help) for the ConnectionPool.get_stats() keys that are exported
+POOL_METRICS: tuple[tuple[str, str, str, str], ...] = (
+    ("pool_size", "db_pool_connections", "gauge", "Connections currently managed by the pool."),
+    ("pool_available", "db_pool_connections_idle", "gauge", "Idle connections in the pool."),
+    ("requests_waiting", "db_pool_requests_waiting", "gauge", "Clients waiting for a connection."),
+    ("requests_num", "db_pool_requests_total", "counter", "Connections requested from the pool."),
+    ("requests_wait_ms", "db_pool_requests_wait_milliseconds_total", "counter", "Time spent waiting for a connection."),
+    ("requests_errors", "db_pool_requests_errors_total", "counter", "Requests that timed out or failed."),
+    ("returns_bad", "db_pool_returns_bad_total", "counter", "Connections returned in a bad state."),
+    ("connections_num", "db_pool_connects_total", "counter", "Connection attempts to the server."),
+    ("connections_errors", "db_pool_connect_errors_total", "counter", "Failed connection attempts."),
+    ("connections_lost", "db_pool_connections_lost_total", "counter", "Connections found broken by the check."),
+)
+
+
+def render_pool_metrics(stats: dict[str, dict[str, int]]) -> str:
+    """
+    Render the connection pool stats of the worker answering the scrape, labelled with its
+    pid (pools are per process, unlike the request aggregates above).
+    """
+    if not stats:
+        return ""
+    pid = os.getpid()
+    lines: list[str] = []
+    for stat, name, kind, help_text in POOL_METRICS:
+        lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"))
+        lines.extend(
+            f'{name}{{alias="{alias}",pid="{pid}"}} {values.get(stat, 0):g}' for alias, values in sorted(stats.items())
+        )
+    return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(directory=settings.METRICS_DIR, flush_interval=settings.METRICS_FLUSH_INTERVAL)
@@ -0,0 +1,170 @@
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from src.shared.metrics import registry
+
+
+class QueryCounter:
+    """``connection.execute_wrapper`` hook that counts statements and their duration."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:  # noqa: ANN401, FBT001
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Count the statements run on every database connection inside the block."""
+    queries = QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(queries))
+        yield queries
+
+
+class MetricsMiddleware:
+    """
+    Records per-view latency, SQL query count/duration and response size into the
+    per-process metrics registry, and emits a ``Server-Timing`` header.
+
+    Sync and async capable, so async views under ASGI are not adapted to a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        with count_queries() as queries:
+            response = self.get_response(request)
+        return self._record(request, response, queries, time.perf_counter() - started)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        with count_queries() as queries:
+            response = await self.get_response(request)
+        return self._record(request, response, queries, time.perf_counter() - started)
+
+    @staticmethod
+    def _record(request: HttpRequest, response: HttpResponse, queries: QueryCounter, elapsed: float) -> HttpResponse:
+        match = getattr(request, "resolver_match", None)
+        view = (match.view_name if match else None) or "unresolved"
+        size = int(response.get("Content-Length") or 0) if response.streaming else len(response.content)
+
+        registry.observe(
+            (view, request.method or "", f"{response.status_code // 100}xx"),
+            latency=elapsed,
+            sql_count=queries.count,
+            sql_seconds=queries.seconds,
+            response_bytes=size,
+        )
+        response["Server-Timing"] = (
+            f'app;dur={elapsed * 1000:.1f}, db;dur={queries.seconds * 1000:.1f};desc="{queries.count} queries"'
+        )
+        return response
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    ``WhiteNoiseMiddleware`` (sync-only in 6.7) with an async call path, so it does not
+    push the async views below it onto a thread under ASGI. The file lookup is an
+    in-memory dict unless ``WHITENOISE_AUTOREFRESH`` (development) is on.
+    """
+
+    sync_capable = True
+    async_capable = True
+    get_response: Callable[[HttpRequest], Any]
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        super().__init__(get_response)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase | Awaitable[HttpResponseBase]:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        static_file = self.find_file(request.path_info) if self.autorefresh else self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Lets safe requests read from replicas unless their user or client wrote within
+    ``REPLICA_STICKY_SECONDS``, and starts that window after every unsafe request.
+    Not loaded when no replica is configured. See ``src.shared.db_router``.
+
+    Sync and async capable; the ContextVar it sets is copied into ``sync_to_async`` threads.
+    """
+
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        if len(settings.DATABASES) == 1:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        from src.shared.db_router import is_sticky, replica_reads_allowed, stick_to_primary
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if request.method not in self.SAFE_METHODS:
+            response = self.get_response(request)
+            stick_to_primary(request)
+            return response
+
+        token = replica_reads_allowed.set(not is_sticky(request))
+        try:
+            return self.get_response(request)
+        finally:
+            replica_reads_allowed.reset(token)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        from src.shared.db_router import is_sticky, replica_reads_allowed, stick_to_primary
+
+        if request.method not in self.SAFE_METHODS:
+            response = await self.get_response(request)
+            # Resolving the session user may hit the database
+            await sync_to_async(stick_to_primary)(request)
+            return response
+
+        token = replica_reads_allowed.set(not is_sticky(request))
+        try:
+            return await self.get_response(request)
+        finally:
+            replica_reads_allowed.reset(token)
@@ -0,0 +1,188 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, ClassVar
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Model, Q, QuerySet
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from src.shared.exceptions import ValidationError
+
+
+class InvalidCursorError(ValidationError):
+    """Raised when the pagination cursor cannot be decoded."""
+
+    default_code = "invalid_cursor"
+    default_detail = _("Invalid cursor.")
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque-cursor keyset pagination.
+
+    Rows are ordered on a unique, composite key (``(created_at, id)`` by default) and
+    every page is fetched with ``WHERE key < cursor ORDER BY key LIMIT n + 1``, so a deep
+    page costs the same as the first one: no OFFSET scan and no ``COUNT(*)``.
+    The cursor is the base64-encoded key of the last row of the previous page.
+    """
+
+    ordering: ClassVar[tuple[str, ...]] = ("-created_at", "-id")
+    cursor_query_param: str = "cursor"
+    page_size_query_param: str = "page_size"
+
+    def __init__(self) -> None:
+        self.page_size: int = settings.PAGINATION_PAGE_SIZE
+        self.max_page_size: int = settings.PAGINATION_MAX_PAGE_SIZE
+        self.next_position: dict[str, Any] | None = None
+        self.request: Request | HttpRequest | None = None
+
+    # ============================== Cursor encoding ==============================
+    def encode_cursor(self, position: dict[str, Any]) -> str:
+        # Datetimes keep full microsecond precision; DjangoJSONEncoder truncates to ms,
+        # which would make the cursor skip or repeat rows created in the same millisecond.
+        values = {key: value.isoformat() if isinstance(value, datetime) else value for key, value in position.items()}
+        payload = json.dumps(values, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _params(request: Request | HttpRequest) -> Mapping[str, str]:
+        # DRF requests expose query_params; plain (async) Django views only have GET
+        return getattr(request, "query_params", request.GET)
+
+    def decode_cursor(self, request: Request | HttpRequest) -> dict[str, Any] | None:
+        encoded = self._params(request).get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            position = json.loads(base64.urlsafe_b64decode(encoded + padding))
+        except (binascii.Error, ValueError) as exc:
+            raise InvalidCursorError from exc
+
+        if not isinstance(position, dict) or set(position) != set(self.field_names):
+            raise InvalidCursorError
+        return position
+
+    # ============================== Queryset helpers ==============================
+    @property
+    def field_names(self) -> list[str]:
+        return [field.lstrip("-") for field in self.ordering]
+
+    def get_page_size(self, request: Request | HttpRequest) -> int:
+        value = self._params(request).get(self.page_size_query_param)
+        if value is None:
+            return self.page_size
+
+        try:
+            page_size = int(value)
+        except ValueError:
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def build_filter(self, position: dict[str, Any]) -> Q:
+        """
+        Build the lexicographic "row after cursor" predicate.
+
+        For ``(-created_at, -id)`` this yields
+        ``created_at <= c AND (created_at < c OR id < i)``, whose leading bound lets
+        PostgreSQL seek straight into the composite index.
+        """
+        condition = Q()
+        for index in reversed(range(len(self.ordering))):
+            field = self.ordering[index]
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            step = Q(**{f"{name}__{lookup}": position[name]})
+            if index < len(self.ordering) - 1:
+                step |= Q(**{name: position[name]}) & condition
+            condition = step
+
+        leading = self.ordering[0]
+        leading_name = leading.lstrip("-")
+        leading_lookup = "lte" if leading.startswith("-") else "gte"
+        return Q(**{f"{leading_name}__{leading_lookup}": position[leading_name]}) & condition
+
+    # ============================== DRF interface ==============================
+    def _prepare_queryset(self, queryset: QuerySet, request: Request | HttpRequest) -> tuple[QuerySet, int]:
+        self.request = request
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            try:
+                queryset = queryset.filter(self.build_filter(position))
+            except (DjangoValidationError, TypeError, ValueError) as exc:
+                raise InvalidCursorError from exc
+        return queryset[: page_size + 1], page_size
+
+    def window_queryset(self, queryset: QuerySet, request: Request | HttpRequest) -> QuerySet:
+        """The unevaluated page slice (page size + 1 rows), e.g. to aggregate validators over it."""
+        queryset, _ = self._prepare_queryset(queryset, request)
+        return queryset
+
+    def _finalize_page(self, rows: list[Model], page_size: int) -> list[Model]:
+        has_next = len(rows) > page_size
+        page = rows[:page_size]
+
+        self.next_position = None
+        if has_next and page:
+            last = page[-1]
+            self.next_position = {name: getattr(last, name) for name in self.field_names}
+        return page
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> list[Model]:  # noqa: ANN401
+        queryset, page_size = self._prepare_queryset(queryset, request)
+        return self._finalize_page(list(queryset), page_size)
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: HttpRequest) -> list[Model]:
+        """Async counterpart of ``paginate_queryset`` for native async views."""
+        queryset, page_size = self._prepare_queryset(queryset, request)
+        return self._finalize_page([row async for row in queryset], page_size)
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None or self.request is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data: list[dict[str, Any]]) -> Response:
+        return Response(OrderedDict([("next", self.get_next_link()), ("results", data)]))
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque pagination cursor returned in `next`.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Number of results per page (max {self.max_page_size}).",
+                "schema": {"type": "integer"},
+            },
+        ]
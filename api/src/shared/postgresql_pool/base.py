@@ -0,0 +1,116 @@
+"""
+PostgreSQL backend drawing connections from a ``psycopg_pool.ConnectionPool``.
+
+Django 4.2 has no native pooling, so this backend keeps one pool per database alias and
+process: ``connect()`` checks a connection out (pinged first when ``CHECK`` is on) and
+``close()`` hands it back instead of tearing down TCP, TLS and authentication. Use it with
+``CONN_MAX_AGE = 0`` so every request and Celery task returns its connection.
+
+Pools are created lazily and keyed by PID. Gunicorn workers and Celery prefork children
+build their own pool on first use and never touch sockets inherited from the parent:
+those are kept referenced (not closed, which would send a Terminate on the parent's
+session) and ignored.
+
+Settings, under ``DATABASES[alias]["POOL"]``: ``MIN_SIZE``, ``MAX_SIZE``, ``TIMEOUT``
+(seconds to wait for a free connection), ``MAX_IDLE``, ``MAX_LIFETIME`` and ``CHECK``.
+"""
+
+import atexit
+import os
+import threading
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresDatabaseWrapper
+from psycopg import IsolationLevel
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError as exc:
+    error = "The pooled PostgreSQL backend requires the 'psycopg[pool]' extra (psycopg_pool)."
+    raise ImproperlyConfigured(error) from exc
+
+_pools: dict[str, ConnectionPool[Any]] = {}
+_pools_pid = os.getpid()
+_pools_lock = threading.Lock()
+
+# Pools inherited across a fork: referenced so their sockets are never finalized here
+_inherited: list[ConnectionPool[Any]] = []
+
+
+def get_pool(alias: str, conn_params: dict[str, Any], options: dict[str, Any]) -> ConnectionPool[Any]:
+    global _pools_pid
+
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            _inherited.extend(_pools.values())
+            _pools.clear()
+            _pools_pid = os.getpid()
+
+        pool = _pools.get(alias)
+        if pool is None:
+            pool = ConnectionPool(
+                kwargs=conn_params,
+                min_size=int(options.get("MIN_SIZE", 1)),
+                max_size=int(options.get("MAX_SIZE", 4)),
+                timeout=float(options.get("TIMEOUT", 10)),
+                max_idle=float(options.get("MAX_IDLE", 300)),
+                max_lifetime=float(options.get("MAX_LIFETIME", 3600)),
+                check=ConnectionPool.check_connection if options.get("CHECK", True) else None,
+                name=f"{alias}-{os.getpid()}",
+                open=False,
+            )
+            pool.open()
+            _pools[alias] = pool
+        return pool
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """``ConnectionPool.get_stats()`` of every pool opened by this process, by alias."""
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            return {}
+        return {alias: pool.get_stats() for alias, pool in _pools.items()}
+
+
+@atexit.register
+def close_pools() -> None:
+    """Close this process's pools; pools inherited from a parent process are left alone."""
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            return
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    def get_new_connection(self, conn_params: dict[str, Any]) -> Any:  # noqa: ANN401
+        # The parent sets isolation_level around its own connect(), which a pool replaces
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        try:
+            self.isolation_level = IsolationLevel(isolation_level or IsolationLevel.READ_COMMITTED)
+        except ValueError as exc:
+            error = (
+                f"Invalid transaction isolation level {isolation_level} specified. "
+                "Use one of the psycopg.IsolationLevel values."
+            )
+            raise ImproperlyConfigured(error) from exc
+
+        pool = get_pool(self.alias, conn_params, self.settings_dict.get("POOL", {}))
+        connection = pool.getconn()
+        # Every borrower of a pool shares its OPTIONS, so only an explicit level is applied
+        if isolation_level is not None and connection.isolation_level != self.isolation_level:
+            connection.isolation_level = self.isolation_level
+        self._pool_pid = os.getpid()
+        return connection
+
+    def _close(self) -> None:
+        if self.connection is None:
+            return
+        if getattr(self, "_pool_pid", None) != os.getpid():
+            # Checked out by the parent before a fork: not ours to return or close
+            return
+        with self.wrap_database_errors:
+            get_pool(self.alias, {}, {}).putconn(self.connection)
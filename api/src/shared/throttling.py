@@ -0,0 +1,194 @@
+"""
+Token-bucket throttles backed by the shared cache.
+
+Buckets are keyed by client IP and by the submitted email, so a credential-stuffing burst
+is stopped whether it rotates emails from one address or one email across many addresses.
+DRF checks throttles in ``APIView.initial``, before the serializer runs, so a rejected
+request never reaches the password hasher; DRF answers 429 with ``Retry-After``.
+
+When the shared cache is Redis, each take is one Lua script (refill + take + expiry in a
+single atomic round trip, on the Redis clock). Other backends (the ``DatabaseCache`` PoC
+default, ``LocMemCache`` in tests) run the same bucket under a short lock taken with
+``add``, four round trips per take; the bucket is stored with an explicit timeout (its
+full-refill time), never the cache default.
+
+Rates use DRF's ``DEFAULT_THROTTLE_RATES`` format, under ``<scope>_ip`` and ``<scope>_email``.
+"""
+
+import hashlib
+import math
+import time
+from collections.abc import Mapping
+from typing import Any, cast
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import BaseCache
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+# Cache key prefix for token buckets
+BUCKET_PREFIX = "throttle"
+
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return tostring(wait)
+"""
+
+_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Fallback bucket lock: held for one get + set, expires on its own if its holder dies
+LOCK_TIMEOUT = 2
+LOCK_WAIT = 0.2
+LOCK_POLL = 0.005
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """``"10/min"`` -> ``(10, 60)``, as in DRF's ``SimpleRateThrottle``."""
+    num, period = rate.split("/")
+    return int(num), _PERIODS[period[0]]
+
+
+def _shared_backend() -> BaseCache:
+    # TieredCache exposes its shared tier; buckets must never be served from L1
+    return getattr(cache, "l2", cache)
+
+
+def take(key: str, capacity: int, period: int) -> float:
+    """
+    Take one token from the bucket at ``key``. Returns 0 when allowed, otherwise the
+    seconds until a token is available.
+    """
+    backend = _shared_backend()
+    client_factory = getattr(getattr(backend, "_cache", None), "get_client", None)
+    if client_factory is not None:
+        full_key = backend.make_and_validate_key(key)
+        client = client_factory(full_key, write=True)
+        return float(client.eval(_TAKE_SCRIPT, 1, full_key, capacity, capacity / period))
+
+    return _take_locked(backend, key, capacity, period)
+
+
+def _take_locked(backend: BaseCache, key: str, capacity: int, period: int) -> float:
+    """
+    The Lua script's bucket for backends without scripting: ``add`` is atomic on every
+    Django backend, so it serializes the read-modify-write of ``(tokens, timestamp)``.
+    A request that cannot get the lock within ``LOCK_WAIT`` is rejected, not let through.
+    """
+    rate = capacity / period
+    lock_key = f"{key}:lock"
+    deadline = time.monotonic() + LOCK_WAIT
+    while not backend.add(lock_key, 1, timeout=LOCK_TIMEOUT):
+        if time.monotonic() >= deadline:
+            return float(LOCK_TIMEOUT)
+        time.sleep(LOCK_POLL)
+
+    try:
+        now = time.time()
+        tokens, last = backend.get(key) or (float(capacity), now)
+        tokens = min(capacity, tokens + max(now - last, 0) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        # An untouched bucket is full again after one period, so it may expire then
+        backend.set(key, (tokens, now), timeout=period)
+    finally:
+        backend.delete(lock_key)
+    return wait
+
+
+def get_rate(scope: str, kind: str) -> tuple[int, int] | None:
+    """The ``<scope>_<kind>`` entry of ``DEFAULT_THROTTLE_RATES``, parsed; ``None`` when unset."""
+    rates = cast("dict[str, str | None]", api_settings.DEFAULT_THROTTLE_RATES)
+    rate = rates.get(f"{scope}_{kind}")
+    return parse_rate(rate) if rate else None
+
+
+def email_ident(email: Any) -> str | None:  # noqa: ANN401
+    if not isinstance(email, str) or not email.strip():
+        return None
+    return hashlib.sha256(email.strip().lower().encode()).hexdigest()[:32]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Base class; subclasses pick the identity (``kind``). The scope comes from the view's
+    ``throttle_scope``, like DRF's ``ScopedRateThrottle``.
+    """
+
+    kind: str = ""
+
+    def __init__(self) -> None:
+        self._wait = 0.0
+
+    def get_rate(self, view: Any) -> tuple[int, int] | None:  # noqa: ANN401
+        scope = getattr(view, "throttle_scope", None)
+        return get_rate(scope, self.kind) if scope else None
+
+    def get_ident_value(self, request: Request) -> str | None:
+        raise NotImplementedError
+
+    def allow_request(self, request: Request, view: Any) -> bool:  # noqa: ANN401
+        if not settings.THROTTLING_ENABLED:
+            return True
+
+        rate = self.get_rate(view)
+        ident = self.get_ident_value(request)
+        if rate is None or ident is None:
+            return True
+
+        self._wait = take(f"{BUCKET_PREFIX}:{view.throttle_scope}:{self.kind}:{ident}", *rate)
+        return self._wait == 0
+
+    def wait(self) -> float | None:
+        return math.ceil(self._wait) if self._wait else None
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    kind = "ip"
+
+    def get_ident_value(self, request: Request) -> str | None:
+        return self.get_ident(request)
+
+
+class EmailTokenBucketThrottle(TokenBucketThrottle):
+    kind = "email"
+
+    def get_ident_value(self, request: Request) -> str | None:
+        data = request.data
+        return email_ident(data.get("email") if isinstance(data, Mapping) else None)
+
+
+def throttle_wait(request: Any, scope: str, email: Any) -> float:  # noqa: ANN401
+    """
+    Take from the IP and email buckets of ``scope`` for a plain Django request (used by
+    the native async views, which bypass DRF). Returns 0 when allowed, else the wait.
+    """
+    if not settings.THROTTLING_ENABLED:
+        return 0.0
+
+    idents = {"ip": BaseThrottle().get_ident(request), "email": email_ident(email)}
+    waits = [0.0]
+    for kind, ident in idents.items():
+        rate = get_rate(scope, kind)
+        if rate and ident:
+            waits.append(take(f"{BUCKET_PREFIX}:{scope}:{kind}:{ident}", *rate))
+    return max(waits)
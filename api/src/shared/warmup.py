@@ -0,0 +1,127 @@
+"""
+Boot-time warmup of the structures Django and DRF otherwise build on the first request.
+
+``config.wsgi``, ``config.asgi`` (under gunicorn ``--preload``) and the Celery parent
+(``worker_init``) call ``warmup()`` once, before workers fork, so every worker inherits
+compiled URL patterns, populated model and serializer metadata, the OpenAPI schema and the
+password validator list (including the common-password list) copy-on-write instead of
+building them on the first request it serves.
+
+Warmup never leaves a database connection, thread or socket open across the fork. Each
+worker logs how long after it was forked (or booted, when it never forked) it started its
+first request (or task), so workers respawned long after boot report meaningful times.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable
+from functools import cache
+from typing import Any
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# When this process started: the boot, or the fork that made it a worker
+_process_started: float = time.monotonic()
+_first_signal: Any = None
+
+
+def _forked() -> None:
+    global _process_started
+
+    _process_started = time.monotonic()
+
+
+os.register_at_fork(after_in_child=_forked)
+
+
+def _prime_urls() -> None:
+    from django.urls import get_resolver
+
+    resolver = get_resolver()
+    # Imports every view module and compiles every pattern of the resolver tree
+    resolver.reverse_dict  # noqa: B018
+    resolver.app_dict  # noqa: B018
+
+
+def _subclasses(cls: type) -> Iterable[type]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def _prime_serializers() -> None:
+    from rest_framework.serializers import ListSerializer, Serializer
+
+    for serializer_class in set(_subclasses(Serializer)):
+        if not serializer_class.__module__.startswith("src.") or issubclass(serializer_class, ListSerializer):
+            continue
+        try:
+            # Fills the model _meta caches and lazy imports behind field construction
+            serializer_class().fields  # noqa: B018
+        except Exception:  # noqa: BLE001
+            logger.debug("Skipped warming %s.", serializer_class.__qualname__, exc_info=True)
+
+
+@cache
+def openapi_schema() -> dict[str, Any]:
+    """
+    The public OpenAPI schema, generated once per process: it only changes with a deploy.
+    """
+    from drf_spectacular.generators import SchemaGenerator
+
+    return SchemaGenerator().get_schema(request=None, public=True)
+
+
+def _prime_password_validators() -> None:
+    from django.contrib.auth.hashers import get_hashers
+    from django.contrib.auth.password_validation import get_default_password_validators
+
+    get_default_password_validators()
+    get_hashers()
+
+
+STEPS: dict[str, Callable[[], Any]] = {
+    "urls": _prime_urls,
+    "serializers": _prime_serializers,
+    "schema": openapi_schema,
+    "password_validators": _prime_password_validators,
+}
+
+
+def _report_first(**kwargs: Any) -> None:  # noqa: ANN401
+    _first_signal.disconnect(dispatch_uid="warmup_report_first")
+    elapsed = time.monotonic() - _process_started
+    logger.info("Worker %s started its first request %.3fs after its fork or boot.", os.getpid(), elapsed)
+
+
+def warmup(boot_started: float, steps: Iterable[str] = STEPS, first_signal: Any = request_started) -> None:  # noqa: ANN401
+    """
+    Run the warmup ``steps`` and report, per worker, the time from ``boot_started`` (a
+    ``time.monotonic()`` reading), or from the fork that created the worker, to the first
+    ``first_signal``.
+    """
+    global _process_started, _first_signal
+
+    _process_started, _first_signal = boot_started, first_signal
+    first_signal.connect(_report_first, weak=False, dispatch_uid="warmup_report_first")
+    if not settings.WARMUP_ENABLED:
+        return
+
+    timings: list[str] = []
+    for name in steps:
+        started = time.monotonic()
+        try:
+            STEPS[name]()
+        except Exception:
+            logger.exception("Warmup step %s failed; it will run on first use instead.", name)
+            continue
+        timings.append(f"{name}={time.monotonic() - started:.3f}s")
+
+    # Nothing opened here may be shared with the forked workers
+    connections.close_all()
+    logger.info("Warmed up in %.3fs after boot (%s).", time.monotonic() - boot_started, ", ".join(timings))
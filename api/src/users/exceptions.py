@@ -1,5 +1,6 @@
 from django.utils.functional import Promise
 from django.utils.translation import gettext_lazy as _
+from rest_framework import status
 
 from src.shared.exceptions import CustomAPIException
 
@@ -60,3 +61,32 @@ class EmailValidationError(CustomAPIException):
 
     default_code = "email_validation_error"
     default_detail = _("New email must be different from the current email.")
+
+
+class EmailAlreadyExistsError(CustomAPIException):
+    """
+    Raised when the email is already registered (case-insensitive).
+    """
+
+    status_code = status.HTTP_409_CONFLICT
+    default_code = "email_already_exists"
+    default_detail = _("A user with this email already exists.")
+
+
+class AvatarInvalidError(CustomAPIException):
+    """
+    Raised when the uploaded avatar is not a supported image type.
+    """
+
+    default_code = "invalid_avatar"
+    default_detail = _("Unsupported avatar format. Use JPEG, PNG or WebP.")
+
+
+class AvatarTooLargeError(CustomAPIException):
+    """
+    Raised when the uploaded avatar exceeds the size limit.
+    """
+
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_code = "avatar_too_large"
+    default_detail = _("The avatar file is too large.")
@@ -0,0 +1,210 @@
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
+
+import django
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from src.users.exceptions import InvalidEmailError, RequiredFieldError
+from src.users.models import Profile
+
+User = get_user_model()
+
+
+def _init_hasher() -> None:
+    # Spawned children (non-fork start methods) need Django configured before hashing
+    if not apps.ready:
+        django.setup()
+
+
+def _hash_passwords(passwords: list[str | None]) -> list[str]:
+    return [make_password(password) for password in passwords]
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import users and profiles from CSV or JSONL using PostgreSQL COPY. "
+        "Columns: email, password or password_hash, first_name, last_name, phone_number."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("input", help="CSV/JSONL file path, or '-' for stdin.")
+        parser.add_argument("--format", choices=["csv", "jsonl"], dest="fmt", help="Defaults to the file extension.")
+        parser.add_argument("--chunk-size", type=int, default=settings.USERS_IMPORT_CHUNK_SIZE)
+        parser.add_argument("--workers", type=int, default=settings.USERS_BULK_HASH_WORKERS)
+        parser.add_argument(
+            "--checkpoint",
+            help="File recording how many input rows were committed (default: <input>.checkpoint).",
+        )
+        parser.add_argument("--resume", action="store_true", help="Skip rows recorded in the checkpoint file.")
+        parser.add_argument("--errors", help="Write rejected rows as JSONL to this file (default: stderr).")
+
+    def handle(self, *args: Any, **options: Any) -> None:  # noqa: ANN401
+        if connection.vendor != "postgresql":
+            error = "import_users requires PostgreSQL (COPY)."
+            raise CommandError(error)
+
+        source = options["input"]
+        fmt = options["fmt"] or ("jsonl" if source.endswith((".jsonl", ".ndjson")) else "csv")
+        checkpoint = Path(options["checkpoint"] or f"{source}.checkpoint") if source != "-" else None
+        skip = int(checkpoint.read_text()) if options["resume"] and checkpoint and checkpoint.exists() else 0
+
+        started = time.monotonic()
+        processed = skip
+        imported = 0
+        with ExitStack() as files:
+            errors_out: IO[str] = files.enter_context(open(options["errors"], "a")) if options["errors"] else sys.stderr
+            stream: IO[str] = sys.stdin if source == "-" else files.enter_context(open(source, newline=""))
+
+            rows = islice(self._read_rows(stream, fmt), skip, None)
+            with ProcessPoolExecutor(max_workers=options["workers"], initializer=_init_hasher) as pool:
+                while chunk := list(islice(rows, options["chunk_size"])):
+                    chunk_started = time.monotonic()
+                    valid, rejected = self._prepare_chunk(chunk, pool, options["workers"])
+                    with transaction.atomic():
+                        self._copy_chunk(valid)
+
+                    processed += len(chunk)
+                    imported += len(valid)
+                    if checkpoint:
+                        checkpoint.write_text(str(processed))
+                    for row, reason in rejected:
+                        errors_out.write(json.dumps({"row": row, "error": reason}) + "\n")
+
+                    rate = len(chunk) / max(time.monotonic() - chunk_started, 1e-6)
+                    self.stdout.write(f"📥 {processed} rows read, {imported} imported ({rate:,.0f} rows/s)")
+
+        elapsed = time.monotonic() - started
+        total_rate = (processed - skip) / max(elapsed, 1e-6)
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Imported {imported} users in {elapsed:.1f}s ({total_rate:,.0f} rows/s)")
+        )
+
+    # ============================== Input ==============================
+    @staticmethod
+    def _read_rows(stream: IO[str], fmt: str) -> Iterator[dict[str, Any]]:
+        if fmt == "csv":
+            yield from csv.DictReader(stream)
+            return
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+    # ============================== Validation & hashing ==============================
+    def _prepare_chunk(
+        self,
+        chunk: list[dict[str, Any]],
+        pool: ProcessPoolExecutor,
+        workers: int,
+    ) -> tuple[list[dict[str, Any]], list[tuple[dict[str, Any], str]]]:
+        valid: list[dict[str, Any]] = []
+        rejected: list[tuple[dict[str, Any], str]] = []
+        seen: set[str] = set()
+
+        for row in chunk:
+            try:
+                email = User.objects.clean_email(row.get("email"))  # type: ignore[attr-defined]
+            except (InvalidEmailError, RequiredFieldError) as exc:
+                rejected.append((row, str(exc.detail)))
+                continue
+
+            if email.lower() in seen:
+                rejected.append((row, "duplicated email in input"))
+                continue
+
+            password_hash = row.get("password_hash")
+            if password_hash:
+                try:
+                    identify_hasher(password_hash)
+                except ValueError:
+                    rejected.append((row, "unknown password hash format"))
+                    continue
+
+            seen.add(email.lower())
+            valid.append({**row, "email": email})
+
+        existing = self._existing_emails(seen)
+        rejected.extend((row, "email already exists") for row in valid if row["email"].lower() in existing)
+        valid = [row for row in valid if row["email"].lower() not in existing]
+
+        # Hash raw passwords in parallel processes; pre-hashed rows are passed through
+        to_hash = [index for index, row in enumerate(valid) if not row.get("password_hash")]
+        batch = max(1, len(to_hash) // max(workers, 1) + 1)
+        slices = [to_hash[start : start + batch] for start in range(0, len(to_hash), batch)]
+        for indexes, hashes in zip(
+            slices,
+            pool.map(_hash_passwords, [[valid[i].get("password") or None for i in part] for part in slices]),
+            strict=True,
+        ):
+            for index, hashed in zip(indexes, hashes, strict=True):
+                valid[index]["password_hash"] = hashed
+
+        return valid, rejected
+
+    @staticmethod
+    def _existing_emails(emails: set[str]) -> set[str]:
+        return set(
+            User.objects.annotate(email_lower=Lower("email"))
+            .filter(email_lower__in=list(emails))
+            .values_list("email_lower", flat=True)
+        )
+
+    # ============================== COPY ==============================
+    @staticmethod
+    def _copy_chunk(rows: list[dict[str, Any]]) -> None:
+        """
+        Reserve ids from the users sequence, then COPY users and profiles. Reserving ids
+        up front is what lets profiles reference users without a RETURNING round trip.
+        """
+        if not rows:
+            return
+
+        user_table = User._meta.db_table  # Noqa
+        profile_table = Profile._meta.db_table  # Noqa
+        now = timezone.now()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                [user_table, len(rows)],
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+
+            raw = cursor.cursor
+            with raw.copy(
+                f"COPY {user_table} (id, password, is_superuser, email, is_active, is_staff, created_at, updated_at) "
+                "FROM STDIN"
+            ) as copy:
+                for user_id, row in zip(ids, rows, strict=True):
+                    copy.write_row((user_id, row["password_hash"], False, row["email"], True, False, now, now))
+
+            with raw.copy(
+                f"COPY {profile_table} (user_id, first_name, last_name, phone_number, avatar_variants, "
+                "created_at, updated_at) FROM STDIN"
+            ) as copy:
+                for user_id, row in zip(ids, rows, strict=True):
+                    copy.write_row(
+                        (
+                            user_id,
+                            row.get("first_name") or "",
+                            row.get("last_name") or "",
+                            row.get("phone_number") or None,
+                            "{}",
+                            now,
+                            now,
+                        )
+                    )
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.10 on 2026-10-18 10:05
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+def check_case_variant_duplicates(apps, schema_editor):
+    # The unique index cannot be built while two accounts differ only in email case;
+    # which one to keep is a product decision, so list them instead of guessing.
+    User = apps.get_model('users', 'User')
+    duplicates = list(
+        User.objects.annotate(email_lower=django.db.models.functions.text.Lower('email'))
+        .values('email_lower')
+        .annotate(accounts=models.Count('id'))
+        .filter(accounts__gt=1)
+        .order_by('email_lower')
+        .values_list('email_lower', flat=True)[:50]
+    )
+    if duplicates:
+        raise RuntimeError(
+            'Cannot add users_user_email_lower_uniq: these emails belong to more than one '
+            f'account in different letter cases: {", ".join(duplicates)}. '
+            'Merge or rename those accounts, then run the migration again.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_users_user_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_variant_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='users_user_email_lower_uniq'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.10 on 2026-10-18 20:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('users', '0004_profile_avatar_variants'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.TrigramExtension(),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_staff', True)), fields=['-created_at', '-id'], name='users_user_staff_idx'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['-created_at', '-id'], name='users_user_inactive_idx'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), name='users_user_email_trgm'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='profile',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('first_name'), name='gin_trgm_ops'), name='users_profile_first_name_trgm'),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='profile',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('last_name'), name='gin_trgm_ops'), name='users_profile_last_name_trgm'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.10 on 2026-10-18 20:40
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('users', '0005_user_search_indexes'),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_superuser', True)), fields=['-created_at', '-id'], name='users_user_superuser_idx'),
+        ),
+    ]
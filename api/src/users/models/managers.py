@@ -1,9 +1,18 @@
-from typing import TypeVar
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
 
 from django.apps import apps
+from django.conf import settings
 from django.contrib.auth.base_user import BaseUserManager
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models import Value
+from django.db.models.functions import Lower
+from django.utils.translation import gettext_lazy as _
 
 from src.users.exceptions import InvalidEmailError, RequiredFieldError
 
@@ -17,9 +26,9 @@ class UserManager(BaseUserManager[UserT]):
 
     use_in_migrations = True
 
-    def create_user(self, email: str, password: str | None = None, **extra_fields: object) -> UserT:
+    def clean_email(self, email: str | None) -> str:
         """
-        Create and return a new user with the given email and password.
+        Validate and normalize an email address using the rules shared by every creation path.
         """
         if not email:
             user_model = apps.get_model("users", "User")
@@ -33,14 +42,147 @@ class UserManager(BaseUserManager[UserT]):
         except ValidationError as err:
             raise InvalidEmailError from err
 
-        email = self.normalize_email(email)
+        return self.normalize_email(email)
+
+    def create_user(
+        self,
+        email: str,
+        password: str | None = None,
+        *,
+        lazy_profile: bool = False,
+        profile_fields: dict[str, Any] | None = None,
+        **extra_fields: object,
+    ) -> UserT:
+        """
+        Create and return a new user with the given email and password, and its profile in
+        the same transaction.
+
+        With ``lazy_profile`` only the user row is inserted (one round trip instead of two);
+        the profile is materialized on first use by ``User.get_profile``.
+        """
+        email = self.clean_email(email)
         user: UserT = self.model(email=email, **extra_fields)  # type: ignore[arg-type]
         user.set_password(password)
-        user.save(using=self._db)
+
+        with transaction.atomic(using=self._db):
+            user.save(using=self._db)
+            if not lazy_profile:
+                profile_model = apps.get_model("users", "Profile")
+                user.profile = profile_model.objects.using(self._db).create(  # type: ignore[attr-defined]
+                    user=user,
+                    **{"first_name": "", "last_name": "", **(profile_fields or {})},
+                )
 
         return user
 
-    def create_superuser(self, email: str, password: str, **extra_fields: object) -> UserT:
+    def bulk_create_users(
+        self,
+        rows: Sequence[dict[str, Any]],
+        batch_size: int | None = None,
+    ) -> tuple[list[UserT], dict[int, dict[str, list[str]]]]:
+        """
+        Create many users and their profiles without per-row round trips.
+
+        Every row is validated independently, passwords are hashed in a thread pool
+        (PBKDF2 releases the GIL) and users/profiles are inserted with one ``bulk_create``
+        each, inside one transaction.
+
+        Returns the created users and a mapping of row index to field errors; invalid
+        rows are reported and skipped instead of aborting the whole batch.
+        """
+        errors: dict[int, dict[str, list[str]]] = {}
+        pending: dict[int, dict[str, Any]] = {}
+        seen: set[str] = set()
+
+        for index, row in enumerate(rows):
+            row_errors = self._validate_bulk_row(row)
+            if not row_errors:
+                email = self.normalize_email(row["email"])
+                if email.lower() in seen:
+                    row_errors = {"email": [str(_("Duplicated email in batch."))]}
+                else:
+                    seen.add(email.lower())
+                    pending[index] = {**row, "email": email}
+            if row_errors:
+                errors[index] = row_errors
+
+        self._reject_existing_emails(pending, errors)
+        if not pending:
+            return [], errors
+
+        passwords = [row.get("password") for row in pending.values()]
+        with ThreadPoolExecutor(max_workers=settings.USERS_BULK_HASH_WORKERS) as executor:
+            hashes = list(executor.map(make_password, passwords))
+
+        users: list[UserT] = [
+            self.model(email=row["email"], password=hashed)  # type: ignore[arg-type]
+            for row, hashed in zip(pending.values(), hashes, strict=True)
+        ]
+
+        profile_model = apps.get_model("users", "Profile")
+        try:
+            with transaction.atomic(using=self.db):
+                created: list[UserT] = self.bulk_create(users, batch_size=batch_size)
+                profile_model.objects.using(self.db).bulk_create(
+                    [
+                        profile_model(
+                            user=user,
+                            first_name=row.get("first_name", ""),
+                            last_name=row.get("last_name", ""),
+                        )
+                        for user, row in zip(created, pending.values(), strict=True)
+                    ],
+                    batch_size=batch_size,
+                )
+        except IntegrityError:
+            # A concurrent request inserted one of the emails after the pre-check.
+            # Re-check and retry with only the rows that are still free.
+            self._reject_existing_emails(pending, errors)
+            retry_rows = [{**row, "_index": index} for index, row in pending.items()]
+            if len(retry_rows) == len(users):
+                raise
+            created, retry_errors = self.bulk_create_users(retry_rows, batch_size=batch_size)
+            for retry_index, row_errors in retry_errors.items():
+                errors[retry_rows[retry_index]["_index"]] = row_errors
+
+        return created, dict(sorted(errors.items()))
+
+    def _validate_bulk_row(self, row: dict[str, Any]) -> dict[str, list[str]]:
+        try:
+            email = self.clean_email(row.get("email"))
+        except (InvalidEmailError, RequiredFieldError) as exc:
+            detail = exc.detail
+            if isinstance(detail, dict):
+                return {field: [str(message)] for field, message in detail.items()}
+            return {"email": [str(detail)]}
+
+        password = row.get("password")
+        if password:
+            try:
+                validate_password(password, user=self.model(email=email))
+            except ValidationError as exc:
+                return {"password": list(exc.messages)}
+        return {}
+
+    def _reject_existing_emails(
+        self,
+        pending: dict[int, dict[str, Any]],
+        errors: dict[int, dict[str, list[str]]],
+    ) -> None:
+        if not pending:
+            return
+
+        lowered = [row["email"].lower() for row in pending.values()]
+        existing = set(
+            self.annotate(email_lower=Lower("email"))
+            .filter(email_lower__in=lowered)
+            .values_list("email_lower", flat=True)
+        )
+        for index in [index for index, row in pending.items() if row["email"].lower() in existing]:
+            errors[index] = {"email": [str(_("User with this email already exists."))]}
+            del pending[index]
+
+    def create_superuser(self, email: str, password: str, **extra_fields: Any) -> UserT:  # noqa: ANN401
         """
         Create and return a new superuser with the given email and password.
         """
@@ -52,5 +194,14 @@ class UserManager(BaseUserManager[UserT]):
     def get_by_natural_key(self, email: str) -> UserT:  # type: ignore
         """
         Get user by email (natural key for authentication).
+
+        Compares ``LOWER(email)`` so the lookup is answered by the functional unique
+        index instead of the sequential scan ``email__iexact`` (``UPPER(...)``) causes.
+        """
+        return self.alias(email_lower=Lower("email")).get(email_lower=Lower(Value(email)))
+
+    def email_exists(self, email: str) -> bool:
+        """
+        Case-insensitive existence check served by the ``Lower("email")`` unique index.
         """
-        return self.get(email__iexact=email)
+        return self.alias(email_lower=Lower("email")).filter(email_lower=Lower(Value(email))).exists()
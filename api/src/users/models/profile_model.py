@@ -1,9 +1,26 @@
-from django.db import models
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, cast
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models, transaction
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from src.users.models.user_model import User
+from src.users.utils.avatar import pick_variant
 from src.users.utils.storage_path import avatar_dir_path
 
+if TYPE_CHECKING:
+    from celery import Task
+
+# Stands for the stored avatar name while the field is deferred and has not been loaded
+_DEFERRED = object()
+
+
+def _file_name(value: object) -> str | None:
+    name = getattr(value, "name", value)
+    return str(name) if name else None
+
 
 class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile", verbose_name=_("User"))
@@ -11,8 +28,57 @@ class Profile(models.Model):
     last_name = models.CharField(max_length=100, verbose_name=_("Last Name"))
     phone_number = models.CharField(max_length=20, blank=True, null=True, verbose_name=_("Phone number"))
     avatar = models.ImageField(upload_to=avatar_dir_path, blank=True, null=True, verbose_name=_("Avatar"))
+    avatar_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name=_("Avatar variants"))
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [  # noqa: RUF012
+            # Substring search on names (see src.users.utils.search)
+            GinIndex(OpClass(Upper("first_name"), name="gin_trgm_ops"), name="users_profile_first_name_trgm"),
+            GinIndex(OpClass(Upper("last_name"), name="gin_trgm_ops"), name="users_profile_last_name_trgm"),
+        ]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        # Read the raw attribute: going through the descriptor would load a deferred avatar,
+        # one query per instance
+        self._loaded_avatar: object = _file_name(self.__dict__["avatar"]) if "avatar" in self.__dict__ else _DEFERRED
+
+    def refresh_from_db(self, using: str | None = None, fields: Sequence[str] | None = None) -> None:
+        super().refresh_from_db(using, fields)
+        if fields is None or "avatar" in fields:
+            self._loaded_avatar = _file_name(self.__dict__.get("avatar"))
+
     def __str__(self) -> str:
         return f"{self.first_name} {self.last_name}"
+
+    def save(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """
+        Save the profile and, when the avatar changed, queue variant generation once the
+        transaction commits. The upload itself is never decoded in the web worker.
+        """
+        # A deferred avatar that was never touched is unchanged
+        avatar_changed = "avatar" in self.__dict__ and _file_name(self.avatar) != self._loaded_avatar
+        if avatar_changed:
+            self.avatar_variants = {}
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "avatar" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "avatar_variants"}
+
+        super().save(*args, **kwargs)
+        if "avatar" in self.__dict__:
+            self._loaded_avatar = _file_name(self.avatar)
+
+        if avatar_changed and self.avatar:
+            from src.users.tasks import process_avatar
+
+            profile_id, avatar_name = self.pk, self.avatar.name
+            transaction.on_commit(lambda: cast("Task", process_avatar).delay(profile_id, avatar_name))
+
+    def avatar_variant_path(self, size: int, fmt: str = "webp") -> str | None:
+        """
+        Storage path of the smallest variant that covers ``size`` px, or the original
+        upload while variants are still being generated.
+        """
+        return pick_variant(self.avatar_variants, size, fmt) or (self.avatar.name if self.avatar else None)
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower, Upper
 from django.utils.translation import gettext_lazy as _
 
 from src.users.models.managers import UserManager
 
+if TYPE_CHECKING:
+    from src.users.models.profile_model import Profile
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     """
@@ -24,8 +33,40 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     objects = UserManager()
 
+    class Meta:
+        indexes = [  # noqa: RUF012
+            # Backs keyset pagination on (created_at, id), see src.shared.pagination.
+            models.Index(fields=["-created_at", "-id"], name="users_user_created_id_idx"),
+            # Keyset order within the rare filtered slices (see src.users.utils.search)
+            models.Index(fields=["-created_at", "-id"], condition=Q(is_staff=True), name="users_user_staff_idx"),
+            models.Index(fields=["-created_at", "-id"], condition=Q(is_active=False), name="users_user_inactive_idx"),
+            models.Index(
+                fields=["-created_at", "-id"], condition=Q(is_superuser=True), name="users_user_superuser_idx"
+            ),
+            # Substring search: icontains runs as UPPER(email) LIKE, served by pg_trgm
+            GinIndex(OpClass(Upper("email"), name="gin_trgm_ops"), name="users_user_email_trgm"),
+        ]
+        constraints = [  # noqa: RUF012
+            # Case-insensitive uniqueness; also the index behind login lookups
+            models.UniqueConstraint(Lower("email"), name="users_user_email_lower_uniq"),
+        ]
+
     def __str__(self) -> str:
         """
         Return the string representation of the user.
         """
         return self.email
+
+    def get_profile(self) -> Profile:
+        """
+        Return the user's profile, creating it on first use for users created with
+        ``lazy_profile`` (signups) or outside ``UserManager`` (fixtures, admin).
+        """
+        try:
+            return self.profile  # type: ignore[attr-defined]
+        except ObjectDoesNotExist:
+            from src.users.models.profile_model import Profile
+
+            profile, _ = Profile.objects.get_or_create(user=self, defaults={"first_name": "", "last_name": ""})
+            self.profile = profile
+            return profile
@@ -1,14 +1,18 @@
 from typing import Any, ClassVar
 
+from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.files.uploadedfile import UploadedFile
 from django.core.validators import validate_email
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
+from src.identity.authentication import invalidate_user
+from src.identity.revocation import revoke_user_tokens
 from src.users import exceptions
-from src.users.models import User
+from src.users.models import Profile, User
 
 
 class BaseUserSerializer(serializers.ModelSerializer):
@@ -36,6 +40,13 @@ class UserCreateSerializer(BaseUserSerializer):
 
     class Meta(BaseUserSerializer.Meta):
         fields: ClassVar[list[str]] = [*BaseUserSerializer.Meta.fields, "password"]
+        # The default UniqueValidator is case-sensitive; validate_email checks the Lower(email) index instead
+        extra_kwargs: ClassVar[dict[str, dict[str, list]]] = {"email": {"validators": []}}
+
+    def validate_email(self, value: str) -> str:
+        if User.objects.email_exists(value):  # type: ignore[attr-defined]
+            raise exceptions.EmailAlreadyExistsError
+        return value
 
     def validate_password(self, value: str) -> str:
         try:
@@ -45,7 +56,43 @@ class UserCreateSerializer(BaseUserSerializer):
         return value
 
     def create(self, validated_data: dict[str, str]) -> User:
-        return self.Meta.model.objects.create_user(**validated_data)  # type: ignore[attr-defined]
+        # Most signups never touch the profile; it is created on first use
+        return self.Meta.model.objects.create_user(**validated_data, lazy_profile=True)  # type: ignore[attr-defined]
+
+
+class UserBulkCreateRowSerializer(serializers.Serializer):
+    """
+    Shape of a single bulk-creation row. Only structural checks run here; the per-row
+    business rules (email format, uniqueness, password validators) run in
+    ``UserManager.bulk_create_users`` so one bad row cannot abort the batch.
+    """
+
+    email = serializers.CharField(required=False, allow_blank=True, label=_("Email"))
+    password = serializers.CharField(
+        required=False,
+        write_only=True,
+        label=_("Password"),
+        style={"input_type": "password"},
+    )
+    first_name = serializers.CharField(required=False, allow_blank=True, max_length=100, label=_("First Name"))
+    last_name = serializers.CharField(required=False, allow_blank=True, max_length=100, label=_("Last Name"))
+
+
+class UserBulkCreateSerializer(serializers.Serializer):
+    users = UserBulkCreateRowSerializer(many=True, allow_empty=False)
+
+    def validate_users(self, value: list[dict[str, str]]) -> list[dict[str, str]]:
+        if len(value) > settings.USERS_BULK_CREATE_MAX_ROWS:
+            message = _("A batch may contain at most %(count)d users.") % {"count": settings.USERS_BULK_CREATE_MAX_ROWS}
+            raise ValidationError(message)
+        return value
+
+    def save(self, **kwargs: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+        created, errors = User.objects.bulk_create_users(self.validated_data["users"])  # type: ignore[attr-defined]
+        return {
+            "created": [{"id": user.id, "email": user.email} for user in created],
+            "errors": [{"index": index, "errors": row_errors} for index, row_errors in errors.items()],
+        }
 
 
 class UserListSerializer(BaseUserSerializer):
@@ -91,7 +138,10 @@ class PasswordChangeSerializer(serializers.Serializer):
     def save(self, **kwargs: dict[str, Any]) -> User:
         user: User = self.context["request"].user
         user.set_password(self.validated_data["new_password"])
-        user.save(update_fields=["password"])
+        user.save(update_fields=["password", "updated_at"])
+        invalidate_user(user.pk)
+        if settings.JWT_ROTATION_ENABLED:
+            revoke_user_tokens(user.pk)
         return user
 
 
@@ -119,10 +169,38 @@ class EmailChangeSerializer(serializers.Serializer):
         except DjangoValidationError as exc:
             raise ValidationError({"new_email": exc.messages}) from exc
 
+        if User.objects.email_exists(attrs["new_email"]):  # type: ignore[attr-defined]
+            raise exceptions.EmailAlreadyExistsError
+
         return attrs
 
     def save(self, **kwargs: dict[str, Any]) -> User:
         user: User = self.context["request"].user
         user.email = self.validated_data["new_email"]  # type: ignore
-        user.save(update_fields=["email"])
+        user.save(update_fields=["email", "updated_at"])
+        invalidate_user(user.pk)
+        if settings.JWT_ROTATION_ENABLED:
+            revoke_user_tokens(user.pk)
         return user
+
+
+class AvatarUploadSerializer(serializers.Serializer):
+    """
+    Accepts an avatar upload without decoding it: only the declared content type and
+    size are checked here, the image itself is processed by ``src.users.tasks.process_avatar``.
+    """
+
+    avatar = serializers.FileField(write_only=True, label=_("Avatar"))
+
+    def validate_avatar(self, value: UploadedFile) -> UploadedFile:
+        if value.content_type not in settings.AVATAR_ALLOWED_CONTENT_TYPES:
+            raise exceptions.AvatarInvalidError
+        if value.size is None or value.size > settings.AVATAR_MAX_UPLOAD_BYTES:
+            raise exceptions.AvatarTooLargeError
+        return value
+
+    def save(self, **kwargs: dict[str, Any]) -> Profile:
+        profile: Profile = self.context["request"].user.get_profile()
+        profile.avatar = self.validated_data["avatar"]  # type: ignore[assignment]
+        profile.save(update_fields=["avatar", "updated_at"])
+        return profile
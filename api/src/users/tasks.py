@@ -0,0 +1,45 @@
+import logging
+
+from celery import shared_task
+
+from src.users.models import Profile
+from src.users.utils.avatar import AvatarTooLargeError, AvatarUnreadableError, build_variants
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30, acks_late=True)
+def process_avatar(self, profile_id: int, avatar_name: str) -> dict[str, dict[str, str]]:  # noqa: ANN001
+    """
+    Generate resized avatar variants for a profile and record their storage paths.
+
+    ``avatar_name`` pins the upload that queued the task; if the user replaced the
+    avatar meanwhile, the stale run writes nothing.
+    """
+    profile = Profile.objects.filter(pk=profile_id).only("id", "avatar").first()
+    if profile is None or profile.avatar.name != avatar_name:
+        return {}
+
+    storage = profile.avatar.storage
+    try:
+        with storage.open(avatar_name, "rb") as source:
+            variants = build_variants(source, avatar_name, storage)
+    except AvatarTooLargeError:
+        logger.warning("Skipping avatar %s for profile %s: too large.", avatar_name, profile_id)
+        return {}
+    except AvatarUnreadableError:
+        # Uploads are only checked for their declared content type; retrying cannot fix the bytes
+        logger.warning("Skipping avatar %s for profile %s: not a readable image.", avatar_name, profile_id)
+        return {}
+    except OSError as exc:
+        raise self.retry(exc=exc) from exc
+
+    # Conditional UPDATE: only lands if the avatar is still the one we processed
+    updated = Profile.objects.filter(pk=profile_id, avatar=avatar_name).update(avatar_variants=variants)
+    if not updated:
+        # The avatar was replaced while we were processing; drop the orphaned files
+        for encodings in variants.values():
+            for name in encodings.values():
+                storage.delete(name)
+        return {}
+    return variants
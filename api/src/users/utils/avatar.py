@@ -0,0 +1,82 @@
+from io import BytesIO
+from pathlib import PurePosixPath
+from typing import IO, Any
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+
+# Pillow save() format names and file extensions for each variant encoding
+VARIANT_FORMATS: dict[str, tuple[str, str]] = {
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+}
+
+
+class AvatarTooLargeError(ValueError):
+    """Raised when an upload exceeds ``AVATAR_MAX_PIXELS`` (decompression bomb guard)."""
+
+
+class AvatarUnreadableError(ValueError):
+    """Raised when Pillow cannot identify the upload as an image."""
+
+
+def variant_name(original: str, size: int, fmt: str) -> str:
+    path = PurePosixPath(original)
+    return str(path.with_name(f"{path.stem}-{size}.{VARIANT_FORMATS[fmt][1]}"))
+
+
+def build_variants(source: IO[bytes], original_name: str, storage: Storage) -> dict[str, dict[str, str]]:
+    """
+    Decode ``source`` once and write downscaled, re-encoded variants to ``storage``.
+
+    Sizes are produced from largest to smallest, each derived from the previous one, so
+    peak memory is bounded by the largest variant rather than by the upload. JPEG
+    sources are decoded at reduced scale through ``Image.draft``.
+
+    Returns ``{"<size>": {"<format>": "<storage path>"}}``.
+    """
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    sizes = sorted(settings.AVATAR_VARIANT_SIZES, reverse=True)
+
+    try:
+        opened = Image.open(source)
+    except Image.DecompressionBombError as exc:
+        raise AvatarTooLargeError(str(exc)) from exc
+    except UnidentifiedImageError as exc:
+        raise AvatarUnreadableError(str(exc)) from exc
+
+    with opened as image:
+        width, height = image.size
+        if width * height > settings.AVATAR_MAX_PIXELS:
+            error = f"Avatar is {width}x{height}; the limit is {settings.AVATAR_MAX_PIXELS} pixels."
+            raise AvatarTooLargeError(error)
+
+        image.draft("RGB", (sizes[0], sizes[0]))
+        current: Any = (ImageOps.exif_transpose(image) or image).convert("RGB")
+
+    variants: dict[str, dict[str, str]] = {}
+    for size in sizes:
+        current.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        variants[str(size)] = {}
+        for fmt, (pil_format, _ext) in VARIANT_FORMATS.items():
+            buffer = BytesIO()
+            current.save(buffer, format=pil_format, quality=settings.AVATAR_QUALITY, optimize=True)
+            name = storage.save(variant_name(original_name, size, fmt), ContentFile(buffer.getvalue()))
+            variants[str(size)][fmt] = name
+    return variants
+
+
+def pick_variant(variants: dict[str, dict[str, str]], size: int, fmt: str) -> str | None:
+    """
+    Return the smallest variant at least ``size`` px wide (or the largest available),
+    preferring ``fmt`` and falling back to any other encoding.
+    """
+    if not variants:
+        return None
+
+    available = sorted(int(key) for key in variants)
+    chosen = next((candidate for candidate in available if candidate >= size), available[-1])
+    encodings = variants[str(chosen)]
+    return encodings.get(fmt) or next(iter(encodings.values()), None)
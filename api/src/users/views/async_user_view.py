@@ -0,0 +1,75 @@
+"""
+Native async implementations of the read endpoints of ``UserViewSet``.
+
+Served when the API runs under ASGI (``API_SERVER_MODE=asgi``, see ``config.urls_async``);
+writes on the same URLs are delegated to the regular DRF viewset.
+"""
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponseBase, JsonResponse
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from src.identity.authentication import aauthenticate
+from src.shared.conditional import not_modified, set_validators
+from src.shared.pagination import KeysetPagination
+from src.users.models import User
+from src.users.serializers import user_serializer
+from src.users.utils.search import UserFilterBackend
+from src.users.views.user_view import WINDOW_AGGREGATES, UserViewSet, page_validators, user_validators
+
+# DRF views used for the non-GET methods of the same routes
+_sync_list_view = UserViewSet.as_view({"get": "list", "post": "create"})
+_sync_detail_view = UserViewSet.as_view({"get": "retrieve"})
+
+
+def _error_response(exc: APIException) -> JsonResponse:
+    """The body DRF's exception handler renders for ``exc``."""
+    data = exc.detail if isinstance(exc.detail, list | dict) else {"detail": exc.detail}
+    return JsonResponse(data, status=exc.status_code, safe=False)
+
+
+async def user_list(request: HttpRequest) -> HttpResponseBase:
+    """Async keyset-paginated user list (GET); POST still creates through DRF."""
+    if request.method != "GET":
+        return await sync_to_async(_sync_list_view)(request)
+
+    try:
+        if await aauthenticate(request) is None:
+            return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+
+        queryset = UserFilterBackend().filter_queryset(request, User.objects.all(), None)
+        paginator = KeysetPagination()
+        window = await paginator.window_queryset(queryset, request).aaggregate(**WINDOW_AGGREGATES)
+        etag, last_modified = page_validators(window, request)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        page = await paginator.apaginate_queryset(queryset, request)
+    except APIException as exc:
+        return _error_response(exc)
+
+    data = user_serializer.UserListSerializer(page, many=True).data
+    return set_validators(JsonResponse({"next": paginator.get_next_link(), "results": data}), etag, last_modified)
+
+
+async def user_retrieve(request: HttpRequest, pk: int) -> HttpResponseBase:
+    """Async single-user retrieve (GET)."""
+    if request.method != "GET":
+        return await sync_to_async(_sync_detail_view)(request, pk=pk)
+
+    try:
+        if await aauthenticate(request) is None:
+            return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+    except APIException as exc:
+        return _error_response(exc)
+
+    user = await User.objects.filter(pk=pk).afirst()
+    if user is None:
+        return JsonResponse({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    etag, last_modified = user_validators(user.pk, user.updated_at)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+    return set_validators(JsonResponse(user_serializer.UserListSerializer(user).data), etag, last_modified)
@@ -1,16 +1,50 @@
-from typing import ClassVar
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, ClassVar
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Max, QuerySet, Sum
+from django.http import HttpRequest, HttpResponseBase, StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.permissions import AllowAny, BasePermission, IsAuthenticated
+from rest_framework.permissions import AllowAny, BasePermission, IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
 
+from src.shared.conditional import if_match_fails, not_modified, set_validators, weak_etag
+from src.shared.exceptions import NotFoundError, PreconditionFailedError, ValidationError
+from src.shared.pagination import KeysetPagination
+from src.shared.throttling import EmailTokenBucketThrottle, IPTokenBucketThrottle
+from src.users.models import Profile
 from src.users.serializers import user_serializer
+from src.users.utils.export import EXPORT_FORMATS, export_stream
+from src.users.utils.search import UserFilterBackend
 
 User = get_user_model()
 
+# Actions whose queryset the list filters narrow; get_object() must ignore ?is_active= etc.
+FILTERED_ACTIONS = frozenset({"list", "export"})
+
+# Aggregates over a keyset page window behind the list validators
+WINDOW_AGGREGATES = {"count": Count("id"), "ids": Sum("id"), "last_modified": Max("updated_at")}
+
+
+def user_validators(user_id: Any, updated_at: datetime) -> tuple[str, datetime]:  # noqa: ANN401
+    return weak_etag("user", user_id, updated_at.isoformat()), updated_at
+
+
+def page_validators(window: dict[str, Any], request: HttpRequest) -> tuple[str, datetime | None]:
+    """
+    Validators for one keyset page, from ``COUNT``/``SUM(id)``/``MAX(updated_at)`` over the
+    page window: edits bump the max, inserts and deletes change the count or the id sum.
+    """
+    etag = weak_etag("users", request.get_full_path(), window["count"], window["ids"], window["last_modified"])
+    return etag, window["last_modified"]
+
 
 class UserViewSet(
     mixins.CreateModelMixin,
@@ -19,36 +53,162 @@ class UserViewSet(
     viewsets.GenericViewSet,
 ):
     queryset = User.objects.all()
+    pagination_class = KeysetPagination
+    filter_backends = (UserFilterBackend,)
     permission_classes: ClassVar[list[type[BasePermission]]] = [IsAuthenticated]
+    throttle_scope = "signup"
 
     def get_permissions(self) -> list[BasePermission]:
         """Dynamically override permissions for specific actions."""
         if self.action == "create":
             return [AllowAny()]
+        if self.action in {"bulk_create", "export"}:
+            return [IsAdminUser()]
         return super().get_permissions()
 
+    def get_throttles(self) -> list[BaseThrottle]:
+        """Signup is anonymous and hashes a password, so it is rate limited before validation."""
+        if self.action == "create":
+            return [IPTokenBucketThrottle(), EmailTokenBucketThrottle()]
+        return super().get_throttles()
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        """Apply ``filter_backends`` to the collection actions only, never to a detail lookup."""
+        if self.action not in FILTERED_ACTIONS:
+            return queryset
+        return super().filter_queryset(queryset)
+
     def get_serializer_class(self) -> type:
         serializers_map = {
             "create": user_serializer.UserCreateSerializer,
+            "bulk_create": user_serializer.UserBulkCreateSerializer,
             "change_password": user_serializer.PasswordChangeSerializer,
             "change_email": user_serializer.EmailChangeSerializer,
+            "avatar": user_serializer.AvatarUploadSerializer,
         }
         return serializers_map.get(self.action, user_serializer.UserListSerializer)
 
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:  # noqa: ANN401
+        user = self.get_object()
+        etag, last_modified = user_validators(user.pk, user.updated_at)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        return set_validators(Response(self.get_serializer(user).data), etag, last_modified)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:  # noqa: ANN401
+        """
+        Keyset page of users. Validators come from an aggregate over the page window, so a
+        polling client that already has the page gets a 304 without any serialization.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        window = self.paginator.window_queryset(queryset, request).aggregate(**WINDOW_AGGREGATES)
+        etag, last_modified = page_validators(window, request)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+
+        page = self.paginate_queryset(queryset)
+        data = self.get_serializer(page, many=True).data
+        return set_validators(self.get_paginated_response(data), etag, last_modified)
+
+    def _check_if_match(self, request: Request) -> None:
+        """
+        Reject a change with 412 when ``If-Match`` does not match the user's current ETag.
+        Read from the database, not the JWT user cache, which may lag behind another worker,
+        and lock the row so no other write lands between this check and the caller's.
+        Must run inside a transaction.
+        """
+        if "If-Match" not in request.headers:
+            return
+        updated_at = (
+            User.objects.select_for_update().filter(pk=request.user.pk).values_list("updated_at", flat=True).first()
+        )
+        if updated_at is None or if_match_fails(request, user_validators(request.user.pk, updated_at)[0]):
+            raise PreconditionFailedError
+
     def _handle_action(
         self,
         request: Request,
         status_code: int = status.HTTP_204_NO_CONTENT,
+        *,
+        conditional: bool = False,
     ) -> Response:
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-        return Response({"detail": "OK"}, status=status_code)
+        with transaction.atomic() if conditional else nullcontext():
+            if conditional:
+                self._check_if_match(request)
+            instance = serializer.save()
+        response = Response({"detail": "OK"}, status=status_code)
+        if conditional:
+            set_validators(response, *user_validators(instance.pk, instance.updated_at))
+        return response
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = serializer.save()
+        status_code = status.HTTP_207_MULTI_STATUS if result["errors"] else status.HTTP_201_CREATED
+        return Response(result, status=status_code)
 
     @action(detail=True, methods=["post"], url_path="change-password")
     def change_password(self, request: Request, pk: int) -> Response:
-        return self._handle_action(request)
+        return self._handle_action(request, conditional=True)
 
     @action(detail=True, methods=["post"], url_path="change-email")
     def change_email(self, request: Request, pk: int) -> Response:
-        return self._handle_action(request)
+        return self._handle_action(request, conditional=True)
+
+    @action(detail=True, methods=["get", "post"], url_path="avatar")
+    def avatar(self, request: Request, pk: int) -> Response:
+        """
+        GET: URL of the smallest avatar variant covering ``?size=`` px (``?type=webp|jpeg``).
+        POST: upload a new avatar for the current user; variants are generated asynchronously.
+        """
+        if request.method == "POST":
+            self._handle_action(request)
+            return Response({"detail": "Accepted"}, status=status.HTTP_202_ACCEPTED)
+
+        profile = Profile.objects.filter(user_id=pk).only("avatar", "avatar_variants").first()
+        if profile is None or not profile.avatar:
+            raise NotFoundError
+
+        try:
+            size = int(request.query_params.get("size", max(settings.AVATAR_VARIANT_SIZES)))
+        except ValueError:
+            size = max(settings.AVATAR_VARIANT_SIZES)
+        fmt = request.query_params.get("type", "webp")
+
+        path = profile.avatar_variant_path(size, fmt)
+        return Response(
+            {
+                "url": profile.avatar.storage.url(path),
+                "processed": bool(profile.avatar_variants),
+            }
+        )
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request: Request) -> StreamingHttpResponse:
+        """
+        Stream every user (honouring the list filters) with its profile as NDJSON (default)
+        or CSV (``?type=csv``).
+        Output is gzipped on the fly when the client sends ``Accept-Encoding: gzip``.
+        """
+        fmt = request.query_params.get("type", "ndjson")
+        if fmt not in EXPORT_FORMATS:
+            message = _("Choose one of: %(formats)s.") % {"formats": ", ".join(EXPORT_FORMATS)}
+            raise ValidationError(detail={"type": message})
+        compress = "gzip" in request.headers.get("Accept-Encoding", "")
+
+        queryset = self.filter_queryset(User.objects.all())
+        response = StreamingHttpResponse(
+            export_stream(queryset, fmt, settings.USERS_EXPORT_CHUNK_SIZE, compress=compress),
+            content_type=EXPORT_FORMATS[fmt],
+        )
+        response["Content-Disposition"] = f'attachment; filename="users.{fmt}"'
+        if compress:
+            response["Content-Encoding"] = "gzip"
+        response["Vary"] = "Accept-Encoding"
+        return response
@@ -3,11 +3,15 @@ Test fixtures and configurations for Django backend tests.
 Generated by AI assistant to provide comprehensive test setup.
 """
 
+from collections.abc import Iterator
 from io import BytesIO
+from typing import Any
 
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 from PIL import Image
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework.test import APIClient
 
 
 @pytest.fixture
@@ -17,12 +21,57 @@ def user_data() -> dict[str, str]:
 
 
 @pytest.fixture
-def user():
+def user(user_data: dict[str, str]):
     """Test user instance - AI generated fixture"""
     from django.contrib.auth import get_user_model
 
-    data = user_data()
-    return get_user_model().objects.create_user(**data)  # type: ignore[attr-defined]
+    return get_user_model().objects.create_user(**user_data)  # type: ignore[attr-defined]
+
+
+@pytest.fixture(autouse=True, scope="session")
+def sync_last_login() -> Iterator[None]:
+    """
+    Write last_login inside the request, as LAST_LOGIN_MODE=sync does: the deferred buffer
+    flushes from its own thread and at exit, outside the test database
+    (tests/test_last_login.py covers it)
+    """
+    from django.contrib.auth.models import update_last_login
+    from django.contrib.auth.signals import user_logged_in
+
+    user_logged_in.disconnect(dispatch_uid="record_last_login")
+    user_logged_in.connect(update_last_login, dispatch_uid="update_last_login")
+    yield
+
+
+@pytest.fixture(autouse=True)
+def tiered_cache(settings: SettingsWrapper) -> Iterator[None]:
+    """Tiered cache over LocMemCache with the in-process invalidation bus"""
+    from django.core.cache import cache
+
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "src.shared.cache_backend.TieredCache",
+            "LOCATION": "test-invalidation",
+            "OPTIONS": {"L2": "shared", "INVALIDATION_BUS": "local"},
+        },
+        "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-shared"},
+    }
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def api_client() -> APIClient:
+    return APIClient()
+
+
+@pytest.fixture
+def auth_client(api_client: APIClient, user: Any) -> APIClient:  # noqa: ANN401
+    """API client authenticated with a real access token for ``user``"""
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return api_client
 
 
 @pytest.fixture
@@ -34,3 +83,11 @@ def fake_image():
     image_io.seek(0)
 
     return SimpleUploadedFile(name="test_image.jpg", content=image_io.getvalue(), content_type="image/jpeg")
+
+
+@pytest.fixture
+def query_budget():
+    """Enforce per-endpoint SQL query-count and query-plan budgets (see tests/query_budget.py)"""
+    from tests.query_budget import query_budget as budget
+
+    return budget
@@ -0,0 +1,150 @@
+"""
+Query-count and query-plan budgets for the API endpoints.
+
+Every DRF action of ``UserViewSet`` and every identity view declares the maximum number
+of SQL statements it may run. Budgets are independent of page size, so an N+1 (e.g. a
+profile field added to ``UserListSerializer``) fails as soon as a page has two rows.
+
+Usage in a test::
+
+    def test_list_budget(api_client, query_budget):
+        with query_budget("users-list", explain_tables={"users_user"}):
+            api_client.get("/api/users/?page_size=50")
+"""
+
+import json
+import time
+import traceback
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.db import connection, transaction
+
+# Worst case (cold JWT user cache) statements per view name
+QUERY_BUDGETS: dict[str, int] = {
+    # UserViewSet
+    "users-list": 3,  # user lookup + page validators aggregate + one keyset page (no page on 304)
+    "users-detail": 2,  # user lookup + row
+    "users-bulk-create": 4,  # user lookup + existing emails + users INSERT + profiles INSERT
+    "users-export": 2,  # user lookup + one server-side cursor
+    "users-avatar": 3,  # user lookup + profile + avatar UPDATE (GET: user lookup + profile)
+    "users-change-password": 3,  # user lookup + If-Match updated_at + UPDATE
+    "users-change-email": 4,  # user lookup + If-Match updated_at + email exists + UPDATE
+    "users-create": 2,  # email exists + users INSERT (profile is lazy)
+    # Identity views
+    "token_obtain_pair": 2,  # user lookup + last_login UPDATE (0 with LAST_LOGIN_MODE deferred)
+    "token_refresh": 0,
+}
+
+# Statements never counted against a budget
+IGNORED_TABLES: tuple[str, ...] = ("django_cache_table",)
+# Transaction control: tests run inside a transaction, so atomic() blocks emit savepoints
+# where production issues BEGIN/COMMIT outside the cursor
+IGNORED_PREFIXES: tuple[str, ...] = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+_PROJECT_ROOT = str(Path(settings.BASE_DIR))
+_THIS_FILE = str(Path(__file__))
+
+
+@dataclass
+class CapturedQuery:
+    sql: str
+    params: Any
+    duration_ms: float
+    stack: list[str] = field(default_factory=list)
+
+
+@dataclass
+class QueryRecorder:
+    queries: list[CapturedQuery] = field(default_factory=list)
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:  # noqa: ANN401, FBT001
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if not sql.startswith(IGNORED_PREFIXES) and not any(table in sql for table in IGNORED_TABLES):
+                self.queries.append(
+                    CapturedQuery(
+                        sql=sql,
+                        params=params,
+                        duration_ms=(time.perf_counter() - started) * 1000,
+                        stack=_project_stack(),
+                    )
+                )
+
+
+def _project_stack() -> list[str]:
+    """Stack frames from project code only, innermost last."""
+    return [
+        f"{frame.filename}:{frame.lineno} in {frame.name}"
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(_PROJECT_ROOT) and frame.filename != _THIS_FILE and "/.venv/" not in frame.filename
+    ]
+
+
+def _format_queries(queries: list[CapturedQuery]) -> str:
+    blocks = []
+    for index, query in enumerate(queries, start=1):
+        stack = "\n".join(f"        {line}" for line in query.stack[-6:])
+        blocks.append(f"  {index}. ({query.duration_ms:.2f} ms) {query.sql}\n     params={query.params!r}\n{stack}")
+    return "\n".join(blocks)
+
+
+# ============================== Plan checks ==============================
+def _walk_plan(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk_plan(child)
+
+
+def sequential_scans(queries: list[CapturedQuery], tables: set[str]) -> list[tuple[CapturedQuery, str]]:
+    """
+    EXPLAIN every captured SELECT with ``enable_seqscan = off`` and return the statements
+    that still sequentially scan one of ``tables``. With seq scans disabled the planner
+    only falls back to one when no index can serve the predicate, so small test tables
+    do not produce false positives.
+    """
+    offenders: list[tuple[CapturedQuery, str]] = []
+    for query in queries:
+        if not query.sql.lstrip().upper().startswith("SELECT"):
+            continue
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {query.sql}", query.params)
+            raw = cursor.fetchone()[0]
+        plan = json.loads(raw) if isinstance(raw, str) else raw
+        for node in _walk_plan(plan[0]["Plan"]):
+            if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in tables:
+                offenders.append((query, node["Relation Name"]))
+    return offenders
+
+
+@contextmanager
+def query_budget(view_name: str, explain_tables: set[str] | None = None) -> Iterator[QueryRecorder]:
+    """
+    Fail when the wrapped block runs more statements than ``QUERY_BUDGETS[view_name]``,
+    or, when ``explain_tables`` is given, when any captured SELECT sequentially scans one
+    of those tables. Failures print the offending SQL with project stack traces.
+    """
+    budget = QUERY_BUDGETS[view_name]
+    recorder = QueryRecorder()
+    with connection.execute_wrapper(recorder):
+        yield recorder
+
+    count = len(recorder.queries)
+    if count > budget:
+        message = f"{view_name} ran {count} queries (budget {budget}):\n{_format_queries(recorder.queries)}"
+        raise AssertionError(message)
+
+    if explain_tables and connection.vendor == "postgresql":
+        offenders = sequential_scans(recorder.queries, explain_tables)
+        if offenders:
+            details = _format_queries([query for query, _ in offenders])
+            tables = ", ".join(sorted({table for _, table in offenders}))
+            message = f"{view_name} sequentially scans {tables}:\n{details}"
+            raise AssertionError(message)
@@ -0,0 +1,58 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+CHANGELIST = reverse("admin:users_user_changelist")
+
+
+@pytest.fixture
+def admin_client(settings: SettingsWrapper, client: Client) -> Client:
+    # The manifest only exists after collectstatic
+    settings.STATICFILES_STORAGE = "django.contrib.staticfiles.storage.StaticFilesStorage"
+    admin = User.objects.create_superuser(email="admin@example.com", password="Admin-Pass-2024!")  # type: ignore[attr-defined] # noqa: S106
+    for index in range(5):
+        User.objects.create_user(email=f"user{index}@example.com", lazy_profile=True)  # type: ignore[attr-defined]
+    with connection.cursor() as cursor:
+        # reltuples stays -1 until the table is analyzed
+        cursor.execute(f"ANALYZE {User._meta.db_table}")  # Noqa
+    client.force_login(admin)
+    return client
+
+
+def changelist_counts(client: Client, query: str = "") -> list[str]:
+    """The counting statements the changelist ran for the users table."""
+    with CaptureQueriesContext(connection) as captured:
+        response = client.get(f"{CHANGELIST}{query}")
+    assert response.status_code == 200
+    return [
+        query["sql"].split()[0] if "reltuples" not in query["sql"] else "reltuples"
+        for query in captured.captured_queries
+        if "reltuples" in query["sql"] or query["sql"].startswith(("EXPLAIN", "SELECT COUNT(*)"))
+    ]
+
+
+def test_unfiltered_changelist_counts_from_reltuples(settings: SettingsWrapper, admin_client: Client):
+    settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 2
+
+    assert changelist_counts(admin_client) == ["reltuples"]
+
+
+def test_filtered_changelist_counts_from_explain(settings: SettingsWrapper, admin_client: Client):
+    settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 2
+
+    # Every analyzed row is active, so the planner estimate is above the threshold
+    assert changelist_counts(admin_client, "?is_active__exact=1") == ["EXPLAIN"]
+
+
+def test_small_tables_keep_the_exact_count(settings: SettingsWrapper, admin_client: Client):
+    settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 1000
+
+    assert changelist_counts(admin_client) == ["reltuples", "SELECT"]
+    assert changelist_counts(admin_client, "?is_active__exact=1") == ["EXPLAIN", "SELECT"]
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import Client, RequestFactory
+from django.urls import resolve
+from rest_framework_simplejwt.tokens import AccessToken
+
+from src.identity.async_views import token_obtain_pair
+from src.users.models import User
+from src.users.views.async_user_view import user_list, user_retrieve
+
+
+@pytest.mark.parametrize(
+    ("url", "view"),
+    [("/api/users/", user_list), ("/api/users/5/", user_retrieve)],
+)
+def test_async_routes(url: str, view: object):
+    assert resolve(url, urlconf="config.urls_async").func is view
+
+
+@pytest.mark.parametrize("url", ["/api/users/bulk/", "/api/users/export/", "/api/users/5/avatar/"])
+def test_viewset_actions_stay_on_drf(url: str):
+    match = resolve(url, urlconf="config.urls_async")
+
+    assert match.func not in (user_list, user_retrieve)
+    assert match.func.cls.__name__ == "UserViewSet"  # type: ignore[attr-defined]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", ["is_active=maybe", "search=a", "cursor=not-a-cursor"])
+def test_async_errors_match_drf(rf: RequestFactory, auth_client: Client, user: User, query: str):
+    request = rf.get(f"/api/users/?{query}", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+    # async_to_sync keeps the ORM on this thread, inside the test transaction
+    response = async_to_sync(user_list)(request)
+    expected = auth_client.get(f"/api/users/?{query}")
+
+    assert response.status_code == expected.status_code == 400
+    assert json.loads(response.content) == expected.json()  # type: ignore[attr-defined]
+
+
+@pytest.mark.django_db
+def test_async_token_accepts_form_data(rf: RequestFactory, user_data: dict[str, str], user: User):
+    request = rf.post("/api/token/", user_data)
+
+    response = async_to_sync(token_obtain_pair)(request)
+
+    assert response.status_code == 200
+    assert set(json.loads(response.content)) == {"access", "refresh"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("payload", [{"email": "a@b.c", "password": 1}, {"email": ["a@b.c"], "password": "x"}, []])
+def test_async_token_rejects_malformed_credentials(rf: RequestFactory, payload: object):
+    request = rf.post("/api/token/", json.dumps(payload), content_type="application/json")
+
+    assert async_to_sync(token_obtain_pair)(request).status_code == 400
@@ -0,0 +1,79 @@
+from datetime import timedelta
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from pytest_django.fixtures import SettingsWrapper
+
+from src.audit.models import TaskAuditLog
+from src.audit.tasks import prune_task_audit_logs
+from src.audit.utils import signals
+from src.audit.utils.writer import TaskAuditWriter
+from src.users.tasks import process_avatar
+
+if TYPE_CHECKING:
+    from celery import Task
+
+pytestmark = pytest.mark.django_db
+
+TASK = cast("Task", process_avatar)
+
+
+@pytest.fixture
+def writer(monkeypatch: pytest.MonkeyPatch) -> TaskAuditWriter:
+    """A writer whose background flusher never fires during a test"""
+    writer = TaskAuditWriter(batch_size=100, flush_interval=3600)
+    monkeypatch.setattr(signals, "writer", writer)
+    return writer
+
+
+def test_start_and_finish_are_upserted_as_one_row(writer: TaskAuditWriter):
+    signals.audit_task_started(sender=TASK, task_id="task-1")
+    signals.audit_task_finished(sender=TASK, task_id="task-1", retval={"ok": True}, state="SUCCESS")
+
+    assert writer.flush() == 1
+    (row,) = TaskAuditLog.objects.all()
+    assert (row.task_id, row.task_name, row.status, row.result) == ("task-1", TASK.name, "SUCCESS", {"ok": True})
+    assert row.created_at is not None
+    assert row.completed_at is not None
+
+    # A later event for the same task updates the row instead of inserting another
+    signals.audit_task_finished(sender=TASK, task_id="task-1", retval=None, state="RETRY")
+    writer.flush()
+    assert list(TaskAuditLog.objects.values_list("status", flat=True)) == ["RETRY"]
+
+
+def test_failed_flush_keeps_its_rows(writer: TaskAuditWriter, monkeypatch: pytest.MonkeyPatch):
+    signals.audit_task_started(sender=TASK, task_id="task-1")
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise DatabaseError
+
+    with monkeypatch.context() as patched:
+        patched.setattr(TaskAuditLog.objects, "bulk_create", fail)
+        assert writer.flush() == 0
+    # Recorded while the database was down; merged with the requeued start event
+    signals.audit_task_finished(sender=TASK, task_id="task-1", retval=1, state="SUCCESS")
+
+    assert writer.flush() == 1
+    row = TaskAuditLog.objects.get(task_id="task-1")
+    assert (row.status, row.result) == ("SUCCESS", 1)
+
+
+def test_prune_deletes_only_expired_rows_in_batches(settings: SettingsWrapper):
+    settings.TASK_AUDIT_RETENTION_DAYS = 14
+    now = timezone.now()
+    ages = {"old-0": 15, "old-1": 15, "old-2": 15, "recent": 13}
+    TaskAuditLog.objects.bulk_create(
+        TaskAuditLog(task_id=task_id, task_name="task", status="SUCCESS", created_at=now - timedelta(days=days))
+        for task_id, days in ages.items()
+    )
+
+    with CaptureQueriesContext(connection) as captured:
+        assert prune_task_audit_logs(batch_size=2) == 3
+
+    assert list(TaskAuditLog.objects.values_list("task_id", flat=True)) == ["recent"]
+    deletes = [query for query in captured.captured_queries if query["sql"].startswith("DELETE")]
+    assert len(deletes) == 2
@@ -0,0 +1,56 @@
+import pytest
+from django.core.cache import cache
+from django.test import Client
+from rest_framework.test import APIClient
+
+from src.identity.authentication import USER_CACHE_FIELDS, _cache_key, get_cached_user
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+NEW_PASSWORD = "N3w-passw0rd!"  # noqa: S105
+
+
+def test_cached_user_excludes_password_hash(auth_client: APIClient, user: User):
+    auth_client.get(f"/api/users/{user.pk}/")
+
+    values = cache.get(_cache_key(user.pk))
+    assert len(values) == len(USER_CACHE_FIELDS)
+    assert user.password not in values
+
+
+def test_cached_user_keeps_every_cached_field(auth_client: Client, user: User):
+    user.is_staff = True
+    user.save()
+    auth_client.get(f"/api/users/{user.pk}/")
+
+    cached = get_cached_user(user.pk)
+
+    assert cached is not None
+    assert {name: getattr(cached, name) for name in USER_CACHE_FIELDS} == {
+        name: getattr(user, name) for name in USER_CACHE_FIELDS
+    }
+    assert auth_client.get(f"/api/users/{user.pk}/").status_code == 200
+
+
+def test_cached_user_loads_password_on_access(auth_client: APIClient, user: User, user_data: dict[str, str]):
+    auth_client.get(f"/api/users/{user.pk}/")
+
+    cached = get_cached_user(user.pk)
+    assert cached is not None
+    assert cached.check_password(user_data["password"])
+
+
+def test_admin_password_form_invalidates_cached_user(client: Client, auth_client: APIClient, user: User):
+    admin = User.objects.create_superuser(email="admin@example.com", password=NEW_PASSWORD)  # type: ignore[attr-defined]
+    auth_client.get(f"/api/users/{user.pk}/")
+    assert get_cached_user(user.pk) is not None
+
+    client.force_login(admin)
+    response = client.post(
+        f"/django/admin/users/user/{user.pk}/password/",
+        {"password1": NEW_PASSWORD, "password2": NEW_PASSWORD},
+    )
+
+    assert response.status_code == 302
+    assert get_cached_user(user.pk) is None
@@ -0,0 +1,74 @@
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from django.core.files.base import ContentFile
+from PIL import Image
+from pytest_django.fixtures import SettingsWrapper
+
+from src.audit.utils import signals
+from src.audit.utils.writer import TaskAuditWriter
+from src.users.models import Profile, User
+from src.users.tasks import process_avatar
+from src.users.utils.avatar import variant_name
+
+if TYPE_CHECKING:
+    from celery import Task
+
+pytestmark = pytest.mark.django_db
+
+TASK = cast("Task", process_avatar)
+
+
+@pytest.fixture(autouse=True)
+def media(settings: SettingsWrapper, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    settings.MEDIA_ROOT = tmp_path
+    settings.AVATAR_VARIANT_SIZES = (256, 64)
+    # Keep the eager runs' audit events away from the module writer's flusher
+    monkeypatch.setattr(signals, "writer", TaskAuditWriter(batch_size=100, flush_interval=3600))
+    return tmp_path
+
+
+def upload(user: User, content: bytes) -> Profile:
+    profile = user.profile
+    # Saved without the profile, so no run is queued on commit
+    profile.avatar.save("avatar.png", ContentFile(content), save=False)
+    Profile.objects.filter(pk=profile.pk).update(avatar=profile.avatar.name)
+    return profile
+
+
+def png(width: int, height: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), color="blue").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_variants_are_written_and_recorded(user: User, media: Path):
+    profile = upload(user, png(100, 80))
+
+    variants = cast("dict[str, dict[str, str]]", TASK.apply(args=(profile.pk, profile.avatar.name)).get())
+
+    name = profile.avatar.name
+    assert variants == {
+        str(size): {"webp": variant_name(name, size, "webp"), "jpeg": variant_name(name, size, "jpeg")}
+        for size in (256, 64)
+    }
+    # Downscaled to fit, never upscaled
+    for size, expected in (("256", (100, 80)), ("64", (64, 51))):
+        for path in variants[size].values():
+            with Image.open(media / path) as image:
+                assert image.size == expected
+    profile.refresh_from_db()
+    assert profile.avatar_variants == variants
+
+
+def test_unreadable_upload_is_skipped_without_retries(user: User):
+    profile = upload(user, b"not an image at all")
+
+    result = TASK.apply(args=(profile.pk, profile.avatar.name))
+
+    assert result.successful()
+    assert result.get() == {}
+    profile.refresh_from_db()
+    assert profile.avatar_variants == {}
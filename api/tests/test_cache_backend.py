@@ -0,0 +1,162 @@
+import gc
+import threading
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from src.shared import cache_backend
+from src.shared.cache_backend import ALL_KEYS, LocalInvalidationBus, RedisInvalidationBus, TieredCache
+
+
+def make_worker(location: str, channel: str, **options: Any) -> TieredCache:  # noqa: ANN401
+    """
+    One TieredCache per emulated worker, sharing L2 and an in-process bus.
+    State is shared per location, so each emulated worker gets its own.
+    """
+    options = {"L2": "shared", "INVALIDATION_BUS": "local", "INVALIDATION_CHANNEL": channel, **options}
+    return TieredCache(location, {"OPTIONS": options})
+
+
+@pytest.fixture
+def workers() -> tuple[TieredCache, TieredCache]:
+    channel = f"test-{uuid.uuid4().hex}"
+    return make_worker(f"{channel}-1", channel), make_worker(f"{channel}-2", channel)
+
+
+def test_reads_fill_l1_from_l2(workers: tuple[TieredCache, TieredCache]):
+    first, second = workers
+    first.set("key", {"value": 1})
+
+    assert second.get("key") == {"value": 1}
+    assert second.get("key") == {"value": 1}
+    assert second.get("missing") is None
+    stats = second.stats()
+    assert (stats["l1_hits"], stats["l2_hits"], stats["misses"], stats["l1_entries"]) == (1, 1, 1, 1)
+
+
+def test_set_invalidates_peer_l1(workers: tuple[TieredCache, TieredCache]):
+    first, second = workers
+    first.set("key", "old")
+    assert second.get("key") == "old"
+
+    first.set("key", "new")
+
+    assert second.get("key") == "new"
+    assert second.stats()["invalidations"] == 1
+
+
+def test_delete_and_clear_invalidate_peer_l1(workers: tuple[TieredCache, TieredCache]):
+    first, second = workers
+    first.set_many({"a": 1, "b": 2})
+    assert second.get_many(["a", "b"]) == {"a": 1, "b": 2}
+
+    first.delete("a")
+    assert second.get("a") is None
+    assert second.get("b") == 2
+
+    first.clear()
+    assert second.get("b") is None
+
+
+def test_values_are_copied_out_of_l1(workers: tuple[TieredCache, TieredCache]):
+    first, _ = workers
+    first.set("key", [1, 2])
+
+    first.get("key").append(3)
+
+    assert first.get("key") == [1, 2]
+
+
+def test_non_positive_timeout_skips_l1(workers: tuple[TieredCache, TieredCache]):
+    first, _ = workers
+    first.set("key", "value", timeout=0)
+
+    assert first.get("key") is None
+    assert first.stats()["l1_entries"] == 0
+
+
+def test_counters_are_never_served_from_l1(workers: tuple[TieredCache, TieredCache]):
+    first, second = workers
+    first.set("hits", 1)
+    assert second.get("hits") == 1
+
+    assert first.incr("hits") == 2
+    assert second.get("hits") == 2
+
+
+def test_add_only_writes_missing_keys(workers: tuple[TieredCache, TieredCache]):
+    first, second = workers
+
+    assert first.add("key", "first")
+    assert not second.add("key", "second")
+    assert second.get("key") == "first"
+
+
+def test_threads_of_one_process_share_l1_and_stats():
+    channel = f"test-{uuid.uuid4().hex}"
+    main = make_worker(channel, channel)
+    main.set("key", "value")
+    built: list[TieredCache] = []
+
+    # Django's cache handler builds one backend per thread
+    thread = threading.Thread(target=lambda: built.append(make_worker(channel, channel)))
+    thread.start()
+    thread.join()
+
+    (other,) = built
+    assert other.get("key") == "value"
+    assert main.stats()["l1_hits"] == 1
+    assert other.stats() == main.stats()
+
+
+def test_discarded_caches_leave_the_local_bus():
+    channel = f"test-{uuid.uuid4().hex}"
+    first = make_worker(f"{channel}-1", channel)
+    make_worker(f"{channel}-2", channel).get("key")
+    gc.collect()
+
+    first.set("key", "value")
+
+    assert len(LocalInvalidationBus._subscribers[channel]) == 1  # noqa: SLF001
+
+
+class FakeRedis:
+    """Just enough of redis-py for RedisInvalidationBus: one shared channel."""
+
+    handlers: list[Callable[[dict[str, Any]], None]] = []  # noqa: RUF012
+
+    @classmethod
+    def from_url(cls, url: str) -> "FakeRedis":
+        return cls()
+
+    def pubsub(self, **kwargs: Any) -> "FakeRedis":  # noqa: ANN401
+        return self
+
+    def subscribe(self, **channels: Callable[[dict[str, Any]], None]) -> None:
+        self.handlers.extend(channels.values())
+
+    def run_in_thread(self, **kwargs: Any) -> None:  # noqa: ANN401
+        pass
+
+    def publish(self, channel: str, data: str) -> None:
+        for handler in self.handlers:
+            handler({"data": data})
+
+
+def test_redis_bus_skips_its_own_messages(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(cache_backend.redis, "Redis", FakeRedis)
+    monkeypatch.setattr(FakeRedis, "handlers", [])
+    received: dict[str, list[list[str]]] = {"first": [], "second": []}
+    first, second = RedisInvalidationBus("redis://", "bus"), RedisInvalidationBus("redis://", "bus")
+    first.start(received["first"].append)
+    second.start(received["second"].append)
+    # Starting again in the same process does not subscribe twice
+    first.start(received["first"].append)
+
+    first.publish(["key"])
+    second.publish([ALL_KEYS])
+
+    assert received == {"first": [[ALL_KEYS]], "second": [["key"]]}
+    assert len(FakeRedis.handlers) == 2
@@ -0,0 +1,57 @@
+import pytest
+from django.test import Client
+
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+NEW_PASSWORD = "Conditional-Pass-2024!"  # noqa: S105
+
+
+def change_password(client: Client, user: User, password: str, etag: str) -> int:
+    response = client.post(
+        f"/api/users/{user.pk}/change-password/",
+        {"old_password": password, "new_password": NEW_PASSWORD, "new_password_retype": NEW_PASSWORD},
+        HTTP_IF_MATCH=etag,
+    )
+    return response.status_code
+
+
+def test_list_returns_304_for_current_etag(auth_client: Client):
+    etag = auth_client.get("/api/users/")["ETag"]
+
+    response = auth_client.get("/api/users/", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+def test_retrieve_returns_304_until_user_changes(auth_client: Client, user: User):
+    etag = auth_client.get(f"/api/users/{user.pk}/")["ETag"]
+    assert auth_client.get(f"/api/users/{user.pk}/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    user.is_staff = True
+    user.save()
+
+    response = auth_client.get(f"/api/users/{user.pk}/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+def test_change_password_with_stale_etag_returns_412(auth_client: Client, user: User, user_data: dict[str, str]):
+    etag = auth_client.get(f"/api/users/{user.pk}/")["ETag"]
+    assert change_password(auth_client, user, user_data["password"], etag) == 204
+
+    # The first change bumped updated_at, so the same ETag no longer matches
+    assert change_password(auth_client, user, NEW_PASSWORD, etag) == 412
+    user.refresh_from_db()
+    assert user.check_password(NEW_PASSWORD)
+
+
+def test_change_password_without_if_match_is_unconditional(auth_client: Client, user: User, user_data: dict[str, str]):
+    response = auth_client.post(
+        f"/api/users/{user.pk}/change-password/",
+        {"old_password": user_data["password"], "new_password": NEW_PASSWORD, "new_password_retype": NEW_PASSWORD},
+    )
+
+    assert response.status_code == 204
@@ -0,0 +1,50 @@
+import os
+import threading
+import time
+
+from src.shared.db_router import ReplicaMonitor
+
+
+class GatedMonitor(ReplicaMonitor):
+    """Replica lags come from a dict; each probe waits until the test opens the gate."""
+
+    def __init__(self, lags: dict[str, float]) -> None:
+        super().__init__(list(lags), max_lag=5, interval=0.01)
+        self.lags = lags
+        self.gate = threading.Event()
+        self.probe_threads: set[int] = set()
+
+    def _lag(self, alias: str) -> float:
+        self.probe_threads.add(threading.get_ident())
+        assert self.gate.wait(timeout=5)
+        return self.lags[alias]
+
+
+def test_probes_never_block_the_caller():
+    monitor = GatedMonitor({"replica_1": 0, "replica_2": 30})
+
+    # The first probe is stuck on the gate, so reads stay on the primary meanwhile
+    assert monitor.choose() is None
+
+    monitor.gate.set()
+    deadline = time.monotonic() + 5
+    while monitor.choose() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Park the daemon thread for the rest of the session
+    monitor.interval = 3600
+    assert monitor.choose() == "replica_1"
+    assert threading.get_ident() not in monitor.probe_threads
+
+
+def test_stale_results_fall_back_to_the_primary():
+    monitor = ReplicaMonitor(["replica_1"], max_lag=5, interval=1)
+    # Pretend the probe thread already runs in this process
+    monitor._pid = os.getpid()  # noqa: SLF001
+    monitor._healthy = ["replica_1"]  # noqa: SLF001
+
+    monitor._checked_at = time.monotonic()  # noqa: SLF001
+    assert monitor.choose() == "replica_1"
+
+    monitor._checked_at = time.monotonic() - monitor.interval * (monitor.STALE_AFTER_CHECKS + 1)  # noqa: SLF001
+    assert monitor.choose() is None
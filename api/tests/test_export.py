@@ -0,0 +1,37 @@
+import csv
+import gzip
+from datetime import UTC, datetime
+from io import StringIO
+
+import pytest
+from django.test import Client
+from rest_framework_simplejwt.tokens import AccessToken
+
+from src.users.models import User
+from src.users.utils.export import EXPORT_FIELDS, csv_lines, gzip_stream
+
+
+def test_empty_csv_export_has_header():
+    assert b"".join(csv_lines([])).decode().splitlines() == [",".join(EXPORT_FIELDS)]
+
+
+def test_csv_export_formats_datetimes():
+    created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+    row = dict.fromkeys(EXPORT_FIELDS, "") | {"id": 1, "created_at": created_at}
+
+    body = gzip.decompress(b"".join(gzip_stream(csv_lines([row])))).decode()
+
+    (parsed,) = csv.DictReader(StringIO(body))
+    assert parsed["id"] == "1"
+    assert parsed["created_at"] == created_at.isoformat()
+
+
+@pytest.mark.django_db
+def test_unknown_export_format_lists_the_choices(client: Client):
+    admin = User.objects.create_superuser(email="admin@example.com", password="Export-Pass-2024!")  # type: ignore[attr-defined]  # noqa: S106
+    token = AccessToken.for_user(admin)
+
+    response = client.get("/api/users/export/", {"type": "xml"}, HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    assert response.status_code == 400
+    assert response.json() == {"type": "Choose one of: ndjson, csv."}
@@ -0,0 +1,23 @@
+from typing import Any
+
+import pytest
+from django.db import connections
+
+from config.health import ReadinessProbe, check_database
+
+pytestmark = pytest.mark.django_db
+
+
+def test_database_check_releases_its_connection():
+    used: list[Any] = []
+
+    def database() -> None:
+        check_database()
+        used.append(connections["default"])
+
+    probe = ReadinessProbe({"database": database}, timeout=5, ttl=0)
+
+    assert probe.get()["checks"]["database"]["status"] == "ok"
+    # The pool thread's wrapper was closed once the check finished
+    (wrapper,) = used
+    assert wrapper.connection is None
@@ -0,0 +1,79 @@
+import csv
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.management import call_command
+
+from src.users.models import Profile, User
+
+pytestmark = [
+    pytest.mark.django_db,
+    # Passwords are hashed in a process pool
+    pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning"),
+]
+
+PASSWORD = "Import-Pass-2024!"  # noqa: S105
+FIELDS = ["email", "password", "password_hash", "first_name", "last_name"]
+
+
+def write_csv(path: Path, rows: list[dict[str, str]], *, append: bool = False) -> None:
+    with path.open("a" if append else "w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=FIELDS)
+        if not append:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+def import_users(source: Path, errors: Path, *args: str) -> None:
+    call_command(
+        "import_users", str(source), "--workers=1", "--chunk-size=2", f"--errors={errors}", *args, stdout=StringIO()
+    )
+
+
+def test_import_users_copies_valid_rows_and_reports_the_rest(tmp_path: Path):
+    pre_hashed = make_password(PASSWORD)
+    source = tmp_path / "users.csv"
+    write_csv(
+        source,
+        [
+            {"email": "ada@example.com", "password": PASSWORD, "first_name": "Ada", "last_name": "Lovelace"},
+            {"email": "Ada@Example.com", "password": PASSWORD},
+            {"email": "not-an-email", "password": PASSWORD},
+            {"email": "hashed@example.com", "password_hash": pre_hashed, "first_name": "Grace"},
+        ],
+    )
+    errors = tmp_path / "rejected.jsonl"
+
+    import_users(source, errors)
+
+    ada = User.objects.get(email="ada@example.com")
+    assert check_password(PASSWORD, ada.password)
+    assert Profile.objects.get(user=ada).last_name == "Lovelace"
+    hashed = User.objects.get(email="hashed@example.com")
+    assert hashed.password == pre_hashed
+    assert Profile.objects.get(user=hashed).first_name == "Grace"
+    assert User.objects.count() == 2
+
+    rejected = [json.loads(line) for line in errors.read_text().splitlines()]
+    assert [entry["row"]["email"] for entry in rejected] == ["Ada@Example.com", "not-an-email"]
+    assert rejected[0]["error"] == "duplicated email in input"
+    assert (tmp_path / "users.csv.checkpoint").read_text() == "4"
+
+
+def test_resume_skips_checkpointed_rows(tmp_path: Path):
+    source = tmp_path / "users.csv"
+    write_csv(source, [{"email": f"user{index}@example.com", "password": PASSWORD} for index in range(3)])
+    import_users(source, tmp_path / "first.jsonl")
+    write_csv(source, [{"email": "late@example.com", "password": PASSWORD}], append=True)
+    errors = tmp_path / "resumed.jsonl"
+
+    import_users(source, errors, "--resume")
+
+    # Already imported rows would be rejected as existing if they were read again
+    assert errors.read_text() == ""
+    assert User.objects.filter(email="late@example.com").exists()
+    assert User.objects.count() == 4
+    assert (tmp_path / "users.csv.checkpoint").read_text() == "4"
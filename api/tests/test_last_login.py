@@ -0,0 +1,50 @@
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from django.utils import timezone
+
+from src.identity.last_login import LastLoginBuffer, write_last_logins
+from src.identity.tasks import flush_last_logins
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def test_write_never_moves_last_login_backwards(user: User):
+    now = timezone.now()
+
+    assert write_last_logins({user.pk: now}) == 1
+    assert write_last_logins({user.pk: now - timedelta(minutes=1)}) == 0
+
+    user.refresh_from_db()
+    assert user.last_login == now
+
+
+def test_buffer_keeps_the_latest_login_per_user(monkeypatch: pytest.MonkeyPatch, user: User):
+    buffer = LastLoginBuffer(batch_size=10, flush_interval=60, use_celery=False)
+    # No background flusher: the test flushes explicitly
+    monkeypatch.setattr(buffer, "_ensure_flusher", lambda: None)
+    now = timezone.now()
+
+    buffer.record(user.pk, now)
+    buffer.record(user.pk, now - timedelta(minutes=1))
+
+    assert buffer.flush() == 1
+    assert buffer.flush() == 0
+    user.refresh_from_db()
+    assert user.last_login == now
+
+
+def test_celery_mode_enqueues_iso_timestamps(monkeypatch: pytest.MonkeyPatch, user: User):
+    buffer = LastLoginBuffer(batch_size=10, flush_interval=60, use_celery=True)
+    monkeypatch.setattr(buffer, "_ensure_flusher", lambda: None)
+    sent: list[Any] = []
+    monkeypatch.setattr(flush_last_logins, "delay", sent.append)
+    now = timezone.now()
+    buffer.record(user.pk, now)
+
+    assert buffer.flush() == 1
+    assert flush_last_logins(*sent) == 1
+    user.refresh_from_db()
+    assert user.last_login == now
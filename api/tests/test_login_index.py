@@ -0,0 +1,49 @@
+import importlib
+import json
+
+import pytest
+from django.apps import apps
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+migration = importlib.import_module("src.users.migrations.0003_user_users_user_email_lower_uniq")
+
+
+def _plan_nodes(node: dict) -> list[dict]:
+    return [node, *(child for plan in node.get("Plans", []) for child in _plan_nodes(plan))]
+
+
+def test_login_lookup_is_case_insensitive(user: User):
+    assert User.objects.get_by_natural_key(user.email.upper()) == user  # type: ignore[attr-defined]
+
+
+def test_login_lookup_uses_email_index(user: User):
+    with CaptureQueriesContext(connection) as captured:
+        User.objects.get_by_natural_key(user.email)  # type: ignore[attr-defined]
+    (query,) = captured.captured_queries
+
+    with connection.cursor() as cursor:
+        # Tiny test tables make a seq scan cheapest; disabling it keeps only usable indexes
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {query['sql']}")
+        raw = cursor.fetchone()[0]
+    plan = json.loads(raw) if isinstance(raw, str) else raw
+
+    scans = [node for node in _plan_nodes(plan[0]["Plan"]) if node.get("Relation Name") == "users_user"]
+    assert [(node["Node Type"], node.get("Index Name")) for node in scans] == [
+        ("Index Scan", "users_user_email_lower_uniq"),
+    ]
+
+
+def test_migration_refuses_case_variant_duplicates():
+    with connection.schema_editor() as editor:
+        editor.execute("ALTER TABLE users_user DROP CONSTRAINT IF EXISTS users_user_email_lower_uniq")
+        editor.execute("DROP INDEX IF EXISTS users_user_email_lower_uniq")
+    User.objects.bulk_create([User(email="dup@example.com"), User(email="Dup@Example.com")])
+
+    with pytest.raises(RuntimeError, match="dup@example.com"):
+        migration.check_case_variant_duplicates(apps, None)
@@ -0,0 +1,60 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from django.test import Client
+from pytest_django.fixtures import SettingsWrapper
+
+from src.shared import metrics
+from src.shared.metrics import LATENCY_BUCKETS, MetricsRegistry, render_prometheus
+
+KEY = ("users-list", "GET", "200")
+LABELS = 'view="users-list",method="GET",status="200"'
+
+
+def test_metrics_endpoint_is_hidden_without_a_token(settings: SettingsWrapper, client: Client):
+    settings.METRICS_TOKEN = None
+
+    assert client.get("/api/metrics/").status_code == 404
+
+
+@pytest.mark.parametrize(("header", "expected"), [("", 401), ("Bearer wrong", 401), ("Bearer scrape-token", 200)])
+def test_metrics_endpoint_requires_the_token(
+    settings: SettingsWrapper,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    client: Client,
+    header: str,
+    expected: int,
+):
+    settings.METRICS_TOKEN = "scrape-token"  # noqa: S105
+    settings.DB_POOL_ENABLED = False
+    # The endpoint scrapes the module registry, which publishes into METRICS_DIR
+    monkeypatch.setattr(metrics.registry, "directory", tmp_path)
+
+    assert client.get("/api/metrics/", HTTP_AUTHORIZATION=header).status_code == expected
+
+
+def test_scrape_merges_every_worker_and_renders_buckets(tmp_path: Path):
+    registry = MetricsRegistry(str(tmp_path), flush_interval=3600)
+    registry.observe(KEY, latency=0.003, sql_count=2, sql_seconds=0.001, response_bytes=100)
+    registry.flush()
+    # Another worker's published file, in the same shape this process writes
+    other = json.loads((tmp_path / f"{os.getpid()}.json").read_text())
+    (tmp_path / "other-worker.json").write_text(json.dumps(other))
+    registry.observe(KEY, latency=0.2, sql_count=1, sql_seconds=0.002, response_bytes=50)
+    registry.observe(KEY, latency=60, sql_count=0, sql_seconds=0, response_bytes=0)
+
+    body = render_prometheus(registry.collect())
+
+    lines = set(body.splitlines())
+    # Two requests from the other worker's file and the first local one under 5ms
+    assert f'http_request_duration_seconds_bucket{{{LABELS},le="0.005"}} 2' in lines
+    assert f'http_request_duration_seconds_bucket{{{LABELS},le="0.25"}} 3' in lines
+    assert f'http_request_duration_seconds_bucket{{{LABELS},le="{LATENCY_BUCKETS[-1]}"}} 3' in lines
+    assert f'http_request_duration_seconds_bucket{{{LABELS},le="+Inf"}} 4' in lines
+    assert f"http_request_duration_seconds_count{{{LABELS}}} 4" in lines
+    assert f"http_request_sql_queries_total{{{LABELS}}} 5" in lines
+    assert f"http_response_size_bytes_total{{{LABELS}}} 250" in lines
+    assert "# TYPE http_request_duration_seconds histogram" in lines
@@ -0,0 +1,109 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+from pytest_django.fixtures import SettingsWrapper
+
+from src.profiling.middleware import ProfilingMiddleware
+from src.shared.db_router import is_sticky, replica_reads_allowed
+from src.shared.middleware import MetricsMiddleware, ReplicaStickinessMiddleware, StaticFilesMiddleware
+
+
+def sync_view(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(b"sync")
+
+
+async def async_view(request: HttpRequest) -> HttpResponse:
+    return HttpResponse(b"async")
+
+
+def test_metrics_middleware_stays_sync_for_sync_handlers(rf: RequestFactory):
+    middleware = MetricsMiddleware(sync_view)
+
+    response = middleware(rf.get("/"))
+
+    assert not iscoroutinefunction(middleware)
+    assert isinstance(response, HttpResponse)
+    assert response["Server-Timing"].startswith("app;dur=")
+
+
+def test_metrics_middleware_awaits_async_handlers(rf: RequestFactory):
+    middleware = MetricsMiddleware(async_view)
+
+    response = asyncio.run(middleware.__acall__(rf.get("/")))
+
+    assert iscoroutinefunction(middleware)
+    assert response.content == b"async"
+    assert response["Server-Timing"].startswith("app;dur=")
+
+
+def test_profiling_middleware_hooks_match_handler_mode(settings: SettingsWrapper):
+    settings.PROFILING_SAMPLE_RATES = {}
+
+    sync_middleware = ProfilingMiddleware(sync_view)
+    async_middleware = ProfilingMiddleware(async_view)
+
+    assert not iscoroutinefunction(sync_middleware)
+    assert not iscoroutinefunction(sync_middleware.process_view)
+    assert iscoroutinefunction(async_middleware)
+    assert iscoroutinefunction(async_middleware.process_view)
+
+
+def test_profiling_middleware_captures_async_request(settings: SettingsWrapper, tmp_path: Path, rf: RequestFactory):
+    settings.PROFILING_SAMPLE_RATES = {"users-list": 1.0}
+    settings.PROFILING_DIR = tmp_path
+    middleware = ProfilingMiddleware(async_view)
+    request = rf.get("/api/users/")
+    request.resolver_match = resolve("/api/users/")
+
+    async def handle() -> HttpResponse:
+        await middleware.aprocess_view(request, async_view, (), {})
+        return await middleware.__acall__(request)
+
+    response = asyncio.run(handle())
+
+    assert (tmp_path / response["X-Profile-Capture"]).exists()
+
+
+def test_static_files_middleware_serves_async(settings: SettingsWrapper, tmp_path: Path, rf: RequestFactory):
+    settings.STATIC_ROOT = tmp_path
+    settings.WHITENOISE_AUTOREFRESH = False
+    (tmp_path / "app.css").write_text("body {}")
+    middleware = StaticFilesMiddleware(async_view)
+
+    static = asyncio.run(middleware.__acall__(rf.get(f"{settings.STATIC_URL}app.css")))
+    passed = asyncio.run(middleware.__acall__(rf.get("/api/users/")))
+
+    assert iscoroutinefunction(middleware)
+    assert static.status_code == 200
+    assert passed.content == b"async"  # type: ignore[attr-defined]
+
+
+@pytest.mark.filterwarnings("ignore:Overriding setting DATABASES")
+def test_replica_stickiness_middleware_runs_async(settings: SettingsWrapper, rf: RequestFactory):
+    settings.DATABASES = {**settings.DATABASES, "replica_1": settings.DATABASES["default"]}
+    allowed: list[bool] = []
+
+    def sync_read() -> None:
+        allowed.append(replica_reads_allowed.get())
+
+    async def view(request: HttpRequest) -> HttpResponse:
+        allowed.append(replica_reads_allowed.get())
+        # Seen by the sync views that async handlers adapt onto a thread
+        await sync_to_async(sync_read)()
+        return HttpResponse()
+
+    middleware = ReplicaStickinessMiddleware(view)
+    asyncio.run(middleware.__acall__(rf.get("/api/users/")))
+    asyncio.run(middleware.__acall__(rf.post("/api/users/")))
+    asyncio.run(middleware.__acall__(rf.get("/api/users/")))
+
+    assert iscoroutinefunction(middleware)
+    # Replica reads until the POST, which pins the client to the primary
+    assert allowed == [True, True, False, False, False, False]
+    assert is_sticky(rf.get("/api/users/"))
+    assert replica_reads_allowed.get() is False
@@ -0,0 +1,54 @@
+import base64
+import json
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def cursor(payload: object) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def test_keyset_traversal_visits_every_row_once_across_ties(auth_client: Client, user: User):
+    for index in range(10):
+        User.objects.create_user(email=f"user{index}@example.com", lazy_profile=True)  # type: ignore[attr-defined]
+    # Groups of three rows share a timestamp, so pages must split ties on id
+    base = timezone.now()
+    for position, pk in enumerate(User.objects.order_by("pk").values_list("pk", flat=True)):
+        User.objects.filter(pk=pk).update(created_at=base - timedelta(seconds=position // 3))
+    expected = list(User.objects.order_by("-created_at", "-id").values_list("pk", flat=True))
+
+    seen: list[int] = []
+    url: str | None = "/api/users/?page_size=2"
+    while url is not None:
+        response = auth_client.get(url)
+        assert response.status_code == 200
+        body = response.json()  # type: ignore[attr-defined]
+        seen.extend(row["id"] for row in body["results"])
+        url = body["next"]
+
+    assert seen == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "%%%not-base64",
+        cursor(["2024-01-01T00:00:00+00:00", 1]),
+        cursor({"id": 1}),
+        cursor({"created_at": "yesterday", "id": 1}),
+        cursor({"created_at": "2024-01-01T00:00:00+00:00", "id": "one"}),
+        cursor({"created_at": {"nested": True}, "id": 1}),
+    ],
+)
+def test_invalid_cursor_is_a_bad_request(auth_client: Client, value: str):
+    response = auth_client.get("/api/users/", {"cursor": value})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor."}  # type: ignore[attr-defined]
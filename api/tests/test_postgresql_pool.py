@@ -0,0 +1,87 @@
+import os
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from django.db import connection
+from psycopg import IsolationLevel
+
+from src.shared.postgresql_pool import base as pool_backend
+from src.shared.postgresql_pool.base import DatabaseWrapper, close_pools, get_pool, pool_stats
+
+pytestmark = pytest.mark.django_db
+
+# pytest-django only lets configured aliases connect; the pool is keyed by the same name
+ALIAS = "default"
+
+
+def make_wrapper(**options: Any) -> DatabaseWrapper:  # noqa: ANN401
+    settings_dict = {
+        **connection.settings_dict,
+        "OPTIONS": {**connection.settings_dict["OPTIONS"], **options},
+        "POOL": {"MIN_SIZE": 1, "MAX_SIZE": 1, "TIMEOUT": 2},
+    }
+    return DatabaseWrapper(settings_dict, alias=ALIAS)
+
+
+@pytest.fixture(autouse=True)
+def pools() -> Iterator[None]:
+    yield
+    close_pools()
+
+
+def test_connections_are_checked_out_and_returned():
+    wrapper = make_wrapper()
+
+    with wrapper.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        assert cursor.fetchone() == (1,)
+    assert wrapper.isolation_level == IsolationLevel.READ_COMMITTED
+    assert pool_stats()[ALIAS]["pool_available"] == 0
+
+    borrowed = wrapper.connection
+    wrapper.close()
+    assert pool_stats()[ALIAS]["pool_available"] == 1
+
+    # The next borrower reuses the returned connection instead of opening a new one
+    other = make_wrapper()
+    other.ensure_connection()
+    assert other.connection is borrowed
+    other.close()
+
+
+def test_configured_isolation_level_is_applied():
+    wrapper = make_wrapper(isolation_level=IsolationLevel.SERIALIZABLE)
+    wrapper.ensure_connection()
+
+    assert wrapper.isolation_level == IsolationLevel.SERIALIZABLE
+    assert wrapper.connection.isolation_level == IsolationLevel.SERIALIZABLE
+    wrapper.close()
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+def test_forked_child_builds_its_own_pool():
+    wrapper = make_wrapper()
+    wrapper.ensure_connection()
+    parent_pool = get_pool(ALIAS, {}, {})
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            # The parent's checkout is not returned into the parent's pool from here
+            wrapper.close()
+            child = make_wrapper()
+            with child.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            child_pool = get_pool(ALIAS, {}, {})
+            code = 0 if child_pool is not parent_pool and parent_pool in pool_backend._inherited else 2  # noqa: SLF001
+            child.close()
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert pool_stats()[ALIAS]["pool_available"] == 0
+    wrapper.close()
+    assert pool_stats()[ALIAS]["pool_available"] == 1
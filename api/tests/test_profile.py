@@ -0,0 +1,67 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from pytest_django.fixtures import SettingsWrapper
+
+from src.users.models import Profile, User
+from src.users.utils.export import iter_users
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def profiles() -> list[Profile]:
+    users = [User.objects.create_user(email=f"user{index}@example.com") for index in range(3)]  # type: ignore[attr-defined]
+    return [user.profile for user in users]
+
+
+@pytest.mark.usefixtures("profiles")
+def test_deferred_avatar_is_not_loaded_per_instance():
+    with CaptureQueriesContext(connection) as captured:
+        loaded = list(Profile.objects.only("id", "first_name"))
+
+    assert len(loaded) == 3
+    assert len(captured) == 1
+
+
+@pytest.mark.usefixtures("profiles")
+def test_export_rows_take_one_query():
+    with CaptureQueriesContext(connection) as captured:
+        rows = list(iter_users(User.objects.all(), chunk_size=2))
+
+    assert len(rows) == 3
+    assert len(captured) == 1
+
+
+def test_saving_deferred_profile_does_not_queue_variants(
+    profiles: list[Profile],
+    django_capture_on_commit_callbacks: Any,  # noqa: ANN401
+):
+    profile = Profile.objects.only("id", "first_name").get(pk=profiles[0].pk)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        profile.first_name = "Renamed"
+        profile.save(update_fields=["first_name"])
+
+    assert callbacks == []
+
+
+def test_new_avatar_queues_variants(
+    settings: SettingsWrapper,
+    tmp_path: Path,
+    profiles: list[Profile],
+    fake_image: SimpleUploadedFile,
+    django_capture_on_commit_callbacks: Any,  # noqa: ANN401
+):
+    settings.MEDIA_ROOT = tmp_path
+    profile = Profile.objects.only("id", "avatar").get(pk=profiles[0].pk)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        profile.avatar = fake_image
+        profile.save(update_fields=["avatar"])
+
+    assert len(callbacks) == 1
@@ -0,0 +1,106 @@
+import asyncio
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from django.core import signing
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+from pytest_django.fixtures import SettingsWrapper
+
+from src.profiling import storage
+from src.profiling.middleware import PROFILE_HEADER, ProfilingMiddleware, make_profile_token
+
+
+@pytest.fixture(autouse=True)
+def profiles(settings: SettingsWrapper, tmp_path: Path) -> Path:
+    settings.PROFILING_DIR = tmp_path
+    settings.PROFILING_SAMPLE_RATES = {}
+    settings.PROFILING_TOKEN_MAX_AGE = 60
+    return tmp_path
+
+
+def view(request: HttpRequest) -> HttpResponse:
+    return HttpResponse()
+
+
+def profile(rf: RequestFactory, path: str = "/api/users/", **headers: str) -> HttpResponse:
+    """Run one request through the middleware's sync hooks, as the handler does."""
+    middleware = ProfilingMiddleware(view)
+    request = rf.get(path, headers=headers)
+    request.resolver_match = resolve(path)
+
+    middleware.process_view(request, view, (), {})
+    return middleware(request)  # type: ignore[return-value]
+
+
+def test_signed_header_profiles_the_request(rf: RequestFactory, profiles: Path):
+    response = profile(rf, **{PROFILE_HEADER: make_profile_token()})
+
+    assert (profiles / response["X-Profile-Capture"]).exists()
+
+
+def test_tampered_header_is_ignored(rf: RequestFactory):
+    value, _, signature = make_profile_token().rpartition(":")
+    tampered = f"{value}:{signature[::-1]}"
+
+    assert "X-Profile-Capture" not in profile(rf, **{PROFILE_HEADER: tampered})
+
+
+def test_expired_header_is_ignored(rf: RequestFactory, monkeypatch: pytest.MonkeyPatch):
+    token = make_profile_token()
+    # Only the signing module sees the clock move past PROFILING_TOKEN_MAX_AGE
+    monkeypatch.setattr(signing, "time", SimpleNamespace(time=lambda: time.time() + 120))
+
+    assert "X-Profile-Capture" not in profile(rf, **{PROFILE_HEADER: token})
+
+
+@pytest.mark.parametrize(("rates", "profiled"), [({"users-list": 1.0}, True), ({"users-list": 0.0}, False)])
+def test_sample_rates_pick_views_by_url_name(
+    settings: SettingsWrapper,
+    rf: RequestFactory,
+    rates: dict[str, float],
+    profiled: bool,  # noqa: FBT001
+):
+    settings.PROFILING_SAMPLE_RATES = rates
+
+    assert ("X-Profile-Capture" in profile(rf)) is profiled
+    # Other views are never drawn
+    assert "X-Profile-Capture" not in profile(rf, "/api/users/5/")
+
+
+def test_sync_views_are_skipped_under_asgi(rf: RequestFactory, caplog: pytest.LogCaptureFixture):
+    async def handler(request: HttpRequest) -> HttpResponse:
+        return HttpResponse()
+
+    middleware = ProfilingMiddleware(handler)
+    request = rf.get("/api/users/", headers={PROFILE_HEADER: make_profile_token()})
+    request.resolver_match = resolve("/api/users/")
+
+    async def handle() -> HttpResponse:
+        await middleware.aprocess_view(request, view, (), {})
+        return await middleware.__acall__(request)
+
+    response = asyncio.run(handle())
+
+    assert "X-Profile-Capture" not in response
+    assert "sync views are not profiled under ASGI" in caplog.text
+
+
+def test_prune_keeps_the_newest_captures_within_retention(settings: SettingsWrapper, profiles: Path):
+    settings.PROFILING_MAX_CAPTURES = 2
+    settings.PROFILING_RETENTION_HOURS = 1
+    names = [f"2026010{day}T000000000000-users-list-5ms{storage.CAPTURE_SUFFIX}" for day in range(1, 5)]
+    for name in names:
+        (profiles / name).write_text("main 1")
+    # The newest name but older than the retention window
+    expired = profiles / names[-1]
+    os.utime(expired, (time.time() - 7200, time.time() - 7200))
+    (profiles / "notes.txt").write_text("kept")
+
+    storage.prune()
+
+    assert sorted(path.name for path in profiles.iterdir()) == [names[2], "notes.txt"]
@@ -0,0 +1,138 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+PASSWORD = "Budget-Pass-2024!"  # noqa: S105
+
+Budget = Callable[..., Any]
+# Tests take the clients as django.test.Client: APIClient is untyped and its request
+# methods are inferred from APIRequestFactory
+
+
+@pytest.fixture
+def users() -> list[User]:
+    """Enough rows that a per-row query would blow every budget."""
+    return [
+        User.objects.create_user(email=f"user{index}@example.com", password=PASSWORD)  # type: ignore[attr-defined]
+        for index in range(3)
+    ]
+
+
+@pytest.fixture
+def admin_client(api_client: APIClient) -> APIClient:
+    admin = User.objects.create_superuser(email="admin@example.com", password=PASSWORD)  # type: ignore[attr-defined]
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(admin)}")
+    return api_client
+
+
+@pytest.mark.usefixtures("users")
+def test_list(auth_client: Client, query_budget: Budget):
+    with query_budget("users-list", explain_tables={"users_user"}):
+        response = auth_client.get("/api/users/", {"page_size": 50})
+    assert response.status_code == 200
+
+    cache.clear()
+    with query_budget("users-list"):
+        response = auth_client.get("/api/users/", {"page_size": 50}, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == 304
+
+
+def test_detail(auth_client: Client, user: User, query_budget: Budget):
+    with query_budget("users-detail", explain_tables={"users_user"}):
+        response = auth_client.get(f"/api/users/{user.pk}/")
+    assert response.status_code == 200
+
+
+def test_create(api_client: Client, query_budget: Budget):
+    with query_budget("users-create", explain_tables={"users_user"}):
+        response = api_client.post("/api/users/", {"email": "new@example.com", "password": PASSWORD})
+    assert response.status_code == 201
+
+
+def test_bulk_create(admin_client: Client, query_budget: Budget):
+    rows = [{"email": f"bulk{index}@example.com", "password": PASSWORD} for index in range(3)]
+
+    with query_budget("users-bulk-create"):
+        response = admin_client.post("/api/users/bulk/", {"users": rows}, format="json")
+    assert response.status_code == 201
+
+
+@pytest.mark.usefixtures("users")
+def test_export(admin_client: Client, query_budget: Budget):
+    with query_budget("users-export"):
+        response = admin_client.get("/api/users/export/")
+        lines = b"".join(response.streaming_content).splitlines()  # type: ignore[attr-defined]
+    assert response.status_code == 200
+    assert len(lines) == 4
+
+
+def test_avatar(
+    settings: SettingsWrapper,
+    tmp_path: Path,
+    auth_client: Client,
+    user: User,
+    fake_image: SimpleUploadedFile,
+    query_budget: Budget,
+):
+    settings.MEDIA_ROOT = tmp_path
+
+    with query_budget("users-avatar"):
+        response = auth_client.post(f"/api/users/{user.pk}/avatar/", {"avatar": fake_image}, format="multipart")
+    assert response.status_code == 202
+
+    cache.clear()
+    with query_budget("users-avatar"):
+        response = auth_client.get(f"/api/users/{user.pk}/avatar/")
+    assert response.status_code == 200
+
+
+def test_change_password(auth_client: Client, user: User, user_data: dict[str, str], query_budget: Budget):
+    etag = auth_client.get(f"/api/users/{user.pk}/")["ETag"]
+    cache.clear()
+
+    with query_budget("users-change-password"):
+        response = auth_client.post(
+            f"/api/users/{user.pk}/change-password/",
+            {"old_password": user_data["password"], "new_password": PASSWORD, "new_password_retype": PASSWORD},
+            HTTP_IF_MATCH=etag,
+        )
+    assert response.status_code == 204
+
+
+def test_change_email(auth_client: Client, user: User, query_budget: Budget):
+    etag = auth_client.get(f"/api/users/{user.pk}/")["ETag"]
+    cache.clear()
+
+    with query_budget("users-change-email"):
+        response = auth_client.post(
+            f"/api/users/{user.pk}/change-email/",
+            {"old_email": user.email, "new_email": "changed@example.com"},
+            HTTP_IF_MATCH=etag,
+        )
+    assert response.status_code == 204
+
+
+def test_token_obtain_pair(api_client: Client, user: User, user_data: dict[str, str], query_budget: Budget):
+    with query_budget("token_obtain_pair", explain_tables={"users_user"}):
+        response = api_client.post("/api/token/", user_data)
+    assert response.status_code == 200
+
+
+def test_token_refresh(api_client: Client, user: User, query_budget: Budget):
+    refresh = RefreshToken.for_user(user)
+
+    with query_budget("token_refresh"):
+        response = api_client.post("/api/token/refresh/", {"refresh": str(refresh)})
+    assert response.status_code == 200
@@ -0,0 +1,52 @@
+import pytest
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from src.identity import revocation
+from src.identity.serializers import RotatingTokenRefreshSerializer
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def refresh(token: str) -> dict[str, str]:
+    return RotatingTokenRefreshSerializer().validate({"refresh": token})
+
+
+def test_rotation_issues_a_new_refresh_token(user: User):
+    token = str(RefreshToken.for_user(user))
+
+    assert refresh(token)["refresh"] != token
+
+
+def test_replay_on_another_worker_revokes_the_user(monkeypatch: pytest.MonkeyPatch, user: User):
+    token = str(RefreshToken.for_user(user))
+    refresh(token)
+
+    # A worker that did not rotate the token has nothing in its Bloom filter
+    monkeypatch.setattr(revocation, "_revoked_jtis", revocation.RotatingBloomFilter(100, 0.01, 60))
+
+    with pytest.raises(InvalidToken):
+        refresh(token)
+    assert revocation.get_not_before(user.pk) > 0
+
+
+def test_revocation_covers_tokens_minted_in_the_same_second(monkeypatch: pytest.MonkeyPatch, user: User):
+    monkeypatch.setattr(revocation.time, "time", lambda: 1_700_000_000.9)
+    token = RefreshToken.for_user(user)
+    token["iat"] = 1_700_000_000
+    assert not revocation.is_token_revoked(token)
+
+    revocation.revoke_user_tokens(user.pk)
+
+    assert revocation.is_token_revoked(token)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = revocation.BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"jti-{index}" for index in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert sum(f"other-{index}" in bloom for index in range(1000)) < 50
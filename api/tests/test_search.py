@@ -0,0 +1,52 @@
+import warnings
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from src.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def inactive_user() -> User:
+    return User.objects.create_user(email="inactive@example.com", is_active=False)  # type: ignore[attr-defined]
+
+
+def listed_emails(client: Client, **params: str) -> set[str]:
+    response = client.get("/api/users/", params)
+    assert response.status_code == 200
+    return {row["email"] for row in response.json()["results"]}
+
+
+def test_list_filters_on_is_active(auth_client: Client, user: User, inactive_user: User):
+    assert listed_emails(auth_client, is_active="false") == {inactive_user.email}
+    assert listed_emails(auth_client, is_active="true") == {user.email}
+
+
+def test_retrieve_ignores_list_filters(auth_client: Client, user: User):
+    response = auth_client.get(f"/api/users/{user.pk}/", {"is_active": "false", "search": "ab"})
+
+    assert response.status_code == 200
+
+
+def test_short_search_term_is_rejected(auth_client: Client):
+    response = auth_client.get("/api/users/", {"search": "ab"})
+
+    assert response.status_code == 400
+    assert "3 characters" in response.content.decode()
+
+
+def test_date_filters_are_timezone_aware(auth_client: Client, user: User):
+    tomorrow = (timezone.localdate() + timedelta(days=1)).isoformat()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        assert listed_emails(auth_client, created_before=tomorrow) == {user.email}
+        assert listed_emails(auth_client, created_after=tomorrow) == set()
+
+
+def test_invalid_date_is_rejected(auth_client: Client):
+    assert auth_client.get("/api/users/", {"created_after": "2024-13-01"}).status_code == 400
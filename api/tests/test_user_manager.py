@@ -0,0 +1,140 @@
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from src.users.models import Profile, User
+from src.users.models.managers import UserManager
+
+pytestmark = pytest.mark.django_db
+
+PASSWORD = "Bulk-Pass-2024!"  # noqa: S105
+
+
+@pytest.fixture
+def admin_client(api_client: APIClient) -> APIClient:
+    admin = User.objects.create_superuser(email="admin@example.com", password=PASSWORD)  # type: ignore[attr-defined]
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(admin)}")
+    return api_client
+
+
+def test_create_user_creates_the_profile_eagerly():
+    user = User.objects.create_user(  # type: ignore[attr-defined]
+        email="eager@example.com",
+        profile_fields={"first_name": "Ada"},
+    )
+
+    assert Profile.objects.get(user=user).first_name == "Ada"
+    assert user.get_profile().first_name == "Ada"
+
+
+def test_lazy_create_user_inserts_only_the_user():
+    with CaptureQueriesContext(connection) as captured:
+        user = User.objects.create_user(email="lazy@example.com", lazy_profile=True)  # type: ignore[attr-defined]
+
+    assert [query["sql"].split()[0] for query in captured if "users_" in query["sql"]] == ["INSERT"]
+    assert not Profile.objects.filter(user=user).exists()
+
+
+def test_get_profile_materializes_a_lazy_profile_once():
+    user = User.objects.create_user(email="lazy@example.com", lazy_profile=True)  # type: ignore[attr-defined]
+
+    profile = user.get_profile()
+
+    assert Profile.objects.get(user=user) == profile
+    with CaptureQueriesContext(connection) as captured:
+        assert user.get_profile() is profile
+    assert len(captured) == 0
+
+
+def test_get_profile_loads_an_existing_profile():
+    User.objects.create_user(email="eager@example.com")  # type: ignore[attr-defined]
+    user = User.objects.get(email="eager@example.com")
+
+    assert user.get_profile() == Profile.objects.get(user=user)
+    assert Profile.objects.filter(user=user).count() == 1
+
+
+def test_create_superuser_forwards_profile_options():
+    admin = User.objects.create_superuser(  # type: ignore[attr-defined]
+        email="admin@example.com",
+        password="Admin-Pass-2024!",  # noqa: S106
+        lazy_profile=True,
+    )
+
+    assert admin.is_superuser
+    assert admin.is_staff
+    assert not Profile.objects.filter(user=admin).exists()
+
+
+def test_bulk_create_reports_invalid_rows_with_207(admin_client: Client):
+    rows = [
+        {"email": "valid@example.com", "password": PASSWORD, "first_name": "Ada"},
+        {"email": "not-an-email", "password": PASSWORD},
+        {"email": "weak@example.com", "password": "123"},
+    ]
+
+    response = admin_client.post("/api/users/bulk/", {"users": rows}, format="json")
+
+    assert response.status_code == 207
+    body = response.json()  # type: ignore[attr-defined]
+    assert [row["email"] for row in body["created"]] == ["valid@example.com"]
+    assert [(error["index"], list(error["errors"])) for error in body["errors"]] == [(1, ["email"]), (2, ["password"])]
+    assert Profile.objects.get(user__email="valid@example.com").first_name == "Ada"
+
+
+def test_bulk_create_rejects_duplicates_within_the_batch():
+    rows = [{"email": "dup@example.com"}, {"email": "Dup@Example.com"}, {"email": "other@example.com"}]
+
+    created, errors = User.objects.bulk_create_users(rows)  # type: ignore[attr-defined]
+
+    assert [user.email for user in created] == ["dup@example.com", "other@example.com"]
+    assert list(errors) == [1]
+    assert list(errors[1]) == ["email"]
+
+
+def test_bulk_create_rejects_existing_emails_in_any_case():
+    User.objects.create_user(email="existing@example.com")  # type: ignore[attr-defined]
+
+    created, errors = User.objects.bulk_create_users(  # type: ignore[attr-defined]
+        [{"email": "Existing@Example.com"}, {"email": "new@example.com"}],
+    )
+
+    assert [user.email for user in created] == ["new@example.com"]
+    assert list(errors) == [0]
+    assert User.objects.filter(email__iexact="existing@example.com").count() == 1
+
+
+def test_bulk_create_retries_after_a_concurrent_insert(monkeypatch: pytest.MonkeyPatch):
+    original = UserManager._reject_existing_emails  # noqa: SLF001
+    calls: list[int] = []
+
+    def racing(self: UserManager, pending: dict[int, dict[str, Any]], errors: dict[int, Any]) -> None:
+        calls.append(len(pending))
+        if len(calls) == 3:
+            # A second writer wins during the retry's own pre-check
+            User.objects.create_user(email="LATE@example.com")  # type: ignore[attr-defined]
+        original(self, pending, errors)
+        if len(calls) == 1:
+            # Another request inserts one of the emails right after the first pre-check
+            User.objects.create_user(email="RACE@example.com")  # type: ignore[attr-defined]
+
+    monkeypatch.setattr(UserManager, "_reject_existing_emails", racing)
+    rows = [
+        {"email": "invalid"},
+        {"email": "kept@example.com"},
+        {"email": "race@example.com"},
+        {"email": "late@example.com"},
+    ]
+
+    created, errors = User.objects.bulk_create_users(rows)  # type: ignore[attr-defined]
+
+    assert [user.email for user in created] == ["kept@example.com"]
+    # Errors from the retried subset are reported under the caller's row indexes
+    assert list(errors) == [0, 2, 3]
+    assert calls == [3, 3, 2]
+    assert Profile.objects.filter(user__email="kept@example.com").exists()
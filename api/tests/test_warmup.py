@@ -0,0 +1,43 @@
+import logging
+import os
+import time
+from pathlib import Path
+
+import pytest
+from django.dispatch import Signal
+from pytest_django.fixtures import SettingsWrapper
+
+from src.shared.warmup import warmup
+
+# Far enough back that a report timed from the boot would be unmistakable
+BOOTED_AGO = 1000.0
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+def test_forked_worker_reports_from_its_fork(settings: SettingsWrapper, tmp_path: Path):
+    settings.WARMUP_ENABLED = False
+    first_signal = Signal()
+    warmup(time.monotonic() - BOOTED_AGO, steps=(), first_signal=first_signal)
+    report = tmp_path / "report.log"
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            handler = logging.FileHandler(report)
+            logger = logging.getLogger("src.shared.warmup")
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            first_signal.send(sender=None)
+            # Only the first request is reported
+            first_signal.send(sender=None)
+            handler.close()
+            code = 0
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    (line,) = report.read_text().splitlines()
+    elapsed = float(line.split("request ")[1].split("s ")[0])
+    assert elapsed < BOOTED_AGO